@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from core.bridge_lcc import BridgeLCC
+from core import lcc_kernel
 
 cost_bp = Blueprint("cost", __name__)
 
@@ -13,3 +14,31 @@ def calculate():
         return jsonify({"total_lcc": total_cost})
     except Exception as e:
         return jsonify({"error": str(e)}), 400
+
+@cost_bp.route("/calculate_batch", methods=["POST"])
+def calculate_batch():
+    """API endpoint for evaluating a columnar table of scenarios in one call."""
+    try:
+        data = request.json
+        if "designs" in data:
+            scenarios = BridgeLCC.scenario_grid(data["designs"], data["financial"])
+        else:
+            scenarios = data["scenarios"]
+        results = BridgeLCC.evaluate_batch(scenarios)
+        return jsonify({name: column.tolist() for name, column in results.items()})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@cost_bp.route("/calculate_heads", methods=["POST"])
+def calculate_heads():
+    """API endpoint returning every cost head for one or many scenarios of kernel inputs."""
+    try:
+        data = request.json
+        scenarios = data["inputs"]
+        if isinstance(scenarios, list):
+            heads = lcc_kernel.evaluate_many(scenarios)
+            return jsonify({name: values.tolist() for name, values in heads.items()})
+        heads = lcc_kernel.evaluate(scenarios)
+        return jsonify({name: float(value) for name, value in heads.items()})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
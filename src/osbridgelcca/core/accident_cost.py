@@ -0,0 +1,100 @@
+"""
+Accident costs of traffic diverted around a work zone.
+
+The number of accidents follows from the crash rate (accidents per million
+vehicle-km), the traffic and the additional distance travelled. Each
+accident is split over the injury categories and the vehicle categories
+involved by their shares, and every category carries a (WPI adjusted) unit
+cost. The unit cost x share products are built once per category set, so
+all categories are evaluated together in one broadcast product, for a single
+traffic value, one per year of a traffic projection or a batch of scenarios.
+Unit costs may also vary by year (e.g. escalated by a projected WPI).
+
+Example:
+    injuries = category_weights([46680.0, 432651.0, 1325049.0], [60.0, 20.0, 20.0])
+    damage = category_weights([3396.0, 9563.0, 9563.0], [50.0, 25.0, 25.0])
+    n = accidents(adt=[700.0, 735.0, 772.0], crash_rate=30.0, distance_km=6.0, days=312)
+    costs = accident_costs(n, injuries, damage)
+    costs["total"]      # one value per year
+"""
+import numpy as np
+
+# Crash rates are given per million vehicle-km
+CRASH_RATE_UNIT_KM = 1e6
+
+
+def accidents(adt, crash_rate, distance_km, days=1.0, work_zone_multiplier=1.0):
+    """
+    Expected number of accidents of the diverted traffic.
+
+    Args:
+        adt: Total daily traffic; scalar or array (e.g. one value per year)
+        crash_rate: Accidents per million vehicle-km
+        distance_km: Additional distance travelled per vehicle
+        days: Number of days the traffic is diverted
+        work_zone_multiplier: Increase of the crash rate in the work zone
+
+    Returns:
+        Accidents, in the shape of `adt`
+    """
+    adt = np.asarray(adt, dtype=float)
+    per_day = crash_rate * adt * work_zone_multiplier * distance_km / CRASH_RATE_UNIT_KM
+    return per_day * days
+
+
+def category_weights(unit_costs, shares):
+    """
+    Cost per accident attributed to each category.
+
+    Args:
+        unit_costs: Cost of one occurrence of each category, array
+            (categories,) or (years, categories)
+        shares: Occurrences of each category per accident, in the same order
+
+    Returns:
+        Array in the shape of unit_costs
+    """
+    unit_costs = np.asarray(unit_costs, dtype=float)
+    shares = np.asarray(shares, dtype=float)
+    if shares.ndim != 1 or unit_costs.ndim == 0 or unit_costs.shape[-1] != len(shares):
+        raise ValueError(f"unit_costs must end with one entry per share. "
+                         f"Provided: {unit_costs.shape} and {shares.shape}")
+    return unit_costs * shares
+
+
+def category_costs(accident_count, weights):
+    """
+    Cost of each category, array (..., categories).
+
+    Args:
+        accident_count: Accidents; scalar or array (...)
+        weights: category_weights, (categories,) or per year (..., categories)
+    """
+    return np.asarray(accident_count, dtype=float)[..., None] * np.asarray(weights, dtype=float)
+
+
+def accident_costs(accident_count, injury_weights, damage_weights):
+    """
+    Human injury and vehicle damage costs of a number of accidents.
+
+    Args:
+        accident_count: Accidents; scalar or array
+        injury_weights: category_weights of the injury categories
+        damage_weights: category_weights of the vehicle categories
+
+    Returns:
+        dict with 'human_injury' and 'vehicle_damage' per category
+        (..., categories) and their sums 'total_human_injury',
+        'total_vehicle_damage' and 'total' in the shape of accident_count
+    """
+    injury = category_costs(accident_count, injury_weights)
+    damage = category_costs(accident_count, damage_weights)
+    total_injury = injury.sum(axis=-1)
+    total_damage = damage.sum(axis=-1)
+    return {
+        "human_injury": injury,
+        "vehicle_damage": damage,
+        "total_human_injury": total_injury,
+        "total_vehicle_damage": total_damage,
+        "total": total_injury + total_damage,
+    }
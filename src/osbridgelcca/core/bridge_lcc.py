@@ -1,6 +1,11 @@
+import numpy as np
+
+from .present_worth import present_worth_factor
+
+
 class BridgeLCC:
     """Main class for handling Life Cycle Cost Analysis of bridges."""
-    
+
     def __init__(self, project_name, inputs):
         self.project_name = project_name
         self.inputs = inputs  # Dictionary of user inputs
@@ -21,6 +26,117 @@ class BridgeLCC:
         except KeyError as e:
             raise ValueError(f"Missing input parameter: {e}")
 
+    @staticmethod
+    def _check_lengths(columns):
+        """Raise ValueError naming the first column whose length differs from the others (scalars broadcast)."""
+        first = None
+        for name, column in columns.items():
+            column = np.asarray(column)
+            if column.ndim == 0:
+                continue
+            if first is None:
+                first = (name, len(column))
+            elif len(column) != first[1]:
+                raise ValueError(f"Column '{name}' has {len(column)} rows, expected {first[1]} "
+                                 f"as in column '{first[0]}'")
+
+    @staticmethod
+    def evaluate_batch(scenarios):
+        """
+        Evaluate many alternatives at once from a columnar table.
+
+        Args:
+            scenarios: Dictionary of equal-length columns (scalars broadcast):
+                bill_of_quantity: 2D array (scenarios x items), or a dictionary
+                    of item name -> column as in calculate_lcc
+                maintenance_cost, vehicle_operating_cost, discount_rate
+                design_life (optional): when given, maintenance and operating
+                    costs are annual amounts over years 1..design_life,
+                    escalated by inflation_rate (optional, default 0)
+
+        Returns:
+            Dictionary of columns: material_cost, recurring_cost, total_lcc.
+            Without design_life total_lcc equals calculate_lcc for every row:
+            the whole cost is discounted by one period. With design_life the
+            costs are placed in time instead: the material cost is paid in
+            year 0 (not discounted) and only the annual costs are discounted.
+
+        Raises:
+            ValueError: if an input is missing or columns differ in length
+        """
+        try:
+            boq = scenarios["bill_of_quantity"]
+            if isinstance(boq, dict):
+                columns = {f"bill_of_quantity[{item}]": column for item, column in boq.items()}
+            else:
+                # A 1D bill of quantities is the items of a single scenario
+                columns = {"bill_of_quantity": boq if np.ndim(boq) == 2 else 0.0}
+            columns.update({name: scenarios[name] for name in ("maintenance_cost", "vehicle_operating_cost",
+                                                               "discount_rate")})
+        except KeyError as e:
+            raise ValueError(f"Missing input parameter: {e}")
+        columns.update({name: scenarios[name] for name in ("design_life", "inflation_rate") if name in scenarios})
+        BridgeLCC._check_lengths(columns)
+
+        if isinstance(boq, dict):
+            boq = np.column_stack([np.asarray(column, dtype=float) for column in boq.values()])
+        material_cost = np.atleast_2d(np.asarray(boq, dtype=float)).sum(axis=1)
+        recurring_cost = (np.asarray(scenarios["maintenance_cost"], dtype=float)
+                          + np.asarray(scenarios["vehicle_operating_cost"], dtype=float))
+        discount_rate = np.asarray(scenarios["discount_rate"], dtype=float)
+
+        if "design_life" in scenarios:
+            inflation_rate = scenarios.get("inflation_rate", 0.0)
+            # Annual costs in years 1..design_life (horizon is exclusive)
+            pwf = present_worth_factor(inflation_rate, discount_rate, 1,
+                                       np.asarray(scenarios["design_life"], dtype=float) + 1)
+            material_cost, recurring_cost = np.broadcast_arrays(material_cost, recurring_cost * pwf)
+            total_cost = material_cost + recurring_cost
+        else:
+            material_cost, recurring_cost, discount_rate = np.broadcast_arrays(material_cost, recurring_cost,
+                                                                               discount_rate)
+            total_cost = (material_cost + recurring_cost) / (1 + discount_rate)
+
+        return {
+            "material_cost": material_cost,
+            "recurring_cost": recurring_cost,
+            "total_lcc": total_cost,
+        }
+
+    @staticmethod
+    def scenario_grid(designs, financial):
+        """
+        Cross every design alternative with every financial scenario.
+
+        Args:
+            designs: Columns describing the design alternatives (e.g.
+                bill_of_quantity as a 2D array, maintenance_cost, ...)
+            financial: Columns describing the financial scenarios (e.g.
+                discount_rate, design_life, inflation_rate)
+
+        Returns:
+            Columnar table with len(designs) * len(financial) rows, design-major,
+            ready for evaluate_batch
+        """
+        def as_columns(table):
+            columns = {}
+            for name, column in table.items():
+                if isinstance(column, dict):
+                    column = np.column_stack([np.asarray(item, dtype=float) for item in column.values()])
+                columns[name] = np.asarray(column, dtype=float)
+            rows = max((len(column) for column in columns.values() if column.ndim), default=1)
+            return {name: column if column.ndim else np.full(rows, column)
+                    for name, column in columns.items()}, rows
+
+        designs, n_designs = as_columns(designs)
+        financial, n_financial = as_columns(financial)
+
+        grid = {name: np.repeat(column, n_financial, axis=0) for name, column in designs.items()}
+        # Repeat whole rows, also of 2D columns
+        grid.update({name: np.tile(column, (n_designs,) + (1,) * (column.ndim - 1))
+                     for name, column in financial.items()})
+        return grid
+
     def get_outputs(self):
         """Return computed outputs."""
         return self.outputs
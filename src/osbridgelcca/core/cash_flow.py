@@ -0,0 +1,200 @@
+import numpy as np
+
+
+def event_schedule(frequency, horizon, years):
+    """
+    0/1 vector over years 0..years-1 marking a cost recurring every
+    `frequency` years, strictly after year 0 and strictly before `horizon`.
+
+    Matches the event years summed by present_worth_factor for whole-year
+    frequencies. A non-positive frequency gives no events.
+    """
+    t = np.arange(years)
+    if frequency is None or frequency <= 0:
+        return np.zeros(years)
+    return ((t > 0) & (t < horizon) & (t % frequency == 0)).astype(float)
+
+
+def one_time_schedule(year, years):
+    """0/1 vector with a single event in `year` (nothing if outside the timeline)."""
+    schedule = np.zeros(years)
+    if 0 <= year < years:
+        schedule[int(year)] = 1.0
+    return schedule
+
+
+class CashFlowTimeline:
+    """
+    Year-by-year cost matrix of a life cycle cost analysis.
+
+    Rows are years 0..analysis horizon, columns are cost heads. Every head is
+    an amount in today's money times an event schedule; `nominal` applies
+    inflation, `discounted` additionally discounts to year 0, so the column
+    sums of `discounted` are the present worth of each head.
+
+    Credit heads (e.g. recycling) are kept positive in their column and
+    subtracted from the net figures.
+
+    Example:
+        timeline = CashFlowTimeline(50, inflation_rate=0.0515, discount_rate=0.067)
+        timeline.add_one_time("Initial", 1e7, year=0)
+        timeline.add_recurring("Inspection", 1e4, frequency=1, horizon=50)
+        timeline.build()
+        timeline.totals()["Inspection"]
+    """
+
+    def __init__(self, years, inflation_rate, discount_rate):
+        """
+        Args:
+            years: Last year of the timeline (inclusive)
+            inflation_rate: Inflation rate i
+            discount_rate: Discount rate d
+        """
+        if years < 0:
+            raise ValueError("years must be non-negative")
+        self.years = np.arange(int(years) + 1)
+        self.inflation_rate = inflation_rate
+        self.discount_rate = discount_rate
+        self.heads = []
+        self.credits = set()
+        self._amounts = []
+        self._schedules = []
+        self.real = None
+        self.nominal = None
+        self.discounted = None
+
+    @classmethod
+    def from_matrix(cls, real, heads, inflation_rate, discount_rate, credits=()):
+        """Timeline from a (years x heads) matrix of amounts in today's money."""
+        real = np.asarray(real, dtype=float)
+        timeline = cls(real.shape[0] - 1, inflation_rate, discount_rate)
+        timeline.heads = list(heads)
+        timeline.credits = set(credits)
+        timeline._amounts = [1.0] * len(timeline.heads)
+        timeline._schedules = list(real.T)
+        return timeline.build()
+
+    def add_schedule(self, head, amount, schedule, credit=False):
+        """Add a head from an explicit 0/1 (or count) schedule over the years."""
+        schedule = np.asarray(schedule, dtype=float)
+        if schedule.shape != self.years.shape:
+            raise ValueError(f"Schedule of '{head}' must have {len(self.years)} entries")
+        self.heads.append(head)
+        self._amounts.append(float(amount or 0.0))
+        self._schedules.append(schedule)
+        if credit:
+            self.credits.add(head)
+        return self
+
+    def add_recurring(self, head, amount, frequency, horizon, credit=False):
+        """Add a cost of `amount` every `frequency` years before `horizon`."""
+        return self.add_schedule(head, amount, event_schedule(frequency, horizon, len(self.years)), credit)
+
+    def add_one_time(self, head, amount, year, credit=False):
+        """Add a single cost of `amount` in `year`."""
+        return self.add_schedule(head, amount, one_time_schedule(year, len(self.years)), credit)
+
+    def build(self):
+        """Allocate the real, nominal and discounted matrices (years x heads)."""
+        schedules = np.column_stack(self._schedules) if self._schedules else np.zeros((len(self.years), 0))
+        inflation = (1.0 + self.inflation_rate) ** self.years
+        discount = (1.0 + self.discount_rate) ** -self.years.astype(float)
+        self.real = schedules * np.asarray(self._amounts)
+        self.nominal = self.real * inflation[:, None]
+        self.discounted = self.nominal * discount[:, None]
+        return self
+
+    def _signs(self):
+        return np.array([-1.0 if head in self.credits else 1.0 for head in self.heads])
+
+    def _matrix(self, discounted):
+        if self.nominal is None:
+            self.build()
+        return self.discounted if discounted else self.nominal
+
+    def column(self, head, discounted=True):
+        """Yearly values of one head."""
+        return self._matrix(discounted)[:, self.heads.index(head)]
+
+    def totals(self, discounted=True):
+        """Sum over the years of every head, i.e. the scalar cost heads."""
+        return dict(zip(self.heads, self._matrix(discounted).sum(axis=0)))
+
+    def net(self, discounted=True):
+        """Net cost per year (credits subtracted)."""
+        return self._matrix(discounted) @ self._signs()
+
+    def total(self, discounted=True):
+        """Net life cycle cost."""
+        return float(self.net(discounted).sum())
+
+    def cumulative(self, discounted=True):
+        """Running net cost up to and including each year."""
+        return np.cumsum(self.net(discounted))
+
+    def peak_year(self, heads=None, discounted=False):
+        """
+        Year with the highest cost.
+
+        Args:
+            heads: Restrict to these heads, e.g. the maintenance heads. None uses the net cost.
+            discounted: Compare discounted instead of nominal values
+        """
+        if heads is None:
+            yearly = self.net(discounted)
+        else:
+            columns = [self.heads.index(head) for head in heads]
+            yearly = self._matrix(discounted)[:, columns].sum(axis=1)
+        return int(self.years[np.argmax(yearly)])
+
+
+RESIDUAL_VALUE = "Residual Value"
+
+
+def repeat_cycles(cycle, analysis_period, residual_heads=()):
+    """
+    Replay one life cycle over an analysis period as shifted copies.
+
+    A new cycle starts every L years (L = last year of `cycle`) for as long
+    as the start is before the analysis period. Copies overlap only at the
+    boundary year (end of life of one cycle, construction of the next).
+    Flows after the analysis period are dropped. A cycle cut off by the end
+    of the analysis is credited a straight-line residual value of its
+    `residual_heads` (e.g. the initial construction cost) at the final year.
+
+    Args:
+        cycle: Built CashFlowTimeline of one cycle, years 0..L, with the
+            end-of-life costs in year L
+        analysis_period: Last year of the analysis
+        residual_heads: Heads whose year-0 amount depreciates over the cycle
+
+    Returns:
+        Built CashFlowTimeline over years 0..analysis_period. It carries an
+        extra RESIDUAL_VALUE credit head when residual_heads are given.
+    """
+    if cycle.real is None:
+        cycle.build()
+    length = len(cycle.years) - 1
+    if length <= 0:
+        raise ValueError("A life cycle must span at least one year")
+    analysis_period = int(analysis_period)
+
+    starts = np.arange(0, max(analysis_period, 1), length)
+    positions = (starts[:, None] + cycle.years[None, :]).ravel()
+    blocks = np.broadcast_to(cycle.real, (len(starts),) + cycle.real.shape).reshape(-1, cycle.real.shape[1])
+    keep = positions <= analysis_period
+
+    heads = list(cycle.heads)
+    credits = set(cycle.credits)
+    real = np.zeros((analysis_period + 1, len(heads) + (1 if residual_heads else 0)))
+    np.add.at(real[:, :len(heads)], positions[keep], blocks[keep])
+
+    if residual_heads:
+        elapsed = analysis_period - starts[-1]
+        if elapsed < length:
+            capital = sum(cycle.real[0, heads.index(head)] for head in residual_heads)
+            real[analysis_period, -1] = capital * (1.0 - elapsed / length)
+        heads.append(RESIDUAL_VALUE)
+        credits.add(RESIDUAL_VALUE)
+
+    return CashFlowTimeline.from_matrix(real, heads, cycle.inflation_rate, cycle.discount_rate, credits)
@@ -0,0 +1,175 @@
+import numpy as np
+
+CATEGORIES = ("Economic", "Environmental", "Social")
+
+COMPONENT_DTYPE = np.dtype([
+    ("quantity", np.float64),
+    ("rate", np.float64),
+    ("category", np.int8),          # index into CATEGORIES
+    ("is_initial", np.bool_),
+    ("is_recurring", np.bool_),
+    ("pwf", np.float64),            # present worth factor
+])
+
+
+def _category_code(category):
+    try:
+        return CATEGORIES.index(category)
+    except ValueError:
+        raise ValueError(f"Unknown cost category '{category}'. Valid options: {CATEGORIES}")
+
+
+class ComponentView:
+    """
+    Lightweight view of one registry row.
+
+    Exposes the CostComponent attributes (amount, category, is_initial,
+    is_recurring, present_worth_factor, calculate_cost) without holding any
+    data of its own; writes go straight to the registry.
+    """
+    __slots__ = ("_registry", "_index")
+
+    def __init__(self, registry, index):
+        self._registry = registry
+        self._index = index
+
+    @property
+    def _row(self):
+        return self._registry.data[self._index]
+
+    @property
+    def quantity(self):
+        return float(self._row["quantity"])
+
+    @quantity.setter
+    def quantity(self, value):
+        self._registry.data["quantity"][self._index] = value
+
+    @property
+    def rate(self):
+        return float(self._row["rate"])
+
+    @rate.setter
+    def rate(self, value):
+        self._registry.data["rate"][self._index] = value
+
+    @property
+    def category(self):
+        return CATEGORIES[self._row["category"]]
+
+    @property
+    def is_initial(self):
+        return bool(self._row["is_initial"])
+
+    @property
+    def is_recurring(self):
+        return bool(self._row["is_recurring"])
+
+    @property
+    def present_worth_factor(self):
+        return float(self._row["pwf"])
+
+    @present_worth_factor.setter
+    def present_worth_factor(self, value):
+        self._registry.data["pwf"][self._index] = value
+
+    @property
+    def amount(self):
+        return self.quantity * self.rate
+
+    def calculate_cost(self):
+        return self.quantity * self.rate * self.present_worth_factor
+
+
+class CostRegistry:
+    """
+    Cost components stored as rows of one structured NumPy array.
+
+    Each row is quantity x rate discounted by its present worth factor, tagged
+    with a category and initial/recurring flags. Totals are single masked
+    reductions over the array instead of one object per line item.
+
+    Example:
+        registry = CostRegistry.from_columns(quantity=q, rate=r)
+        registry.total(is_initial=True)
+        registry[0].calculate_cost()
+    """
+
+    def __init__(self, capacity=64):
+        self._data = np.zeros(max(int(capacity), 1), dtype=COMPONENT_DTYPE)
+        self._size = 0
+
+    @classmethod
+    def from_columns(cls, quantity, rate, category="Economic", is_initial=True, is_recurring=False, pwf=1.0):
+        """Build a registry from equal-length columns; scalars broadcast."""
+        quantity, rate, pwf = np.broadcast_arrays(np.asarray(quantity, dtype=float),
+                                                  np.asarray(rate, dtype=float),
+                                                  np.asarray(pwf, dtype=float))
+        registry = cls(capacity=quantity.size)
+        registry.add_many(quantity, rate, category, is_initial, is_recurring, pwf)
+        return registry
+
+    @property
+    def data(self):
+        """The used rows of the structured array."""
+        return self._data[:self._size]
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if not -self._size <= index < self._size:
+            raise IndexError("cost component index out of range")
+        return ComponentView(self, index % self._size)
+
+    def __iter__(self):
+        return (ComponentView(self, index) for index in range(self._size))
+
+    def _reserve(self, extra):
+        needed = self._size + extra
+        if needed > len(self._data):
+            grown = np.zeros(max(needed, 2 * len(self._data)), dtype=COMPONENT_DTYPE)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+
+    def add(self, quantity, rate, category="Economic", is_initial=True, is_recurring=False, pwf=1.0):
+        """Append one component and return its view."""
+        self._reserve(1)
+        self._data[self._size] = (quantity, rate, _category_code(category), is_initial, is_recurring, pwf)
+        self._size += 1
+        return ComponentView(self, self._size - 1)
+
+    def add_many(self, quantity, rate, category="Economic", is_initial=True, is_recurring=False, pwf=1.0):
+        """Append a block of components from columns; scalars broadcast."""
+        quantity = np.atleast_1d(np.asarray(quantity, dtype=float))
+        count = quantity.size
+        self._reserve(count)
+        block = self._data[self._size:self._size + count]
+        block["quantity"] = quantity
+        block["rate"] = rate
+        block["category"] = _category_code(category)
+        block["is_initial"] = is_initial
+        block["is_recurring"] = is_recurring
+        block["pwf"] = pwf
+        self._size += count
+        return self
+
+    def costs(self):
+        """Discounted cost of every row."""
+        data = self.data
+        return data["quantity"] * data["rate"] * data["pwf"]
+
+    def mask(self, category=None, is_initial=None, is_recurring=None):
+        data = self.data
+        selected = np.ones(self._size, dtype=bool)
+        if category is not None:
+            selected &= data["category"] == _category_code(category)
+        if is_initial is not None:
+            selected &= data["is_initial"] == is_initial
+        if is_recurring is not None:
+            selected &= data["is_recurring"] == is_recurring
+        return selected
+
+    def total(self, category=None, is_initial=None, is_recurring=None):
+        """Sum of the discounted costs of the rows matching the filters."""
+        return float(self.costs()[self.mask(category, is_initial, is_recurring)].sum())
@@ -0,0 +1,221 @@
+"""
+Stateless life cycle cost kernel.
+
+Pure functions over plain dictionaries of numbers or NumPy arrays: no SQLite,
+no Qt, no printing. Every value in `inputs` may be a scalar or an array, and
+all heads broadcast, so the same call evaluates one project or a batch of
+sampled scenarios. The desktop DatabaseManager, the Monte Carlo engine and the
+backend build the inputs and call evaluate(). evaluate(..., heads=[...])
+computes only some heads from their own inputs (see HEAD_INPUTS), which is
+how the DatabaseManager refreshes a single head.
+"""
+import numpy as np
+
+from .present_worth import present_worth_factor, single_present_worth_factor
+
+# Default constants used by the IRC based analysis
+CONSTANTS = {
+    "co2_emission_per_km": 0.1213,
+    "working_days_in_month": 26,
+    "duration_major_repairs": 3,             # months
+    "duration_replacement": 2 / 26,          # months
+    "duration_demolition": 2,                # months
+}
+
+# Inputs of evaluate()
+INPUT_KEYS = (
+    # Financial
+    "inflation_rate", "discount_rate", "interest_rate", "investment_ratio",
+    "design_life", "construction_time", "analysis_period",
+    # Bill of quantities
+    "init_cost", "superstructure_cost", "recyclable_value",
+    # Carbon: carbon_quantity * scc * scc_conversion is the initial carbon cost,
+    # rerouting terms use scc as entered
+    "carbon_quantity", "scc", "scc_conversion",
+    # Traffic
+    "total_traffic", "rerouting_distance", "vot", "accident_cost",
+    # Maintenance (cost as a fraction of the base cost, frequency in years)
+    "routine_insp_cost", "routine_insp_freq", "periodic_maint_cost", "periodic_maint_freq",
+    "major_insp_cost", "major_insp_freq", "major_repair_cost", "major_repair_freq",
+    "replacement_freq",
+    # End of life
+    "demolition_cost",
+)
+
+# Optional inputs of evaluate() and their defaults. The traffic factors scale
+# the base year traffic of the rerouting heads to the projected traffic of
+# the construction period and of the repair and replacement events (see
+# core.traffic_projection); 1 means no traffic growth.
+OPTIONAL_INPUTS = {
+    "traffic_factor_construction": 1.0,
+    "traffic_factor_major_repair": 1.0,
+    "traffic_factor_replacement": 1.0,
+}
+
+# Result heads of evaluate(), in report order
+HEADS = (
+    "initial_construction", "initial_carbon_emission", "time_cost", "rerouting_carbon_initial",
+    "routine_inspection", "periodic_maintenance", "periodic_maintenance_carbon", "major_inspection",
+    "major_repair", "major_repair_carbon", "rerouting_carbon_major_repair", "bearing_joint_replacement",
+    "rerouting_carbon_replacement", "demolition_disposal", "demolition_disposal_carbon",
+    "demolition_disposal_rerouting_carbon", "recycling", "value_of_time", "accident",
+)
+
+# Heads subtracted from the total (salvage credits)
+CREDIT_HEADS = ("recycling",)
+
+# Heads charged with the carbon of rerouted traffic (use CONSTANTS["co2_emission_per_km"])
+REROUTING_HEADS = ("rerouting_carbon_initial", "rerouting_carbon_major_repair", "rerouting_carbon_replacement",
+                   "demolition_disposal_rerouting_carbon")
+
+_DISCOUNTING = ("inflation_rate", "discount_rate", "design_life")
+_END_OF_LIFE = ("inflation_rate", "discount_rate", "analysis_period")
+_CARBON = ("carbon_quantity", "scc", "scc_conversion")
+_REROUTING = ("total_traffic", "rerouting_distance", "scc")
+
+# Inputs (required or optional) each head is computed from
+HEAD_INPUTS = {
+    "initial_construction": ("init_cost",),
+    "initial_carbon_emission": _CARBON,
+    "time_cost": ("init_cost", "interest_rate", "construction_time", "investment_ratio"),
+    "rerouting_carbon_initial": _REROUTING + ("construction_time", "traffic_factor_construction"),
+    "routine_inspection": ("init_cost", "routine_insp_cost", "routine_insp_freq") + _DISCOUNTING,
+    "periodic_maintenance": ("init_cost", "periodic_maint_cost", "periodic_maint_freq") + _DISCOUNTING,
+    "periodic_maintenance_carbon": _CARBON + ("periodic_maint_cost", "periodic_maint_freq") + _DISCOUNTING,
+    "major_inspection": ("init_cost", "major_insp_cost", "major_insp_freq") + _DISCOUNTING,
+    "major_repair": ("init_cost", "major_repair_cost", "major_repair_freq") + _DISCOUNTING,
+    "major_repair_carbon": _CARBON + ("major_repair_cost", "major_repair_freq") + _DISCOUNTING,
+    "rerouting_carbon_major_repair": _REROUTING + ("major_repair_freq", "traffic_factor_major_repair") + _DISCOUNTING,
+    "bearing_joint_replacement": ("superstructure_cost", "major_insp_cost", "major_repair_freq") + _DISCOUNTING,
+    "rerouting_carbon_replacement": _REROUTING + ("replacement_freq", "traffic_factor_replacement") + _DISCOUNTING,
+    "demolition_disposal": ("init_cost", "demolition_cost") + _END_OF_LIFE,
+    "demolition_disposal_carbon": _CARBON + ("demolition_cost",) + _END_OF_LIFE,
+    "demolition_disposal_rerouting_carbon": ("init_cost", "rerouting_distance", "scc", "design_life") + _END_OF_LIFE,
+    "recycling": ("recyclable_value", "design_life") + _END_OF_LIFE,
+    "value_of_time": ("vot",),
+    "accident": ("accident_cost",),
+}
+
+
+def head_inputs(heads=None):
+    """Inputs of some heads (default all), in INPUT_KEYS then OPTIONAL_INPUTS order."""
+    if heads is None:
+        return INPUT_KEYS + tuple(OPTIONAL_INPUTS)
+    unknown = [name for name in heads if name not in HEAD_INPUTS]
+    if unknown:
+        raise ValueError(f"Unknown LCC head(s): {unknown}. Available: {list(HEADS)}")
+    used = {key for name in heads for key in HEAD_INPUTS[name]}
+    return tuple(key for key in INPUT_KEYS + tuple(OPTIONAL_INPUTS) if key in used)
+
+
+def missing_inputs(inputs, heads=None):
+    """Names of the required inputs (of some heads, default all) that are absent or None."""
+    return [key for key in head_inputs(heads) if key in INPUT_KEYS and inputs.get(key) is None]
+
+
+def _pwf(x, frequency):
+    return present_worth_factor(x["inflation_rate"], x["discount_rate"], frequency, x["design_life"])
+
+
+def _carbon_cost(x):
+    return x["carbon_quantity"] * x["scc"] * x["scc_conversion"]
+
+
+def _rerouting_unit(x, c):
+    """Rerouting carbon cost per vehicle and per month of closure"""
+    return c["working_days_in_month"] * x["scc"] * c["co2_emission_per_km"] * x["rerouting_distance"]
+
+
+def _end_of_life(x):
+    return single_present_worth_factor(x["inflation_rate"], x["discount_rate"], x["analysis_period"])
+
+
+# Present worth of each head from the merged inputs x and constants c
+_FORMULAS = {
+    "initial_construction": lambda x, c: x["init_cost"],
+    "initial_carbon_emission": lambda x, c: _carbon_cost(x),
+    "time_cost": lambda x, c: x["init_cost"] * x["interest_rate"] * x["construction_time"] * x["investment_ratio"],
+    "rerouting_carbon_initial": lambda x, c: (x["total_traffic"] * _rerouting_unit(x, c)
+                                              * x["traffic_factor_construction"] * x["construction_time"] * 12),
+    "routine_inspection": lambda x, c: x["init_cost"] * _pwf(x, x["routine_insp_freq"]) * x["routine_insp_cost"],
+    "periodic_maintenance": lambda x, c: (x["init_cost"] * _pwf(x, x["periodic_maint_freq"])
+                                          * x["periodic_maint_cost"]),
+    "periodic_maintenance_carbon": lambda x, c: (_carbon_cost(x) * _pwf(x, x["periodic_maint_freq"])
+                                                 * x["periodic_maint_cost"]),
+    "major_inspection": lambda x, c: x["init_cost"] * _pwf(x, x["major_insp_freq"]) * x["major_insp_cost"],
+    "major_repair": lambda x, c: x["init_cost"] * _pwf(x, x["major_repair_freq"]) * x["major_repair_cost"],
+    "major_repair_carbon": lambda x, c: (_carbon_cost(x) * _pwf(x, x["major_repair_freq"])
+                                         * x["major_repair_cost"]),
+    "rerouting_carbon_major_repair": lambda x, c: (x["total_traffic"] * _rerouting_unit(x, c)
+                                                   * x["traffic_factor_major_repair"] * c["duration_major_repairs"]
+                                                   * _pwf(x, x["major_repair_freq"])),
+    "bearing_joint_replacement": lambda x, c: (x["superstructure_cost"] * _pwf(x, x["major_repair_freq"])
+                                               * x["major_insp_cost"]),
+    "rerouting_carbon_replacement": lambda x, c: (x["total_traffic"] * _rerouting_unit(x, c)
+                                                  * x["traffic_factor_replacement"] * c["duration_replacement"]
+                                                  * _pwf(x, x["replacement_freq"])),
+    "demolition_disposal": lambda x, c: x["init_cost"] * _end_of_life(x) * x["demolition_cost"],
+    "demolition_disposal_carbon": lambda x, c: _carbon_cost(x) * _end_of_life(x) * x["demolition_cost"],
+    "demolition_disposal_rerouting_carbon": lambda x, c: (x["init_cost"] * _pwf(x, x["analysis_period"])
+                                                          * c["duration_demolition"] * _rerouting_unit(x, c)),
+    "recycling": lambda x, c: x["recyclable_value"] * _pwf(x, x["analysis_period"]),
+    "value_of_time": lambda x, c: x["vot"],
+    "accident": lambda x, c: x["accident_cost"],
+}
+
+
+def evaluate(inputs, constants=None, heads=None):
+    """
+    Evaluate the cost heads.
+
+    Args:
+        inputs: Mapping with the inputs of the heads (scalars or broadcastable
+            arrays): all INPUT_KEYS, or those of HEAD_INPUTS for `heads`, and
+            optionally any of OPTIONAL_INPUTS
+        constants: Overrides for CONSTANTS
+        heads: Names of the heads to evaluate, default all of HEADS
+
+    Returns:
+        Dictionary of head -> value (float or ndarray) for every requested
+        head, plus "total_lcc" (sum of the heads minus the credit heads) when
+        all heads are evaluated
+    """
+    missing = missing_inputs(inputs, heads)
+    if missing:
+        raise ValueError(f"Missing LCC input(s): {missing}")
+    c = {**CONSTANTS, **(constants or {})}
+    x = {**OPTIONAL_INPUTS, **{key: value for key, value in inputs.items() if value is not None}}
+
+    values = {name: _FORMULAS[name](x, c) for name in (HEADS if heads is None else heads)}
+    if heads is None:
+        values["total_lcc"] = total(values)
+    return values
+
+
+def total(heads):
+    """Net life cycle cost of a dictionary of heads (credits subtracted)."""
+    value = 0.0
+    for name in HEADS:
+        value = value - heads[name] if name in CREDIT_HEADS else value + heads[name]
+    return value
+
+
+def evaluate_many(inputs_list, constants=None):
+    """
+    Evaluate a list of scalar input dictionaries in one vectorized call.
+
+    Returns:
+        Dictionary of head -> ndarray with one entry per input dictionary
+    """
+    if not inputs_list:
+        return {name: np.zeros(0) for name in HEADS + ("total_lcc",)}
+    for index, item in enumerate(inputs_list):
+        missing = missing_inputs(item)
+        if missing:
+            raise ValueError(f"Missing LCC input(s) in scenario {index}: {missing}")
+    columns = {key: np.array([item.get(key) for item in inputs_list], dtype=float) for key in INPUT_KEYS}
+    for key, default in OPTIONAL_INPUTS.items():
+        if any(item.get(key) is not None for item in inputs_list):
+            columns[key] = np.array([default if item.get(key) is None else item.get(key)
+                                     for item in inputs_list], dtype=float)
+    return evaluate(columns, constants)
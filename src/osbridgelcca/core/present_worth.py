@@ -0,0 +1,55 @@
+import numpy as np
+
+
+def present_worth_factor(inflation_rate, discount_rate, frequency, design_life):
+    """
+    Present worth factor of a cost recurring every `frequency` years.
+
+    Closed-form equivalent of
+    sum(((1 + i) / (1 + d)) ** p for p in range(frequency, design_life, frequency)),
+    i.e. a geometric series over the event years frequency, 2*frequency, ...
+    strictly before design_life. All arguments broadcast against each other, so
+    a whole set of scenarios is evaluated in one call.
+
+    Args:
+        inflation_rate: Inflation rate(s) i
+        discount_rate: Discount rate(s) d
+        frequency: Interval(s) between events in years. Non-positive values
+            mean the activity never recurs and give a factor of 0.
+        design_life: Horizon(s) in years (exclusive)
+
+    Returns:
+        float for scalar inputs, otherwise an ndarray of factors
+    """
+    i = np.asarray(inflation_rate, dtype=float)
+    d = np.asarray(discount_rate, dtype=float)
+    f = np.asarray(frequency, dtype=float)
+    life = np.asarray(design_life, dtype=float)
+
+    valid = f > 0
+    safe_f = np.where(valid, f, 1.0)
+
+    # Number of events: k * f < life for k = 1, 2, ...
+    n = np.where(valid, np.maximum(np.ceil(life / safe_f) - 1.0, 0.0), 0.0)
+
+    # Common ratio of the series per event
+    q = ((1.0 + i) / (1.0 + d)) ** safe_f
+    with np.errstate(divide="ignore", invalid="ignore"):
+        series = q * (1.0 - q ** n) / (1.0 - q)
+    # q == 1 (inflation equals discount) degenerates to n equal terms
+    factor = np.where(np.isclose(q, 1.0), n, series)
+    factor = np.where(n > 0, factor, 0.0)
+
+    return factor.item() if factor.ndim == 0 else factor
+
+
+def single_present_worth_factor(inflation_rate, discount_rate, period):
+    """
+    Present worth factor of a one-time cost incurred `period` years from now,
+    ((1 + i) / (1 + d)) ** period, broadcast over array inputs.
+    """
+    i = np.asarray(inflation_rate, dtype=float)
+    d = np.asarray(discount_rate, dtype=float)
+    t = np.asarray(period, dtype=float)
+    factor = ((1.0 + i) / (1.0 + d)) ** t
+    return factor.item() if factor.ndim == 0 else factor
@@ -0,0 +1,122 @@
+"""
+Traffic growth projection.
+
+Average daily traffic (ADT) per vehicle class over the years of the analysis,
+growing at a compound annual rate and optionally saturating at the capacity
+of the road. Every function works on arrays of shape (years, classes), so the
+rerouting, value of time, accident and VOC calculations consume the whole
+projection in one vectorized step.
+
+Example:
+    adt = project_adt([100, 250, 40], years=50, growth_rate=0.05,
+                      capacity=15000, pcu=[0.75, 1.0, 2.2])
+    growth = growth_factors(adt)
+    period_mean(growth, 2.5)
+"""
+import numpy as np
+
+SATURATION_MODES = ("cap", "logistic")
+
+
+def project_adt(adt, years, growth_rate=0.0, capacity=None, pcu=None, saturation="cap"):
+    """
+    Projected ADT per year and vehicle class.
+
+    Without a capacity every class grows as adt * (1 + g) ** t. With a
+    capacity the PCU total of the road is limited and all classes are scaled
+    by the same factor, so the traffic mix is preserved:
+
+    - "cap": growth stops once the PCU total reaches the capacity
+    - "logistic": the PCU total follows a logistic curve approaching the
+      capacity, C * U / (C + U - U0) for the unconstrained total U
+
+    A base year traffic above the capacity is never reduced, only its growth
+    is suppressed.
+
+    Args:
+        adt: Base year (year 0) ADT per class
+        years: Last year of the projection (inclusive)
+        growth_rate: Annual growth rate, scalar or one per class
+        capacity: Capacity of the road in PCU/day; None for unbounded growth
+        pcu: Passenger car units per class, default 1
+        saturation: One of SATURATION_MODES
+
+    Returns:
+        Array (years + 1, classes)
+    """
+    if saturation not in SATURATION_MODES:
+        raise ValueError(f"Unknown saturation mode '{saturation}'. Valid options: {SATURATION_MODES}")
+    if years < 0:
+        raise ValueError("years must be non-negative")
+    adt = np.atleast_1d(np.asarray(adt, dtype=float))
+    rate = np.broadcast_to(np.asarray(growth_rate, dtype=float), adt.shape)
+    if (rate <= -1).any():
+        raise ValueError("growth_rate must be greater than -1")
+
+    t = np.arange(int(years) + 1, dtype=float)
+    projected = adt[None, :] * (1.0 + rate[None, :]) ** t[:, None]
+    if capacity is None:
+        return projected
+
+    weights = np.ones(adt.shape) if pcu is None else np.broadcast_to(np.asarray(pcu, dtype=float), adt.shape)
+    unconstrained = projected @ weights
+    base = unconstrained[0]
+    limit = max(float(capacity), base)
+    if saturation == "cap":
+        target = np.minimum(unconstrained, limit)
+    else:
+        with np.errstate(invalid="ignore"):
+            target = limit * unconstrained / (limit + unconstrained - base)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(unconstrained > 0, target / unconstrained, 1.0)
+    return projected * scale[:, None]
+
+
+def growth_factors(projected):
+    """
+    Total traffic of every year relative to year 0 (all ones when there is
+    no base year traffic).
+    """
+    totals = np.asarray(projected, dtype=float).sum(axis=-1)
+    if totals[0] <= 0:
+        return np.ones(totals.shape)
+    return totals / totals[0]
+
+
+def period_mean(values, duration):
+    """
+    Mean of yearly values over the first `duration` years, e.g. the average
+    traffic during construction. A fractional last year counts with its share.
+
+    Args:
+        values: Array (years, ...) with at least ceil(duration) rows
+        duration: Length of the period in years (> 0)
+    """
+    values = np.asarray(values, dtype=float)
+    if duration <= 0:
+        raise ValueError("duration must be positive")
+    count = int(np.ceil(duration))
+    if count > len(values):
+        raise ValueError(f"A period of {duration} years needs at least {count} projected years")
+    weights = np.ones(count)
+    weights[-1] = duration - (count - 1)
+    weights = weights.reshape((count,) + (1,) * (values.ndim - 1))
+    return (weights * values[:count]).sum(axis=0) / duration
+
+
+def discounted_mean(values, schedule, inflation_rate, discount_rate):
+    """
+    Mean of yearly values over the events of a schedule, weighted by the
+    present worth factor ((1 + i) / (1 + d)) ** t of each event year.
+
+    Multiplying a base year cost by this factor gives the same present worth
+    as charging every event with the traffic of its own year. Returns 1 when
+    the schedule has no events.
+    """
+    values = np.asarray(values, dtype=float)
+    schedule = np.asarray(schedule, dtype=float)
+    t = np.arange(len(schedule), dtype=float)
+    weights = schedule * ((1.0 + inflation_rate) / (1.0 + discount_rate)) ** t
+    if weights.sum() <= 0:
+        return 1.0
+    return float((weights * values[:len(schedule)]).sum() / weights.sum())
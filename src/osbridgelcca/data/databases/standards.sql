@@ -0,0 +1,572 @@
+-- Standards store: editions of the IRC SP-30 tables and their WPI year series.
+--
+-- Every table is stored in long form, one row per (row key, column key)
+-- value; positions keep the order of the printed table. Year indexed tables
+-- (the WPI series) use INTEGER row keys, so year ranges are index range
+-- scans. standards_store.build_store() compiles this script into a
+-- read-only SQLite file. A new edition or WPI year is added here with
+-- INSERTs only.
+
+CREATE TABLE editions (
+    edition TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    base_year INTEGER NOT NULL
+);
+
+CREATE TABLE standard_tables (
+    edition TEXT NOT NULL REFERENCES editions (edition),
+    name TEXT NOT NULL,
+    index_name TEXT NOT NULL,
+    PRIMARY KEY (edition, name)
+);
+
+CREATE TABLE standard_values (
+    edition TEXT NOT NULL,
+    name TEXT NOT NULL,
+    row_pos INTEGER NOT NULL,
+    row_key NOT NULL,
+    col_pos INTEGER NOT NULL,
+    col_key TEXT NOT NULL,
+    value REAL NOT NULL,
+    unit TEXT,
+    PRIMARY KEY (edition, name, row_key, col_key),
+    FOREIGN KEY (edition, name) REFERENCES standard_tables (edition, name)
+) WITHOUT ROWID;
+
+INSERT INTO editions VALUES ('IRC SP-30:2019', 'IRC SP-30:2019 Manual on Economic Evaluation of Highway Projects in India', 2019);
+
+-- Table 8: Accident Type Costs (Pg. 17)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'accident_type_costs', 'Category_of_Accident');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'accident_type_costs', 0, 'Fatal', 0, 'Economic_Cost_INR', 1325049.0, NULL),
+('IRC SP-30:2019', 'accident_type_costs', 1, 'Major Injury', 0, 'Economic_Cost_INR', 432651.0, NULL),
+('IRC SP-30:2019', 'accident_type_costs', 2, 'Minor Injury', 0, 'Economic_Cost_INR', 46680.0, NULL);
+
+-- Table 9: Vehicle Damage Costs (Pg. 18)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'vehicle_damage_costs', 'Type_of_Vehicle');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'vehicle_damage_costs', 0, 'Two Wheeler', 0, 'Economic_Cost_INR', 10194.0, NULL),
+('IRC SP-30:2019', 'vehicle_damage_costs', 1, 'Small Cars', 0, 'Economic_Cost_INR', 40088.0, NULL),
+('IRC SP-30:2019', 'vehicle_damage_costs', 2, 'Big Cars', 0, 'Economic_Cost_INR', 40088.0, NULL),
+('IRC SP-30:2019', 'vehicle_damage_costs', 3, 'Ordinary Buses', 0, 'Economic_Cost_INR', 116585.0, NULL),
+('IRC SP-30:2019', 'vehicle_damage_costs', 4, 'Deluxe Buses', 0, 'Economic_Cost_INR', 116585.0, NULL),
+('IRC SP-30:2019', 'vehicle_damage_costs', 5, 'LCV', 0, 'Economic_Cost_INR', 205483.0, NULL),
+('IRC SP-30:2019', 'vehicle_damage_costs', 6, 'MCV', 0, 'Economic_Cost_INR', 205483.0, NULL),
+('IRC SP-30:2019', 'vehicle_damage_costs', 7, 'HCV', 0, 'Economic_Cost_INR', 120494.0, NULL);
+
+-- Table 6: VOT of Passengers (Pg. 16)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'vot_of_passengers', 'Type_of_Vehicle');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 0, 'Single Lane Roads', 41.3, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 1, 'Intermediate Lane Roads', 41.3, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 2, 'Two Lane Roads', 60.1, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 3, 'Four Lane Divided Roads', 60.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 4, 'Six Lane Divided Roads', 60.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 5, 'Four Lane Divided Expressways', 60.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 6, 'Six Lane Divided Expressways', 60.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 7, 'Eight Lane Divided Urban Expressways', 60.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 0, 'Two Wheeler', 8, 'Occupancy', 1.71, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 0, 'Single Lane Roads', 98.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 1, 'Intermediate Lane Roads', 98.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 2, 'Two Lane Roads', 117.3, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 3, 'Four Lane Divided Roads', 178.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 4, 'Six Lane Divided Roads', 178.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 5, 'Four Lane Divided Expressways', 178.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 6, 'Six Lane Divided Expressways', 178.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 7, 'Eight Lane Divided Urban Expressways', 178.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 1, 'Small Cars', 8, 'Occupancy', 3.23, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 0, 'Single Lane Roads', 98.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 1, 'Intermediate Lane Roads', 98.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 2, 'Two Lane Roads', 117.3, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 3, 'Four Lane Divided Roads', 258.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 4, 'Six Lane Divided Roads', 258.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 5, 'Four Lane Divided Expressways', 258.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 6, 'Six Lane Divided Expressways', 258.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 7, 'Eight Lane Divided Urban Expressways', 258.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 2, 'Big Cars', 8, 'Occupancy', 4.28, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 0, 'Single Lane Roads', 27.2, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 1, 'Intermediate Lane Roads', 27.2, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 2, 'Two Lane Roads', 73.2, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 3, 'Four Lane Divided Roads', 73.2, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 4, 'Six Lane Divided Roads', 73.2, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 5, 'Four Lane Divided Expressways', 73.2, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 6, 'Six Lane Divided Expressways', 73.2, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 7, 'Eight Lane Divided Urban Expressways', 73.2, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 3, 'Ordinary Buses', 8, 'Occupancy', 30.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 0, 'Single Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 1, 'Intermediate Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 2, 'Two Lane Roads', 81.6, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 3, 'Four Lane Divided Roads', 109.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 4, 'Six Lane Divided Roads', 109.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 5, 'Four Lane Divided Expressways', 109.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 6, 'Six Lane Divided Expressways', 109.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 7, 'Eight Lane Divided Urban Expressways', 109.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 4, 'Deluxe Buses', 8, 'Occupancy', 40.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 0, 'Single Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 1, 'Intermediate Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 2, 'Two Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 3, 'Four Lane Divided Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 4, 'Six Lane Divided Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 5, 'Four Lane Divided Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 6, 'Six Lane Divided Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 7, 'Eight Lane Divided Urban Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 5, 'LCV', 8, 'Occupancy', 2.5, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 0, 'Single Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 1, 'Intermediate Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 2, 'Two Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 3, 'Four Lane Divided Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 4, 'Six Lane Divided Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 5, 'Four Lane Divided Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 6, 'Six Lane Divided Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 7, 'Eight Lane Divided Urban Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 6, 'MCV', 8, 'Occupancy', 2.0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 0, 'Single Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 1, 'Intermediate Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 2, 'Two Lane Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 3, 'Four Lane Divided Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 4, 'Six Lane Divided Roads', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 5, 'Four Lane Divided Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 6, 'Six Lane Divided Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 7, 'Eight Lane Divided Urban Expressways', 0, NULL),
+('IRC SP-30:2019', 'vot_of_passengers', 7, 'HCV', 8, 'Occupancy', 1.5, NULL);
+
+-- WPI: Medical Accessories for Human Injury Cost
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'wpi_medical_accessories', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'wpi_medical_accessories', 0, 2019, 0, 'Fatal', 132.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 0, 2019, 1, 'Major Injury', 132.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 0, 2019, 2, 'Minor Injury', 132.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 1, 2020, 0, 'Fatal', 135.8, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 1, 2020, 1, 'Major Injury', 135.8, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 1, 2020, 2, 'Minor Injury', 135.8, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 2, 2021, 0, 'Fatal', 139.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 2, 2021, 1, 'Major Injury', 139.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 2, 2021, 2, 'Minor Injury', 139.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 3, 2022, 0, 'Fatal', 140.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 3, 2022, 1, 'Major Injury', 140.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 3, 2022, 2, 'Minor Injury', 140.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 4, 2023, 0, 'Fatal', 142.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 4, 2023, 1, 'Major Injury', 142.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 4, 2023, 2, 'Minor Injury', 142.5, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 5, 2024, 0, 'Fatal', 144.0, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 5, 2024, 1, 'Major Injury', 144.0, NULL),
+('IRC SP-30:2019', 'wpi_medical_accessories', 5, 2024, 2, 'Minor Injury', 144.0, NULL);
+
+-- WPI: Travel Time (Table 6, Pg. 16)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'wpi_vot', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'wpi_vot', 0, 2019, 0, 'Small Cars', 121.2, NULL),
+('IRC SP-30:2019', 'wpi_vot', 0, 2019, 1, 'Big Cars', 121.2, NULL),
+('IRC SP-30:2019', 'wpi_vot', 0, 2019, 2, 'Two Wheeler', 121.2, NULL),
+('IRC SP-30:2019', 'wpi_vot', 0, 2019, 3, 'Ordinary Buses', 121.2, NULL),
+('IRC SP-30:2019', 'wpi_vot', 0, 2019, 4, 'Deluxe Buses', 121.2, NULL),
+('IRC SP-30:2019', 'wpi_vot', 0, 2019, 5, 'LCV', 121.2, NULL),
+('IRC SP-30:2019', 'wpi_vot', 0, 2019, 6, 'HCV', 121.2, NULL),
+('IRC SP-30:2019', 'wpi_vot', 0, 2019, 7, 'MCV', 121.2, NULL),
+('IRC SP-30:2019', 'wpi_vot', 1, 2020, 0, 'Small Cars', 121.8, NULL),
+('IRC SP-30:2019', 'wpi_vot', 1, 2020, 1, 'Big Cars', 121.8, NULL),
+('IRC SP-30:2019', 'wpi_vot', 1, 2020, 2, 'Two Wheeler', 121.8, NULL),
+('IRC SP-30:2019', 'wpi_vot', 1, 2020, 3, 'Ordinary Buses', 121.8, NULL),
+('IRC SP-30:2019', 'wpi_vot', 1, 2020, 4, 'Deluxe Buses', 121.8, NULL),
+('IRC SP-30:2019', 'wpi_vot', 1, 2020, 5, 'LCV', 121.8, NULL),
+('IRC SP-30:2019', 'wpi_vot', 1, 2020, 6, 'HCV', 121.8, NULL),
+('IRC SP-30:2019', 'wpi_vot', 1, 2020, 7, 'MCV', 121.8, NULL),
+('IRC SP-30:2019', 'wpi_vot', 2, 2021, 0, 'Small Cars', 135.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 2, 2021, 1, 'Big Cars', 135.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 2, 2021, 2, 'Two Wheeler', 135.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 2, 2021, 3, 'Ordinary Buses', 135.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 2, 2021, 4, 'Deluxe Buses', 135.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 2, 2021, 5, 'LCV', 135.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 2, 2021, 6, 'HCV', 135.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 2, 2021, 7, 'MCV', 135.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 3, 2022, 0, 'Small Cars', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 3, 2022, 1, 'Big Cars', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 3, 2022, 2, 'Two Wheeler', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 3, 2022, 3, 'Ordinary Buses', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 3, 2022, 4, 'Deluxe Buses', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 3, 2022, 5, 'LCV', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 3, 2022, 6, 'HCV', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 3, 2022, 7, 'MCV', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 4, 2023, 0, 'Small Cars', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 4, 2023, 1, 'Big Cars', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 4, 2023, 2, 'Two Wheeler', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 4, 2023, 3, 'Ordinary Buses', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 4, 2023, 4, 'Deluxe Buses', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 4, 2023, 5, 'LCV', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 4, 2023, 6, 'HCV', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 4, 2023, 7, 'MCV', 151.3, NULL),
+('IRC SP-30:2019', 'wpi_vot', 5, 2024, 0, 'Small Cars', 154.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 5, 2024, 1, 'Big Cars', 154.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 5, 2024, 2, 'Two Wheeler', 154.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 5, 2024, 3, 'Ordinary Buses', 154.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 5, 2024, 4, 'Deluxe Buses', 154.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 5, 2024, 5, 'LCV', 154.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 5, 2024, 6, 'HCV', 154.0, NULL),
+('IRC SP-30:2019', 'wpi_vot', 5, 2024, 7, 'MCV', 154.0, NULL);
+
+-- WPI: Property Damage (Manufacture of parts and accessories for motor vehicles)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'wpi_property_damage', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'wpi_property_damage', 0, 2019, 0, 'Small Cars', 113.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 0, 2019, 1, 'Big Cars', 113.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 0, 2019, 2, 'Two Wheeler', 113.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 0, 2019, 3, 'Ordinary Buses', 113.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 0, 2019, 4, 'Deluxe Buses', 113.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 0, 2019, 5, 'LCV', 113.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 0, 2019, 6, 'HCV', 113.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 0, 2019, 7, 'MCV', 113.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 1, 2020, 0, 'Small Cars', 115.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 1, 2020, 1, 'Big Cars', 115.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 1, 2020, 2, 'Two Wheeler', 115.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 1, 2020, 3, 'Ordinary Buses', 115.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 1, 2020, 4, 'Deluxe Buses', 115.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 1, 2020, 5, 'LCV', 115.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 1, 2020, 6, 'HCV', 115.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 1, 2020, 7, 'MCV', 115.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 2, 2021, 0, 'Small Cars', 120.6, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 2, 2021, 1, 'Big Cars', 120.6, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 2, 2021, 2, 'Two Wheeler', 120.6, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 2, 2021, 3, 'Ordinary Buses', 120.6, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 2, 2021, 4, 'Deluxe Buses', 120.6, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 2, 2021, 5, 'LCV', 120.6, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 2, 2021, 6, 'HCV', 120.6, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 2, 2021, 7, 'MCV', 120.6, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 3, 2022, 0, 'Small Cars', 128.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 3, 2022, 1, 'Big Cars', 128.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 3, 2022, 2, 'Two Wheeler', 128.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 3, 2022, 3, 'Ordinary Buses', 128.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 3, 2022, 4, 'Deluxe Buses', 128.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 3, 2022, 5, 'LCV', 128.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 3, 2022, 6, 'HCV', 128.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 3, 2022, 7, 'MCV', 128.5, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 4, 2023, 0, 'Small Cars', 128.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 4, 2023, 1, 'Big Cars', 128.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 4, 2023, 2, 'Two Wheeler', 128.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 4, 2023, 3, 'Ordinary Buses', 128.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 4, 2023, 4, 'Deluxe Buses', 128.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 4, 2023, 5, 'LCV', 128.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 4, 2023, 6, 'HCV', 128.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 4, 2023, 7, 'MCV', 128.2, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 5, 2024, 0, 'Small Cars', 129.0, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 5, 2024, 1, 'Big Cars', 129.0, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 5, 2024, 2, 'Two Wheeler', 129.0, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 5, 2024, 3, 'Ordinary Buses', 129.0, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 5, 2024, 4, 'Deluxe Buses', 129.0, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 5, 2024, 5, 'LCV', 129.0, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 5, 2024, 6, 'HCV', 129.0, NULL),
+('IRC SP-30:2019', 'wpi_property_damage', 5, 2024, 7, 'MCV', 129.0, NULL);
+
+-- WPI: VOC: Fuel Costs (Engine Oil, Other Oil, Grease)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'voc_fuel_costs', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'voc_fuel_costs', 0, 2019, 0, 'Petrol', 85.4, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 0, 2019, 1, 'Diesel', 94.4, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 0, 2019, 2, 'Engine Oil', 131.2, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 0, 2019, 3, 'Other Oil', 92.5, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 0, 2019, 4, 'Grease', 92.5, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 1, 2020, 0, 'Petrol', 74.2, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 1, 2020, 1, 'Diesel', 79.4, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 1, 2020, 2, 'Engine Oil', 134.0, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 1, 2020, 3, 'Other Oil', 78.1, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 1, 2020, 4, 'Grease', 78.1, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 2, 2021, 0, 'Petrol', 109.9, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 2, 2021, 1, 'Diesel', 114.7, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 2, 2021, 2, 'Engine Oil', 157.8, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 2, 2021, 3, 'Other Oil', 113.8, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 2, 2021, 4, 'Grease', 113.8, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 3, 2022, 0, 'Petrol', 159.8, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 3, 2022, 1, 'Diesel', 183.5, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 3, 2022, 2, 'Engine Oil', 174.7, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 3, 2022, 3, 'Other Oil', 168.2, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 3, 2022, 4, 'Grease', 168.2, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 4, 2023, 0, 'Petrol', 158.9, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 4, 2023, 1, 'Diesel', 174.2, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 4, 2023, 2, 'Engine Oil', 188.0, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 4, 2023, 3, 'Other Oil', 160.1, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 4, 2023, 4, 'Grease', 160.1, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 5, 2024, 0, 'Petrol', 154.3, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 5, 2024, 1, 'Diesel', 167.4, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 5, 2024, 2, 'Engine Oil', 190.2, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 5, 2024, 3, 'Other Oil', 156.8, NULL),
+('IRC SP-30:2019', 'voc_fuel_costs', 5, 2024, 4, 'Grease', 156.8, NULL);
+
+-- WPI: Tyre Cost (for each vehicle)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'tyre_costs', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'tyre_costs', 0, 2019, 0, 'Small Cars', 99.2, NULL),
+('IRC SP-30:2019', 'tyre_costs', 0, 2019, 1, 'Big Cars', 99.2, NULL),
+('IRC SP-30:2019', 'tyre_costs', 0, 2019, 2, 'Two Wheeler', 104.0, NULL),
+('IRC SP-30:2019', 'tyre_costs', 0, 2019, 3, 'Ordinary Buses', 97.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 0, 2019, 4, 'Deluxe Buses', 97.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 0, 2019, 5, 'LCV', 97.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 0, 2019, 6, 'HCV', 97.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 0, 2019, 7, 'MCV', 97.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 1, 2020, 0, 'Small Cars', 98.7, NULL),
+('IRC SP-30:2019', 'tyre_costs', 1, 2020, 1, 'Big Cars', 98.7, NULL),
+('IRC SP-30:2019', 'tyre_costs', 1, 2020, 2, 'Two Wheeler', 102.0, NULL),
+('IRC SP-30:2019', 'tyre_costs', 1, 2020, 3, 'Ordinary Buses', 96.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 1, 2020, 4, 'Deluxe Buses', 96.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 1, 2020, 5, 'LCV', 96.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 1, 2020, 6, 'HCV', 96.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 1, 2020, 7, 'MCV', 96.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 2, 2021, 0, 'Small Cars', 102.8, NULL),
+('IRC SP-30:2019', 'tyre_costs', 2, 2021, 1, 'Big Cars', 102.8, NULL),
+('IRC SP-30:2019', 'tyre_costs', 2, 2021, 2, 'Two Wheeler', 105.9, NULL),
+('IRC SP-30:2019', 'tyre_costs', 2, 2021, 3, 'Ordinary Buses', 103.2, NULL),
+('IRC SP-30:2019', 'tyre_costs', 2, 2021, 4, 'Deluxe Buses', 103.2, NULL),
+('IRC SP-30:2019', 'tyre_costs', 2, 2021, 5, 'LCV', 103.2, NULL),
+('IRC SP-30:2019', 'tyre_costs', 2, 2021, 6, 'HCV', 103.2, NULL),
+('IRC SP-30:2019', 'tyre_costs', 2, 2021, 7, 'MCV', 103.2, NULL),
+('IRC SP-30:2019', 'tyre_costs', 3, 2022, 0, 'Small Cars', 109.9, NULL),
+('IRC SP-30:2019', 'tyre_costs', 3, 2022, 1, 'Big Cars', 109.9, NULL),
+('IRC SP-30:2019', 'tyre_costs', 3, 2022, 2, 'Two Wheeler', 116.4, NULL),
+('IRC SP-30:2019', 'tyre_costs', 3, 2022, 3, 'Ordinary Buses', 110.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 3, 2022, 4, 'Deluxe Buses', 110.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 3, 2022, 5, 'LCV', 110.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 3, 2022, 6, 'HCV', 110.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 3, 2022, 7, 'MCV', 110.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 4, 2023, 0, 'Small Cars', 111.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 4, 2023, 1, 'Big Cars', 111.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 4, 2023, 2, 'Two Wheeler', 119.8, NULL),
+('IRC SP-30:2019', 'tyre_costs', 4, 2023, 3, 'Ordinary Buses', 114.4, NULL),
+('IRC SP-30:2019', 'tyre_costs', 4, 2023, 4, 'Deluxe Buses', 114.4, NULL),
+('IRC SP-30:2019', 'tyre_costs', 4, 2023, 5, 'LCV', 114.4, NULL),
+('IRC SP-30:2019', 'tyre_costs', 4, 2023, 6, 'HCV', 114.4, NULL),
+('IRC SP-30:2019', 'tyre_costs', 4, 2023, 7, 'MCV', 114.4, NULL),
+('IRC SP-30:2019', 'tyre_costs', 5, 2024, 0, 'Small Cars', 111.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 5, 2024, 1, 'Big Cars', 111.5, NULL),
+('IRC SP-30:2019', 'tyre_costs', 5, 2024, 2, 'Two Wheeler', 117.9, NULL),
+('IRC SP-30:2019', 'tyre_costs', 5, 2024, 3, 'Ordinary Buses', 114.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 5, 2024, 4, 'Deluxe Buses', 114.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 5, 2024, 5, 'LCV', 114.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 5, 2024, 6, 'HCV', 114.1, NULL),
+('IRC SP-30:2019', 'tyre_costs', 5, 2024, 7, 'MCV', 114.1, NULL);
+
+-- WPI: Spare Parts: New Price (Manufacture of parts and accessories for motor vehicles)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'spare_parts_costs', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'spare_parts_costs', 0, 2019, 0, 'Small Cars', 113.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 0, 2019, 1, 'Big Cars', 113.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 0, 2019, 2, 'Two Wheeler', 113.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 0, 2019, 3, 'Ordinary Buses', 113.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 0, 2019, 4, 'Deluxe Buses', 113.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 0, 2019, 5, 'LCV', 113.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 0, 2019, 6, 'HCV', 113.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 0, 2019, 7, 'MCV', 113.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 1, 2020, 0, 'Small Cars', 115.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 1, 2020, 1, 'Big Cars', 115.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 1, 2020, 2, 'Two Wheeler', 115.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 1, 2020, 3, 'Ordinary Buses', 115.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 1, 2020, 4, 'Deluxe Buses', 115.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 1, 2020, 5, 'LCV', 115.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 1, 2020, 6, 'HCV', 115.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 1, 2020, 7, 'MCV', 115.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 2, 2021, 0, 'Small Cars', 120.6, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 2, 2021, 1, 'Big Cars', 120.6, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 2, 2021, 2, 'Two Wheeler', 120.6, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 2, 2021, 3, 'Ordinary Buses', 120.6, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 2, 2021, 4, 'Deluxe Buses', 120.6, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 2, 2021, 5, 'LCV', 120.6, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 2, 2021, 6, 'HCV', 120.6, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 2, 2021, 7, 'MCV', 120.6, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 3, 2022, 0, 'Small Cars', 128.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 3, 2022, 1, 'Big Cars', 128.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 3, 2022, 2, 'Two Wheeler', 128.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 3, 2022, 3, 'Ordinary Buses', 128.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 3, 2022, 4, 'Deluxe Buses', 128.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 3, 2022, 5, 'LCV', 128.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 3, 2022, 6, 'HCV', 128.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 3, 2022, 7, 'MCV', 128.5, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 4, 2023, 0, 'Small Cars', 128.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 4, 2023, 1, 'Big Cars', 128.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 4, 2023, 2, 'Two Wheeler', 128.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 4, 2023, 3, 'Ordinary Buses', 128.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 4, 2023, 4, 'Deluxe Buses', 128.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 4, 2023, 5, 'LCV', 128.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 4, 2023, 6, 'HCV', 128.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 4, 2023, 7, 'MCV', 128.2, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 5, 2024, 0, 'Small Cars', 129.0, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 5, 2024, 1, 'Big Cars', 129.0, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 5, 2024, 2, 'Two Wheeler', 129.0, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 5, 2024, 3, 'Ordinary Buses', 129.0, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 5, 2024, 4, 'Deluxe Buses', 129.0, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 5, 2024, 5, 'LCV', 129.0, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 5, 2024, 6, 'HCV', 129.0, NULL),
+('IRC SP-30:2019', 'spare_parts_costs', 5, 2024, 7, 'MCV', 129.0, NULL);
+
+-- WPI: Fixed and Depreciation Costs: Manufacture of motor vehicles, trailers and semi-trailers
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'fixed_depreciation_costs', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'fixed_depreciation_costs', 0, 2019, 0, 'Small Cars', 113.8, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 0, 2019, 1, 'Big Cars', 113.8, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 0, 2019, 2, 'Two Wheeler', 113.8, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 0, 2019, 3, 'Ordinary Buses', 113.8, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 0, 2019, 4, 'Deluxe Buses', 113.8, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 0, 2019, 5, 'LCV', 113.8, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 0, 2019, 6, 'HCV', 113.8, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 0, 2019, 7, 'MCV', 113.8, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 1, 2020, 0, 'Small Cars', 116.9, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 1, 2020, 1, 'Big Cars', 116.9, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 1, 2020, 2, 'Two Wheeler', 116.9, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 1, 2020, 3, 'Ordinary Buses', 116.9, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 1, 2020, 4, 'Deluxe Buses', 116.9, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 1, 2020, 5, 'LCV', 116.9, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 1, 2020, 6, 'HCV', 116.9, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 1, 2020, 7, 'MCV', 116.9, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 2, 2021, 0, 'Small Cars', 121.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 2, 2021, 1, 'Big Cars', 121.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 2, 2021, 2, 'Two Wheeler', 121.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 2, 2021, 3, 'Ordinary Buses', 121.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 2, 2021, 4, 'Deluxe Buses', 121.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 2, 2021, 5, 'LCV', 121.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 2, 2021, 6, 'HCV', 121.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 2, 2021, 7, 'MCV', 121.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 3, 2022, 0, 'Small Cars', 127.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 3, 2022, 1, 'Big Cars', 127.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 3, 2022, 2, 'Two Wheeler', 127.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 3, 2022, 3, 'Ordinary Buses', 127.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 3, 2022, 4, 'Deluxe Buses', 127.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 3, 2022, 5, 'LCV', 127.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 3, 2022, 6, 'HCV', 127.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 3, 2022, 7, 'MCV', 127.1, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 4, 2023, 0, 'Small Cars', 128.0, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 4, 2023, 1, 'Big Cars', 128.0, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 4, 2023, 2, 'Two Wheeler', 128.0, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 4, 2023, 3, 'Ordinary Buses', 128.0, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 4, 2023, 4, 'Deluxe Buses', 128.0, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 4, 2023, 5, 'LCV', 128.0, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 4, 2023, 6, 'HCV', 128.0, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 4, 2023, 7, 'MCV', 128.0, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 5, 2024, 0, 'Small Cars', 129.6, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 5, 2024, 1, 'Big Cars', 129.6, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 5, 2024, 2, 'Two Wheeler', 129.6, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 5, 2024, 3, 'Ordinary Buses', 129.6, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 5, 2024, 4, 'Deluxe Buses', 129.6, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 5, 2024, 5, 'LCV', 129.6, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 5, 2024, 6, 'HCV', 129.6, NULL),
+('IRC SP-30:2019', 'fixed_depreciation_costs', 5, 2024, 7, 'MCV', 129.6, NULL);
+
+-- WPI: Commodity Holding Cost: Fuel & Power
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'commodity_holding_cost', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'commodity_holding_cost', 0, 2019, 0, 'Small Cars', 101.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 0, 2019, 1, 'Big Cars', 101.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 0, 2019, 2, 'Two Wheeler', 101.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 0, 2019, 3, 'Ordinary Buses', 101.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 0, 2019, 4, 'Deluxe Buses', 101.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 0, 2019, 5, 'LCV', 101.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 0, 2019, 6, 'HCV', 101.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 0, 2019, 7, 'MCV', 101.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 1, 2020, 0, 'Small Cars', 93.3, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 1, 2020, 1, 'Big Cars', 93.3, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 1, 2020, 2, 'Two Wheeler', 93.3, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 1, 2020, 3, 'Ordinary Buses', 93.3, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 1, 2020, 4, 'Deluxe Buses', 93.3, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 1, 2020, 5, 'LCV', 93.3, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 1, 2020, 6, 'HCV', 93.3, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 1, 2020, 7, 'MCV', 93.3, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 2, 2021, 0, 'Small Cars', 116.1, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 2, 2021, 1, 'Big Cars', 116.1, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 2, 2021, 2, 'Two Wheeler', 116.1, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 2, 2021, 3, 'Ordinary Buses', 116.1, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 2, 2021, 4, 'Deluxe Buses', 116.1, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 2, 2021, 5, 'LCV', 116.1, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 2, 2021, 6, 'HCV', 116.1, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 2, 2021, 7, 'MCV', 116.1, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 3, 2022, 0, 'Small Cars', 155.2, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 3, 2022, 1, 'Big Cars', 155.2, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 3, 2022, 2, 'Two Wheeler', 155.2, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 3, 2022, 3, 'Ordinary Buses', 155.2, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 3, 2022, 4, 'Deluxe Buses', 155.2, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 3, 2022, 5, 'LCV', 155.2, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 3, 2022, 6, 'HCV', 155.2, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 3, 2022, 7, 'MCV', 155.2, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 4, 2023, 0, 'Small Cars', 152.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 4, 2023, 1, 'Big Cars', 152.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 4, 2023, 2, 'Two Wheeler', 152.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 4, 2023, 3, 'Ordinary Buses', 152.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 4, 2023, 4, 'Deluxe Buses', 152.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 4, 2023, 5, 'LCV', 152.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 4, 2023, 6, 'HCV', 152.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 4, 2023, 7, 'MCV', 152.7, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 5, 2024, 0, 'Small Cars', 150.4, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 5, 2024, 1, 'Big Cars', 150.4, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 5, 2024, 2, 'Two Wheeler', 150.4, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 5, 2024, 3, 'Ordinary Buses', 150.4, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 5, 2024, 4, 'Deluxe Buses', 150.4, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 5, 2024, 5, 'LCV', 150.4, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 5, 2024, 6, 'HCV', 150.4, NULL),
+('IRC SP-30:2019', 'commodity_holding_cost', 5, 2024, 7, 'MCV', 150.4, NULL);
+
+-- WPI: Passenger and Crew Costs
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'passenger_crew_costs', 'Year');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'passenger_crew_costs', 0, 2019, 0, 'Passenger Cost', 138.58, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 0, 2019, 1, 'Crew Cost', 118.07, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 1, 2020, 0, 'Passenger Cost', 147.91, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 1, 2020, 1, 'Crew Cost', 131.77, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 2, 2021, 0, 'Passenger Cost', 155.33, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 2, 2021, 1, 'Crew Cost', 145.91, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 3, 2022, 0, 'Passenger Cost', 166.94, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 3, 2022, 1, 'Crew Cost', 159.05, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 4, 2023, 0, 'Passenger Cost', 176.38, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 4, 2023, 1, 'Crew Cost', 160.28, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 5, 2024, 0, 'Passenger Cost', 184.27, NULL),
+('IRC SP-30:2019', 'passenger_crew_costs', 5, 2024, 1, 'Crew Cost', 164.18, NULL);
+
+-- Table C.1: Current Vehicle Operating Cost Inputs, new vehicle price (Rs)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'vehicle_costs', 'vehicle_type');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'vehicle_costs', 0, 'two_wheelers', 0, 'ET', 34209, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 0, 'two_wheelers', 1, 'IT', 61235, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 1, 'small_cars', 0, 'ET', 273728, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 1, 'small_cars', 1, 'IT', 489972, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 2, 'big_cars', 0, 'ET', 558599, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 2, 'big_cars', 1, 'IT', 999892, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 3, 'buses', 0, 'ET', 1647150, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 3, 'buses', 1, 'IT', 2948400, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 4, 'lcv', 0, 'ET', 449721, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 4, 'lcv', 1, 'IT', 805000, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 5, 'hcv', 0, 'ET', 940531, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 5, 'hcv', 1, 'IT', 1683550, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 6, 'mcv', 0, 'ET', 1415350, NULL),
+('IRC SP-30:2019', 'vehicle_costs', 6, 'mcv', 1, 'IT', 1415350, NULL);
+
+-- Table C.1: Petroleum products
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'petroleum_products_costs', 'product');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'petroleum_products_costs', 0, 'petrol', 0, 'ET', 33.58, 'Rs/l'),
+('IRC SP-30:2019', 'petroleum_products_costs', 0, 'petrol', 1, 'IT', 79.92, 'Rs/l'),
+('IRC SP-30:2019', 'petroleum_products_costs', 1, 'diesel', 0, 'ET', 30.51, 'Rs/l'),
+('IRC SP-30:2019', 'petroleum_products_costs', 1, 'diesel', 1, 'IT', 72.61, 'Rs/l'),
+('IRC SP-30:2019', 'petroleum_products_costs', 2, 'engine_oil', 0, 'ET', 187.96, 'Rs/l'),
+('IRC SP-30:2019', 'petroleum_products_costs', 2, 'engine_oil', 1, 'IT', 384.39, 'Rs/l'),
+('IRC SP-30:2019', 'petroleum_products_costs', 3, 'other_oil', 0, 'ET', 167.7, 'Rs/l'),
+('IRC SP-30:2019', 'petroleum_products_costs', 3, 'other_oil', 1, 'IT', 338.78, 'Rs/l'),
+('IRC SP-30:2019', 'petroleum_products_costs', 4, 'grease', 0, 'ET', 183.7, 'Rs/kg'),
+('IRC SP-30:2019', 'petroleum_products_costs', 4, 'grease', 1, 'IT', 390.9, 'Rs/kg');
+
+-- Table C.1: New tyres (num_of_wheels from the "Steel - reconstruction, inflation included" sheets)
+INSERT INTO standard_tables VALUES ('IRC SP-30:2019', 'new_tyres_costs', 'vehicle_type');
+INSERT INTO standard_values VALUES
+('IRC SP-30:2019', 'new_tyres_costs', 0, 'two_wheelers', 0, 'ET', 1355, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 0, 'two_wheelers', 1, 'IT', 1668, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 0, 'two_wheelers', 2, 'num_of_wheels', 2, NULL),
+('IRC SP-30:2019', 'new_tyres_costs', 1, 'big_cars', 0, 'ET', 2940, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 1, 'big_cars', 1, 'IT', 4456, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 1, 'big_cars', 2, 'num_of_wheels', 4, NULL),
+('IRC SP-30:2019', 'new_tyres_costs', 2, 'small_cars', 0, 'ET', 2940, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 2, 'small_cars', 1, 'IT', 4456, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 2, 'small_cars', 2, 'num_of_wheels', 4, NULL),
+('IRC SP-30:2019', 'new_tyres_costs', 3, 'buses', 0, 'ET', 13475, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 3, 'buses', 1, 'IT', 17500, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 3, 'buses', 2, 'num_of_wheels', 6, NULL),
+('IRC SP-30:2019', 'new_tyres_costs', 4, 'lcv', 0, 'ET', 5420, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 4, 'lcv', 1, 'IT', 8900, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 4, 'lcv', 2, 'num_of_wheels', 6, NULL),
+('IRC SP-30:2019', 'new_tyres_costs', 5, 'hcv', 0, 'ET', 13890, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 5, 'hcv', 1, 'IT', 20000, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 5, 'hcv', 2, 'num_of_wheels', 10, NULL),
+('IRC SP-30:2019', 'new_tyres_costs', 6, 'mcv', 0, 'ET', 13890, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 6, 'mcv', 1, 'IT', 20000, 'Rs/unit'),
+('IRC SP-30:2019', 'new_tyres_costs', 6, 'mcv', 2, 'num_of_wheels', 14, NULL);
@@ -539,6 +539,10 @@ class HomeWindow(QMainWindow):
                     if not creator: print(" - Creator widget (ProjectDetailsWidget) not found.")
                     if not receiver: print(" - Receiver widget (Foundation) not found.")
 
+            def closeEvent(self, event):
+                self.ui.shutdown()
+                super().closeEvent(event)
+
         app = QApplication.instance()
         app.home_window.close()
         app.main_window = LCCA()
@@ -33,6 +33,7 @@ from osbridgelcca.desktop_app.widgets.recyclable import RecyclableWidget
 from osbridgelcca.desktop_app.widgets.tab_widget import CustomTabWidget
 from osbridgelcca.desktop_app.widgets.utils.data import *
 from osbridgelcca.desktop_app.widgets.utils.database import DatabaseManager
+from osbridgelcca.desktop_app.widgets.utils.road_user_worker import RoadUserCostRunner
 from osbridgelcca.desktop_app.resources.resources_rc import *
 
 import pandas as pd
@@ -519,6 +520,9 @@ class UiMainWindow(object):
         self.cleanup_temp_db()
 
         self.database_manager = DatabaseManager()
+        # Road user costs (VOT, accidents, rerouting VOC) are computed off the UI thread
+        self.road_user_runner = RoadUserCostRunner(self.database_manager)
+        self.road_user_results = {}
         self.tabs_active = False
         self.active_tab_widgets = {}
         
@@ -720,6 +724,10 @@ class UiMainWindow(object):
         button_layout.addWidget(self.tutorial_tab)
         button_layout.addStretch()
 
+        # Progress of the background road user cost computation
+        self.road_user_status = QLabel("")
+        button_layout.addWidget(self.road_user_status)
+
         content_layout.addLayout(button_layout)
 
         body_widget = QWidget()
@@ -745,6 +753,31 @@ class UiMainWindow(object):
         self.tutorial_tab.clicked.connect(self.show_tutorial_widget)
         self.project_details_tab.clicked.connect(lambda: self.show_project_detail_widgets())
 
+        self.road_user_runner.progress.connect(self.show_road_user_progress)
+        self.road_user_runner.resultReady.connect(self.show_road_user_results)
+        self.road_user_runner.errorOccurred.connect(self.show_road_user_error)
+
+    # --- Background road user costs ---
+    def show_road_user_progress(self, percent, head):
+        self.road_user_status.setText(f"Road user costs: {percent}% ({head})")
+        self.road_user_status.setToolTip("")
+
+    def show_road_user_results(self, results):
+        self.road_user_results.update(results)
+        if COST_TOTAL_ROAD_USER in results:
+            self.road_user_status.setText(f"Road user cost: {results[COST_TOTAL_ROAD_USER]:,.2f}")
+        if hasattr(self.current_right_widget, 'update_road_user_costs'):
+            self.current_right_widget.update_road_user_costs(self.road_user_results)
+
+    def show_road_user_error(self, message):
+        print(f"[ROAD USER COST] ❌ {message}")
+        self.road_user_status.setText("Road user costs: failed")
+        self.road_user_status.setToolTip(message)
+
+    def shutdown(self):
+        """Stop the background workers; called when the main window closes."""
+        self.road_user_runner.shutdown()
+
     # --- NEW: Calculation & Locking Logic ---
     def calculate_and_lock_construction_data(self):
         """Calculates total costs, prints to terminal, shows alert, and locks data."""
@@ -912,6 +945,8 @@ class UiMainWindow(object):
         self.current_right_widget = ResultsWidget()
         self.right_panel_placeholder.layout().addWidget(self.current_right_widget)
         self.current_right_widget.closed.connect(self.remove_right_widget)
+        if self.road_user_results:
+            self.current_right_widget.update_road_user_costs(self.road_user_results)
 
     def show_comparison_widget(self):
         if self.current_right_widget:
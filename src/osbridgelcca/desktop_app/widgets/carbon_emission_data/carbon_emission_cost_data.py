@@ -407,8 +407,8 @@ class CarbonEmissionCostData(QWidget):
         # Save UI Data to Backend
         self.database_manager.carbon_emission_cost_data = data
 
-        # Carbon Emission Cost
-        # self.database_manager.carbon_emission_cost()
+        # Carbon Emission Cost and the heads depending on SCC
+        self.database_manager.refresh()
 
     def close_widget(self):
         self.closed.emit()
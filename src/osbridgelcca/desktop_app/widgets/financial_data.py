@@ -347,5 +347,5 @@ class FinancialData(QWidget):
         # Save UI Data to Backend
         self.database_manager.financial_data = data
 
-        # calculate Time Cost
-        self.database_manager.calculate_time_cost()
+        # Recalculate the cost heads depending on financial data
+        self.database_manager.refresh()
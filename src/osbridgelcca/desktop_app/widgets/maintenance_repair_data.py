@@ -578,15 +578,8 @@ class MaintenanceRepairData(QWidget):
 
             # Save UI Data to Backend - Existing calculations
             self.database_manager.maintainance_and_repair_data = data
-            self.database_manager.routine_inspection_cost() 
-            self.database_manager.periodic_maintainance_cost()
-            self.database_manager.periodic_maintainance_carbon_emission_cost()
-            self.database_manager.major_inspection_cost()
-            self.database_manager.major_repair_cost()
-            self.database_manager.major_repair_related_carbon_emission_cost()
-            self.database_manager.bearing_expansion_joint_replacement_cost()
-            self.database_manager.carbon_emission_rerouting_during_major_repairs()
-            self.database_manager.carbon_emission_rerouting_during_replacement()
+            # Only the heads reading a changed field are recalculated
+            self.database_manager.refresh()
 
         else:
             # Collecting Data from Global View
@@ -275,6 +275,12 @@ class ResultsWidget(QWidget):
         self.welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         content_layout.addWidget(self.welcome_label)
 
+        # Road user costs, filled in by the background worker (see update_road_user_costs)
+        self.road_user_label = QLabel("")
+        self.road_user_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.road_user_label.setVisible(False)
+        content_layout.addWidget(self.road_user_label)
+
         # Container with three closable cards (initially hidden)
         self.cards_container = QWidget()
         self.cards_container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
@@ -396,6 +402,12 @@ class ResultsWidget(QWidget):
         self.closed.emit()
         self.setParent(None)
 
+    def update_road_user_costs(self, results):
+        """Show the road user cost heads delivered by RoadUserCostRunner.resultReady"""
+        lines = [f"{head}: {value:,.2f}" for head, value in results.items() if value is not None]
+        self.road_user_label.setText("\n".join(lines))
+        self.road_user_label.setVisible(bool(lines))
+
     def _build_radial_bar_html(self, percentages):
         # Stage labels and color palette copied from the original script
         stage_label = ['Initial Stage', 'Use Stage', 'End of Life Stage', 'Beyond Life Stage']
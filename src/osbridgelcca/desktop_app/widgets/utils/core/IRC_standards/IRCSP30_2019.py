@@ -1,84 +1,45 @@
 # IRC SP-30:2019, Table C.1 Current Vehicle Operating Cost Inputs
+#
+# The values are read from the standards store (data/databases/standards.sql);
+# this module only keeps the dictionary layout used by the vehicle models and
+# the post processor. table_c1 gives the tables of another edition.
 
-vehicle_costs = {
-    "two_wheelers": {"ET": 34209, "IT": 61235},
-    "small_cars": {"ET": 273728, "IT": 489972},
-    "big_cars": {"ET": 558599, "IT": 999892},
-    "buses": {"ET": 1647150, "IT": 2948400},
-    "lcv": {"ET": 449721, "IT": 805000},
-    "hcv": {"ET": 940531, "IT": 1683550},
-    "mcv": {"ET": 1415350, "IT": 1415350},
-}
+from osbridgelcca.desktop_app.widgets.utils.standards_store import DEFAULT_EDITION, default_store
 
-petroleum_products_costs = {
-    "petrol": {
-        "ET": 33.58,
-        "IT": 79.92,
-        "units": "Rs/l"
-    },
-    "diesel": {
-        "ET": 30.51,
-        "IT": 72.61,
-        "units": "Rs/l"
-    },
-    "engine_oil": {
-        "ET": 187.96,
-        "IT": 384.39,
-        "units": "Rs/l"
-    },
-    "other_oil": {
-        "ET": 167.70,
-        "IT": 338.78,
-        "units": "Rs/l"
-    },
-    "grease": {
-        "ET": 183.70,
-        "IT": 390.90,
-        "units": "Rs/kg"
-    }
-}
+TABLE_C1_NAMES = ("vehicle_costs", "petroleum_products_costs", "new_tyres_costs")
 
-new_tyres_costs = {
-    "two_wheelers": {
-        "ET": 1355,
-        "IT": 1668,
-        "units": "Rs/unit",
-        "num_of_wheels": 2  # Source "Steel - reconstruction, inflation included" sheets
-    },
-    "big_cars": {
-        "ET": 2940,
-        "IT": 4456,
-        "units": "Rs/unit",
-        "num_of_wheels": 4  # Source "Steel - reconstruction, inflation included" sheets
-    },
-    "small_cars": {
-        "ET": 2940,
-        "IT": 4456,
-        "units": "Rs/unit",
-        "num_of_wheels": 4  # Source "Steel - reconstruction, inflation included" sheets
-    },
-    "buses": {
-        "ET": 13475,
-        "IT": 17500,
-        "units": "Rs/unit",
-        "num_of_wheels": 6  # Source "Steel - reconstruction, inflation included" sheets
-    },
-    "lcv": {
-        "ET": 5420,
-        "IT": 8900,
-        "units": "Rs/unit",
-        "num_of_wheels": 6  # Source "Steel - reconstruction, inflation included" sheets
-    },
-    "hcv": {
-        "ET": 13890,
-        "IT": 20000,
-        "units": "Rs/unit",
-        "num_of_wheels": 10  # Source "Steel - reconstruction, inflation included" sheets
-    },
-    "mcv": {
-        "ET": 13890,
-        "IT": 20000,
-        "units": "Rs/unit",
-        "num_of_wheels": 14  # Source "Steel - reconstruction, inflation included" sheets
-    }
-}
+# Columns holding counts rather than costs
+_INTEGER_COLUMNS = ("num_of_wheels",)
+
+
+def _table_dict(store, edition, name):
+    table = store.table(edition, name)
+    units = store.units(edition, name)
+    entries = {}
+    for row in table.rows:
+        entry = {column: table.get(row, column) for column in table.columns if column not in _INTEGER_COLUMNS}
+        if row in units:
+            entry["units"] = units[row]
+        for column in _INTEGER_COLUMNS:
+            if column in table.column_index:
+                entry[column] = int(table.get(row, column))
+        entries[row] = entry
+    return entries
+
+
+def table_c1(edition=DEFAULT_EDITION, store=None):
+    """
+    Table C.1 of an edition as {table name: {row: {column: value, "units": unit}}}.
+
+    Args:
+        edition: Edition in the store
+        store: StandardsStore, default the shared store
+    """
+    store = default_store() if store is None else store
+    return {name: _table_dict(store, edition, name) for name in TABLE_C1_NAMES}
+
+
+_tables = table_c1()
+vehicle_costs = _tables["vehicle_costs"]
+petroleum_products_costs = _tables["petroleum_products_costs"]
+new_tyres_costs = _tables["new_tyres_costs"]
@@ -1,7 +1,24 @@
+import os
+import threading
+
+import numpy as np
+
 from osbridgelcca.desktop_app.widgets.utils.core.voc import core
 from osbridgelcca.desktop_app.widgets.utils.core.voc.congestion import core as congestion_core
+from osbridgelcca.desktop_app.widgets.utils.core.voc.lookup_grid import VOCGrid
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.constants import vehicle_type_list
+from osbridgelcca.desktop_app.widgets.utils.core.voc_cache import VOCCache, fingerprint
+from osbridgelcca.desktop_app.widgets.utils.standards_store import user_cache_dir
+
+# Shared cache of calc_voc results (memory only)
+voc_cache = VOCCache(maxsize=128)
+
+# Axes of the shared VOC lookup grids (see voc_grid)
+GRID_ROUGHNESS = np.arange(1500, 8001, 100)
+GRID_RISE_FALL = np.arange(0, 61, 5)
+_voc_grids = {}
+_voc_grids_lock = threading.Lock()
 
-vc = 0.8854
 wpi = {'year': 2024,
        'WPI': {
            'fuelCost': {
@@ -106,11 +123,116 @@ vehicle_input = {
     }
 }
 
+def voc_grid(all_wpi: dict, pwr) -> VOCGrid:
+    """
+    Shared per-km VOC lookup grid of a WPI dictionary and power to weight
+    ratio over GRID_ROUGHNESS x GRID_RISE_FALL. Built once into the user cache
+    directory and kept in memory for the life of the process.
+    """
+    key = fingerprint({"power_weight_ratio_pwr": pwr}, all_wpi)
+    with _voc_grids_lock:
+        if key not in _voc_grids:
+            path = os.path.join(user_cache_dir(), f"voc_grid-{key[:16]}.npz")
+            _voc_grids[key] = VOCGrid.load_or_build(path, [all_wpi], GRID_ROUGHNESS, GRID_RISE_FALL, pwr=pwr)
+        return _voc_grids[key]
+
+
+def _grid_costs(grid: VOCGrid, checked_input: dict, all_wpi: dict):
+    """
+    Per-km 'distanceCost' and 'timeCost' of core.main looked up in `grid`,
+    or None when the grid does not cover the road, the WPI year or the
+    power to weight ratio of the inputs.
+    """
+    rg = checked_input["rg_roughness_factor"]
+    rf = checked_input["rs_rise_factor"] + checked_input["fl_fall_factor"]
+    lane_type = checked_input["lane_type"]
+    # Like core.main, only the vehicle types with traffic
+    vehicles = [vt for vt in vehicle_type_list if (checked_input["vehicle_info"].get(vt) or 0) > 0]
+    covered = (lane_type in grid.lanes
+               and set(vehicles) <= set(grid.vehicles)
+               # The MCV model rejects single and intermediate lanes; core.main reports it
+               and not ("mcv" in vehicles and lane_type in ("SL", "IL"))
+               and (lane_type != "EW" or grid.meta.get("expressway_width") == checked_input["carriageway_width"])
+               and all_wpi["year"] in grid.years
+               and grid.meta.get("pwr") == checked_input.get("power_weight_ratio_pwr")
+               and np.isclose(checked_input["rs_rise_factor"], grid.meta.get("rise_share", 0.5) * rf)
+               and grid.roughness[0] <= rg <= grid.roughness[-1]
+               and grid.rise_fall[0] <= rf <= grid.rise_fall[-1])
+    if not covered:
+        return None
+    return {f"{kind}Cost": {vt: {basis: grid.lookup(vt, lane_type, all_wpi["year"], rg, rf,
+                                                    basis=basis, component=kind)
+                                 for basis in ("IT", "ET")}
+                            for vt in vehicles}
+            for kind in ("distance", "time")}
+
+
 def calc_voc(inputs: dict,
              all_wpi: dict,
-             vehicle_cost: float) -> dict:
+             vc: float = None,
+             cache: VOCCache = voc_cache) -> dict:
     """
+    VOC of the traffic in `inputs` with the congestion factors applied.
+
+    vc is the volume to capacity ratio; None derives the daily v/c from the
+    traffic (PCU) and the capacity of the lane type.
+    cache memoizes the result by the fingerprint of the inputs, WPI and vc;
+    None always recomputes.
+
     return calculate_total_adjusted_costs
     """
-    val = core.main(inputs, all_wpi)
-    return congestion_core.calculate_total_adjusted_costs(val, vehicle_cost, vehicle_input)
\ No newline at end of file
+    if cache is not None:
+        key = fingerprint(inputs, all_wpi, vc)
+        result = cache.get(key)
+        if result is None:
+            result = calc_voc(inputs, all_wpi, vc, cache=None)
+            cache.put(key, result)
+        return result
+
+    checked_input = core.validated_copy(inputs)
+    val = core.main(checked_input, all_wpi)
+    if vc is None:
+        vc = float(congestion_core.volume_capacity_ratio(checked_input["vehicle_info"],
+                                                         checked_input["lane_type"]).mean())
+    return congestion_core.calculate_total_adjusted_costs(val, vc, checked_input)
+
+
+def calc_annual_voc(inputs: dict,
+                    all_wpi: dict,
+                    years: int = 1,
+                    capacity: float = None,
+                    cache: VOCCache = voc_cache,
+                    grid: VOCGrid = None) -> dict:
+    """
+    Yearly VOC of the traffic in `inputs` with the congestion factors of
+    every hour of every day applied (see congestion_core.annual_adjusted_costs).
+
+    The traffic of a vehicle type in inputs["vehicle_info"] is a number or one
+    value per year (e.g. a traffic projection); the road conditions are
+    validated with the traffic of the first year.
+    capacity is the capacity of the road in PCU/day; None uses the capacity of
+    the lane type.
+    cache memoizes the result like calc_voc; None always recomputes.
+    grid serves the per-km VOC of the uncongested road from a VOCGrid (see
+    voc_grid) when it covers the inputs, instead of running the VOC models.
+
+    return dict with 'distance_total', 'time_total' and 'total', each
+    {'IT', 'ET'} lists of `years` values in Rs/km/year
+    """
+    if cache is not None:
+        key = fingerprint(inputs, all_wpi, years=int(years), capacity=capacity, grid=grid is not None)
+        result = cache.get(key)
+        if result is None:
+            result = calc_annual_voc(inputs, all_wpi, years, capacity, cache=None, grid=grid)
+            cache.put(key, result)
+        return result
+
+    first_year = {vt: float(np.atleast_1d(count)[0]) for vt, count in inputs["vehicle_info"].items()}
+    checked_input = core.validated_copy({**inputs, "vehicle_info": first_year})
+    annual_input = {**checked_input, "vehicle_info": inputs["vehicle_info"]}
+    val = None if grid is None else _grid_costs(grid, checked_input, all_wpi)
+    if val is None:
+        val = core.main(checked_input, all_wpi)
+    annual = congestion_core.annual_adjusted_costs(val, annual_input, years=years, capacity=capacity)
+    return {key: value if key == "unit" else {basis: np.asarray(costs).tolist() for basis, costs in value.items()}
+            for key, value in annual.items()}
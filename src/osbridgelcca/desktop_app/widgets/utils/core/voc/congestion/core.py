@@ -1,5 +1,10 @@
-import voc.congestion.formulas as cf
-import voc.congestion.input_validation as validate
+import numpy as np
+
+from osbridgelcca.desktop_app.widgets.utils.core.voc.congestion import formulas as cf
+from osbridgelcca.desktop_app.widgets.utils.core.voc.congestion import input_validation as validate
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.constants import hourly_traffic_share, lane_capacity_pcu_per_day, pcu, vehicle_type_list
+
+DAYS_IN_YEAR = 365
 
 def calculate_total_adjusted_costs(a, vc, vehicle_input, debug=False):
     """
@@ -100,3 +105,113 @@ def calculate_total_adjusted_costs(a, vc, vehicle_input, debug=False):
         result["breakdown"] = breakdown
 
     return result
+
+
+def traffic_profile(years=1, growth_rate=0.0, hourly_share=None, daily_factor=None):
+    """
+    Multiplier of the average daily traffic per (analysis year, day, hour).
+
+    The traffic of hour h is ADT * share[h], growing by growth_rate per year
+    (compound) and scaled by daily_factor for each day of the year (e.g.
+    weekends, seasons).
+
+    Returns:
+        Array (years, 365, 24)
+    """
+    share = np.asarray(hourly_traffic_share if hourly_share is None else hourly_share, dtype=float)
+    if share.shape != (24,) or share.sum() <= 0:
+        raise ValueError("hourly_share must have 24 non-negative entries with a positive sum.")
+    share = share / share.sum()
+    days = np.ones(DAYS_IN_YEAR) if daily_factor is None else np.asarray(daily_factor, dtype=float)
+    if days.shape != (DAYS_IN_YEAR,):
+        raise ValueError(f"daily_factor must have {DAYS_IN_YEAR} entries.")
+    growth = (1 + growth_rate) ** np.arange(int(years))
+    return growth[:, None, None] * days[None, :, None] * share[None, None, :]
+
+
+def yearly_counts(vehicle_info, vehicles, years=1, growth_rate=0.0):
+    """
+    Daily traffic per (analysis year, vehicle type).
+
+    A scalar count grows by growth_rate per year (compound); a sequence of
+    `years` counts is taken as the projected traffic of each year as is (e.g.
+    from osbridgelcca.core.traffic_projection.project_adt).
+
+    Returns:
+    Array (years, len(vehicles))
+    """
+    growth = (1 + growth_rate) ** np.arange(int(years))
+    counts = np.empty((int(years), len(vehicles)))
+    for v, vt in enumerate(vehicles):
+        count = np.asarray(vehicle_info.get(vt, 0), dtype=float)
+        if count.ndim == 0:
+            counts[:, v] = count * growth
+        elif count.shape == (int(years),):
+            counts[:, v] = count
+        else:
+            raise ValueError(f"Traffic of '{vt}' must be a number or {int(years)} yearly values. Provided shape: {count.shape}")
+    return counts
+
+
+def volume_capacity_ratio(vehicle_info, lane_type, years=1, growth_rate=0.0, hourly_share=None,
+                          daily_factor=None, capacity=None):
+    """
+    Hourly volume to capacity ratio over the analysis years.
+
+    Parameters:
+    vehicle_info (dict): Average daily traffic per vehicle type, a number or
+        one value per analysis year (see yearly_counts).
+    lane_type (str): Lane type; its capacity (PCU/day) is taken from
+        lane_capacity_pcu_per_day unless `capacity` is given.
+    years, growth_rate, hourly_share, daily_factor: See traffic_profile.
+
+    Returns:
+    Array (years, 365, 24). With the default uniform days its daily mean is ADT (PCU) / capacity.
+    """
+    if capacity is None:
+        capacity = lane_capacity_pcu_per_day.get(lane_type)
+        if capacity is None:
+            raise ValueError(f"'lane_type' must be one of {list(lane_capacity_pcu_per_day)}. Provided: {lane_type}")
+    vehicles = list(vehicle_info)
+    pcu_per_day = yearly_counts(vehicle_info, vehicles, years, growth_rate) @ np.array([pcu.get(vt, 1) for vt in vehicles])
+    # Hourly flow against the hourly capacity (capacity / 24)
+    return pcu_per_day[:, None, None] * 24 * traffic_profile(1, 0.0, hourly_share, daily_factor) / capacity
+
+
+def annual_adjusted_costs(a, vehicle_input, years=1, growth_rate=0.0, hourly_share=None,
+                          daily_factor=None, capacity=None):
+    """
+    Yearly congestion adjusted road user cost per km of road.
+
+    Same as calculate_total_adjusted_costs, but the congestion factors are
+    evaluated for every hour of every day of every analysis year from the
+    hourly v/c ratio instead of one v/c for the whole period.
+
+    Parameters:
+    a (dict): Base cost data containing 'distanceCost' and 'timeCost' (per vehicle-km).
+    vehicle_input (dict): Vehicle input with 'vehicle_info' (ADT, a number or yearly
+        values per vehicle type) and 'lane_type'.
+    years, growth_rate, hourly_share, daily_factor, capacity: See volume_capacity_ratio.
+
+    Returns:
+    dict with 'distance_total', 'time_total' and 'total', each {'IT', 'ET'} arrays of length `years` in Rs/km/year.
+    """
+    lane_type = vehicle_input["lane_type"]
+    vehicle_info = vehicle_input["vehicle_info"]
+    profile = traffic_profile(1, 0.0, hourly_share, daily_factor)[0]
+    vc = volume_capacity_ratio(vehicle_info, lane_type, years, growth_rate, hourly_share, daily_factor, capacity)
+
+    vehicles = [vt for vt in vehicle_type_list if vt in a["distanceCost"] and vt in a["timeCost"]]
+    columns = [vehicle_type_list.index(vt) for vt in vehicles]
+    counts = yearly_counts(vehicle_info, vehicles, years, growth_rate)
+
+    result = {"unit": "Rs/km/year"}
+    for key, kind, coefficients in (("distance_total", "distanceCost", cf.DISTANCE_COEFFICIENTS),
+                                    ("time_total", "timeCost", cf.TIME_COEFFICIENTS)):
+        factors = cf.congestion_factors(lane_type, vc, coefficients)[..., columns]
+        result[key] = {}
+        for basis in ("IT", "ET"):
+            weights = counts * np.array([a[kind][vt][basis] for vt in vehicles], dtype=float)
+            result[key][basis] = np.einsum("dh,ydhv,yv->y", profile, factors, weights)
+    result["total"] = {basis: result["distance_total"][basis] + result["time_total"][basis] for basis in ("IT", "ET")}
+    return result
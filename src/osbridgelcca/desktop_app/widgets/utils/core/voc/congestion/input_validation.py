@@ -1,4 +1,4 @@
-from voc.utils import carriage_way_standards
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils import carriage_way_standards
 
 def validate(a, vc, lane_type, vehicle_input, debug=False):
     errors = []
@@ -1,7 +1,7 @@
 from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.input_validation import validate_input
 from osbridgelcca.desktop_app.widgets.utils.core.voc.vehicle_types import big_cars, buses, hcv, lcv, mcv, small_cars, two_wheeler
 from osbridgelcca.desktop_app.widgets.utils.core.voc.utils import post_processor as pp
-import sys
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.carriage_way_standards import CarriagewayStandards
 
 # Map vehicle_info keys to their model modules
 MODEL_MAP = {
@@ -23,25 +23,36 @@ def main(vehicle_input, wpi, debug = False):
     vehicle_input (dict): Input data containing vehicle counts and other parameters.
     wpi (dict): Wholesale Price Index data for cost adjustments.
     debug (bool): If True, includes detailed breakdown of calculations. Files generated in the `debug` folder.
+
+    Raises:
+    ValueError: If the input is invalid.
     """
 
     # --------------------
     # 1. Validate input
     # --------------------
+    checked_input = validated_copy(vehicle_input)
 
     # --------------------
-    # 1. Validate input
+    # 2. Vehicle model execution and WPI post-processing
     # --------------------
-    try:
-        validate_input(vehicle_input)
-    except ValueError as e:
-        print("Input validation failed:\n", str(e))
-        sys.exit(1)  # Terminate the program with an error code
+    return pp.post_process(run_vehicle_models(checked_input), wpi, debug)
 
 
-    # --------------------
-    # 2. Vehicle model execution
-    # --------------------
+def validated_copy(vehicle_input):
+    """
+    Validate the input without touching the caller's dictionary.
+
+    validate_input fills in the standard carriageway width, so the models
+    must be run on the returned copy.
+    """
+    checked_input = dict(vehicle_input)
+    validate_input(checked_input)
+    return checked_input
+
+
+def run_vehicle_models(vehicle_input):
+    """Raw VOC output of every vehicle model with count > 0 (no WPI adjustment)."""
     vehicle_info = vehicle_input.get("vehicle_info", {})
     results = {}
 
@@ -65,6 +76,84 @@ def main(vehicle_input, wpi, debug = False):
                     input_for_model["power_weight_ratio_pwr"] = vehicle_input["power_weight_ratio_pwr"].get(vt, 0)
 
                 results[vt] = model_module.compute_voc(input_for_model)
-                summaryOfVOC = pp.post_process(results, wpi, debug)
 
-    return summaryOfVOC
+    return results
+
+
+# Keys of the vehicle input that describe one road segment
+SEGMENT_KEYS = ("rg_roughness_factor", "fl_fall_factor", "rs_rise_factor", "lane_type", "carriageway_width")
+
+
+def main_batch(vehicle_input, segments, wpi, debug = False):
+    """
+    VOC summary of many road segments, one at a time.
+
+    The traffic part of the input (vehicle_info, power_weight_ratio_pwr) is
+    validated once. Every segment only overrides the road conditions
+    (SEGMENT_KEYS); its lane type and numbers are checked and the standard
+    widths are looked up once per lane type. Each segment is post-processed
+    exactly once and yielded before the next one is computed, so memory stays
+    bounded for corridor-length inputs.
+
+    Parameters:
+    vehicle_input (dict): Input as for main(); its road conditions are the
+        defaults of every segment.
+    segments (iterable of dict): Road conditions of each segment.
+    wpi (dict): Wholesale Price Index data for cost adjustments.
+    debug (bool): As for main(); the files are overwritten by every segment.
+
+    Yields:
+    (index, summaryOfVOC) per segment.
+
+    Raises:
+    ValueError: If the input or a segment is invalid; the message starts with
+        the index of the segment. Segments before the invalid one have
+        already been yielded.
+    """
+    segments = iter(segments)
+    first = next(segments, None)
+    if first is None:
+        return
+
+    try:
+        base = validated_copy({**vehicle_input, **first})
+    except ValueError as e:
+        raise ValueError(f"Segment 0: {e}")
+    widths = {base["lane_type"]: base["carriageway_width"]}
+    yield 0, pp.post_process(run_vehicle_models(base), wpi, debug)
+
+    # Later segments start from the road conditions of vehicle_input, not of segment 0
+    defaults = {key: vehicle_input[key] for key in SEGMENT_KEYS if key in vehicle_input}
+    for index, segment in enumerate(segments, start=1):
+        segment_input = {**base, **defaults, **segment}
+        changes_lane_type = segment.get("lane_type", defaults.get("lane_type")) != defaults.get("lane_type")
+        if changes_lane_type and "carriageway_width" not in segment:
+            # The width of another lane type does not apply
+            segment_input["carriageway_width"] = None
+        _check_segment(segment_input, widths, index)
+        yield index, pp.post_process(run_vehicle_models(segment_input), wpi, debug)
+
+
+def _check_segment(segment_input, widths, index):
+    """Road condition checks of validate_input for one segment; fills in the standard width."""
+    errors = []
+    lane_type = segment_input.get("lane_type")
+    if lane_type == "EW":
+        width = segment_input.get("carriageway_width")
+        if width is None or not isinstance(width, (int, float)) or width <= 0:
+            errors.append("For Expressway type, 'carriageway_width' must be a positive number (custom width required).")
+    else:
+        if lane_type not in widths:
+            width, msg = CarriagewayStandards.get_width(lane_type)
+            if width is None:
+                errors.append(f"lane_type '{lane_type}' is invalid: {msg}")
+            else:
+                widths[lane_type] = width
+        segment_input["carriageway_width"] = widths.get(lane_type)
+
+    for field in ("rg_roughness_factor", "fl_fall_factor", "rs_rise_factor"):
+        if not isinstance(segment_input.get(field), (int, float)):
+            errors.append(f"{field} must be a number (int or float).")
+
+    if errors:
+        raise ValueError(f"Segment {index}: " + "\n".join(errors))
@@ -0,0 +1,119 @@
+"""
+Fuel based CO2e emissions of road traffic.
+
+Turns the fuel consumption of the vectorized VOC models (litres per 1000 km
+per vehicle type) into kg CO2e per vehicle-km with fuel emission factors,
+raises it by the distance related congestion factor of the road for the
+hourly traffic and aggregates over the traffic, the length of a detour and
+its duration. Every step is array arithmetic, so a whole batch of traffic
+scenarios (e.g. Monte Carlo draws) is evaluated in one pass.
+
+Example:
+    emissions = rerouting_emissions(
+        {"rg_roughness_factor": 2000, "fl_fall_factor": 0, "rs_rise_factor": 0,
+         "lane_type": "2L", "power_weight_ratio_pwr": {"hcv": 7.22, "mcv": 8}},
+        {"small_cars": 1200, "two_wheelers": 3000, "hcv": 400},
+        detour_km=5, days=780)
+    emissions["per_vehicle_km"], emissions["total"]
+"""
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from osbridgelcca.desktop_app.widgets.utils.core.voc.congestion import formulas as cf
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.constants import hourly_traffic_share, lane_capacity_pcu_per_day, pcu, vehicle_type_list
+from osbridgelcca.desktop_app.widgets.utils.core.voc.vectorized import compute_voc_arrays
+
+# Tank-to-wheel emission factors (kg CO2e per litre)
+FUEL_EMISSION_FACTORS = {
+    "petrol": 2.31,
+    "diesel": 2.68,
+}
+
+
+def fuel_emission_rates(columns: Dict[str, Dict[str, np.ndarray]],
+                        factors: Optional[Dict[str, float]] = None) -> Dict[str, np.ndarray]:
+    """
+    kg CO2e per vehicle-km of every vehicle type.
+
+    Args:
+        columns: Output of voc.vectorized.compute_voc_arrays
+        factors: Emission factor per fuel, default FUEL_EMISSION_FACTORS
+    """
+    factors = {**FUEL_EMISSION_FACTORS, **(factors or {})}
+    return {vehicle: (values["petrol"] * factors["petrol"] + values["diesel"] * factors["diesel"]) / 1000
+            for vehicle, values in columns.items()}
+
+
+def rerouting_emissions(conditions: Dict[str, Any], vehicle_info: Dict[str, Any], detour_km=1.0, days=1.0,
+                        hourly_share=None, capacity: Optional[float] = None,
+                        factors: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    CO2e emitted by traffic diverted over a detour.
+
+    The congestion factor of every vehicle type is evaluated for each hour
+    of the day from the v/c ratio of the diverted traffic on the detour road
+    and averaged with the hourly traffic share.
+
+    Args:
+        conditions: Road of the detour in voc.core.main input form, one
+            value per key (rg_roughness_factor, fl_fall_factor,
+            rs_rise_factor, lane_type, power_weight_ratio_pwr, ...)
+        vehicle_info: Daily traffic per vehicle type; scalars or arrays of
+            one shape (one entry per scenario)
+        detour_km: Additional distance travelled per vehicle
+        days: Number of days the traffic is diverted
+        hourly_share: Share of the daily traffic per hour, default
+            voc.utils.constants.hourly_traffic_share
+        capacity: Capacity of the detour road in PCU/day, default the
+            capacity of its lane type
+        factors: Emission factor per fuel, default FUEL_EMISSION_FACTORS
+
+    Returns:
+        dict with 'rate' (kg CO2e/veh-km without congestion) and 'congestion'
+        per vehicle type, 'per_vehicle_km' (traffic weighted kg CO2e/veh-km
+        with congestion, 0 without traffic) and 'total' (kg CO2e)
+    """
+    lane_type = conditions.get("lane_type")
+    if not isinstance(lane_type, str):
+        raise ValueError(f"'lane_type' must be a single lane type. Provided: {lane_type}")
+    if capacity is None:
+        capacity = lane_capacity_pcu_per_day.get(lane_type)
+    if not capacity or capacity <= 0:
+        raise ValueError(f"Capacity of lane type '{lane_type}' must be positive. Provided: {capacity}")
+    vehicles = [vt for vt in vehicle_type_list if vt in vehicle_info]
+    if not vehicles:
+        raise ValueError(f"vehicle_info must contain at least one of {vehicle_type_list}")
+    share = np.asarray(hourly_traffic_share if hourly_share is None else hourly_share, dtype=float)
+    if share.shape != (24,) or share.sum() <= 0:
+        raise ValueError("hourly_share must have 24 non-negative entries with a positive sum.")
+    share = share / share.sum()
+
+    # (scenarios..., vehicles)
+    counts = np.stack(np.broadcast_arrays(*[np.asarray(vehicle_info[vt], dtype=float) for vt in vehicles]), axis=-1)
+    columns = compute_voc_arrays(conditions, vehicles)
+    if columns[vehicles[0]]["velocity"].size != 1:
+        raise ValueError("conditions must describe a single road (scalar values)")
+    rates = fuel_emission_rates(columns, factors)
+    rates = np.array([rates[vt][0] for vt in vehicles])
+
+    # Hourly flow against the hourly capacity, congestion averaged over the day
+    pcu_per_day = counts @ np.array([pcu.get(vt, 1) for vt in vehicles])
+    vc = pcu_per_day[..., None] * 24 * share / capacity
+    index = [vehicle_type_list.index(vt) for vt in vehicles]
+    congestion = np.einsum("h,...hv->...v", share,
+                           cf.congestion_factors(lane_type, vc, cf.DISTANCE_COEFFICIENTS)[..., index])
+
+    daily = counts * rates * congestion
+    traffic = counts.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_vehicle_km = np.where(traffic > 0, daily.sum(axis=-1) / traffic, 0.0)
+    total = daily.sum(axis=-1) * detour_km * days
+    scalar = lambda value: float(value) if np.ndim(value) == 0 else value
+    return {
+        "rate": {vt: float(rates[v]) for v, vt in enumerate(vehicles)},
+        "congestion": {vt: scalar(congestion[..., v]) for v, vt in enumerate(vehicles)},
+        "per_vehicle_km": scalar(per_vehicle_km),
+        "total": scalar(total),
+        "unit": "kg CO2e",
+    }
@@ -0,0 +1,185 @@
+"""
+Precomputed VOC lookup grid.
+
+Evaluates the vectorized VOC models and the WPI adjustment once over a dense
+grid of roughness (RG) x rise-and-fall (RF) x lane type x vehicle type x WPI
+year and stores the per-km costs in one compressed .npz file. Lookups
+interpolate bilinearly in RG and RF, so interactive edits and Monte Carlo
+draws get the VOC without re-running the models and the post-processor.
+
+Example:
+    grid = VOCGrid.load_or_build("voc_grid.npz", [wpi_2024],
+                                 roughness=np.arange(1500, 8001, 100),
+                                 rise_fall=np.arange(0, 61, 5),
+                                 pwr={"hcv": 7.22, "mcv": 8})
+    grid.lookup("small_cars", "2L", 2024, roughness=2350, rise_fall=12.5)
+"""
+import json
+import os
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.constants import vehicle_type_list
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.post_processor import apply_wpi_matrix, compile_wpi, voc_components
+from osbridgelcca.desktop_app.widgets.utils.core.voc.vectorized import EXPRESSWAY, LANE_TYPES, carriageway_widths, compute_vehicle_arrays, lane_codes
+
+# First axis of VOCGrid.values
+COST_KEYS = ("distance_IT", "distance_ET", "time_IT", "time_ET")
+
+
+def _bracket(axis, x, name):
+    """Lower index and weight of the upper neighbour of x along a sorted axis."""
+    x = np.asarray(x, dtype=float)
+    if ((x < axis[0]) | (x > axis[-1])).any():
+        raise ValueError(f"{name} outside the grid range [{axis[0]}, {axis[-1]}]")
+    if len(axis) == 1:
+        return np.zeros(x.shape, dtype=np.intp), np.zeros(x.shape)
+    index = np.clip(np.searchsorted(axis, x, side="right") - 1, 0, len(axis) - 2)
+    return index, (x - axis[index]) / (axis[index + 1] - axis[index])
+
+
+class VOCGrid:
+    """
+    Per-km vehicle operating cost (Rs/km/veh) over a grid of road conditions.
+
+    values has shape (COST_KEYS, vehicles, lanes, years, roughness, rise_fall).
+    Rise and fall are split as RS = rise_share * RF and FL = RF - RS.
+    """
+
+    def __init__(self, values, vehicles, lanes, years, roughness, rise_fall, meta=None):
+        self.values = np.asarray(values, dtype=float)
+        self.vehicles = tuple(vehicles)
+        self.lanes = tuple(lanes)
+        self.years = np.asarray(years, dtype=int)
+        self.roughness = np.asarray(roughness, dtype=float)
+        self.rise_fall = np.asarray(rise_fall, dtype=float)
+        self.meta = dict(meta or {})
+        expected = (len(COST_KEYS), len(self.vehicles), len(self.lanes), len(self.years),
+                    len(self.roughness), len(self.rise_fall))
+        if self.values.shape != expected:
+            raise ValueError(f"VOC grid values must have shape {expected}, got {self.values.shape}")
+
+    @classmethod
+    def build(cls, wpis: Iterable[Dict[str, Any]], roughness, rise_fall, lanes: Optional[Iterable[str]] = None,
+              vehicles: Optional[Iterable[str]] = None, expressway_width: Optional[float] = None,
+              pwr: Any = None, rise_share: float = 0.5) -> "VOCGrid":
+        """
+        Evaluate the VOC models over the grid.
+
+        Args:
+            wpis: WPI dictionaries as used by voc.core.main, one per year
+                (each with its "year")
+            roughness, rise_fall: Grid axes (sorted ascending)
+            lanes: Lane types, default all; EW only when expressway_width is given
+            vehicles: Vehicle types, default all
+            expressway_width: Carriageway width of the EW lane type
+            pwr: Power to weight ratio for HCV and MCV (scalar or dictionary)
+            rise_share: Share of RF taken as rise (RS), the rest is fall (FL)
+        """
+        wpis = sorted(wpis, key=lambda wpi: wpi["year"])
+        roughness = np.asarray(roughness, dtype=float)
+        rise_fall = np.asarray(rise_fall, dtype=float)
+        if not wpis or roughness.ndim != 1 or rise_fall.ndim != 1 or not len(roughness) or not len(rise_fall):
+            raise ValueError("A VOC grid needs at least one WPI year, roughness and rise_fall value")
+        if (np.diff(roughness) <= 0).any() or (np.diff(rise_fall) <= 0).any():
+            raise ValueError("Grid axes must be strictly increasing")
+        if lanes is None:
+            lanes = [lane for lane in LANE_TYPES if expressway_width is not None or lane != LANE_TYPES[EXPRESSWAY]]
+        lanes = tuple(lanes)
+        vehicles = tuple(vehicle_type_list if vehicles is None else vehicles)
+
+        # One evaluation point per (lane, RG, RF)
+        codes, RG, RF = np.meshgrid(lane_codes(lanes), roughness, rise_fall, indexing="ij")
+        codes, RG, RF = codes.ravel(), RG.ravel(), RF.ravel()
+        RS = rise_share * RF
+        FL = RF - RS
+        W = carriageway_widths(codes, expressway_width)
+        columns = {vehicle: compute_vehicle_arrays(vehicle, codes, W, RG, FL, RS, RF, pwr) for vehicle in vehicles}
+
+        # Unadjusted costs once; every year is one multiply by its compiled WPI matrix
+        components = voc_components(columns)
+        shape = (len(lanes), len(roughness), len(rise_fall))
+        values = np.empty((len(COST_KEYS), len(vehicles), len(lanes), len(wpis), len(roughness), len(rise_fall)))
+        for y, wpi in enumerate(wpis):
+            totals = apply_wpi_matrix(components, compile_wpi(wpi), vehicles)
+            for v, vehicle in enumerate(vehicles):
+                for k, key in enumerate(COST_KEYS):
+                    kind, basis = key.split("_")
+                    values[k, v, :, y] = np.reshape(totals[vehicle][f"{kind}Cost"][basis], shape)
+
+        meta = {"expressway_width": expressway_width, "pwr": pwr, "rise_share": rise_share}
+        return cls(values, vehicles, lanes, [wpi["year"] for wpi in wpis], roughness, rise_fall, meta)
+
+    def save(self, path):
+        """Write the grid to a compressed .npz file."""
+        np.savez_compressed(path, values=self.values, vehicles=np.array(self.vehicles), lanes=np.array(self.lanes),
+                            years=self.years, roughness=self.roughness, rise_fall=self.rise_fall,
+                            meta=np.array(json.dumps(self.meta, sort_keys=True)))
+
+    @classmethod
+    def load(cls, path) -> "VOCGrid":
+        """Read a grid written by save()."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["values"], data["vehicles"].tolist(), data["lanes"].tolist(), data["years"],
+                       data["roughness"], data["rise_fall"], json.loads(str(data["meta"])))
+
+    @classmethod
+    def load_or_build(cls, path, wpis, roughness, rise_fall, **kwargs) -> "VOCGrid":
+        """
+        Load the grid from `path` if it was built with the same axes and
+        options, otherwise build it and save it there.
+        """
+        wpis = list(wpis)
+        if os.path.exists(path):
+            grid = cls.load(path)
+            lanes, vehicles = kwargs.get("lanes"), kwargs.get("vehicles")
+            meta = {"expressway_width": kwargs.get("expressway_width"), "pwr": kwargs.get("pwr"),
+                    "rise_share": kwargs.get("rise_share", 0.5)}
+            if (np.array_equal(grid.years, sorted(wpi["year"] for wpi in wpis))
+                    and np.array_equal(grid.roughness, np.asarray(roughness, dtype=float))
+                    and np.array_equal(grid.rise_fall, np.asarray(rise_fall, dtype=float))
+                    and (lanes is None or grid.lanes == tuple(lanes))
+                    and (vehicles is None or grid.vehicles == tuple(vehicles))
+                    and grid.meta == json.loads(json.dumps(meta, sort_keys=True))):
+                return grid
+        grid = cls.build(wpis, roughness, rise_fall, **kwargs)
+        grid.save(path)
+        return grid
+
+    def _index(self, items, item, name):
+        try:
+            return items.index(item)
+        except ValueError:
+            raise ValueError(f"{name} '{item}' is not in the VOC grid. Available: {list(items)}")
+
+    def lookup(self, vehicle: str, lane: str, year: int, roughness, rise_fall, basis: str = "IT",
+               component: Optional[str] = None):
+        """
+        Interpolated per-km VOC (Rs/km/veh).
+
+        Args:
+            vehicle, lane, year: Exact grid entries
+            roughness, rise_fall: Scalars or arrays (broadcast against each other)
+            basis: "IT" (with taxes) or "ET" (economic, without taxes)
+            component: "distance" or "time"; None gives their sum
+
+        Returns:
+            float for scalar conditions, otherwise an ndarray
+        """
+        v = self._index(self.vehicles, vehicle, "Vehicle type")
+        l = self._index(self.lanes, lane, "Lane type")
+        y = self._index(self.years.tolist(), int(year), "WPI year")
+        kinds = ("distance", "time") if component is None else (component,)
+        keys = [self._index(COST_KEYS, f"{kind}_{basis}", "Cost") for kind in kinds]
+        table = self.values[keys, v, l, y].sum(axis=0)
+
+        roughness, rise_fall = np.broadcast_arrays(np.asarray(roughness, dtype=float),
+                                                   np.asarray(rise_fall, dtype=float))
+        i, s = _bracket(self.roughness, roughness, "roughness")
+        j, t = _bracket(self.rise_fall, rise_fall, "rise_fall")
+        i1 = np.minimum(i + 1, len(self.roughness) - 1)
+        j1 = np.minimum(j + 1, len(self.rise_fall) - 1)
+        value = ((1 - s) * ((1 - t) * table[i, j] + t * table[i, j1])
+                 + s * ((1 - t) * table[i1, j] + t * table[i1, j1]))
+        return float(value) if value.ndim == 0 else value
@@ -41,4 +41,25 @@ pcu = {
     "lcv": 1.4, 
     "hcv": 2.2, 
     "mcv": 2.2
-}
\ No newline at end of file
+}
+
+# Capacity of each lane type in PCU/day (both directions). Single,
+# intermediate, two and four lane values are the IRC:64 design service
+# volumes for plain terrain; six and eight lanes (and expressways) are scaled
+# per lane from the four lane value.
+lane_capacity_pcu_per_day = {
+    "SL": 2000,
+    "IL": 6000,
+    "2L": 15000,
+    "4L": 35000,
+    "6L": 52500,
+    "8L": 70000,
+    "EW": 70000
+}
+
+# Indicative share of the daily traffic in each hour of the day (0-23h),
+# with morning and evening peaks
+hourly_traffic_share = [
+    0.012, 0.009, 0.008, 0.008, 0.011, 0.020, 0.036, 0.052, 0.064, 0.066, 0.060, 0.056,
+    0.053, 0.053, 0.055, 0.058, 0.063, 0.069, 0.070, 0.060, 0.044, 0.032, 0.023, 0.018
+]
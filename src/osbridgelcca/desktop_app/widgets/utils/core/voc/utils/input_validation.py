@@ -1,5 +1,5 @@
-from utils import carriage_way_standards
-from utils import constants
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils import carriage_way_standards
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils import constants
 
 def validate_input(vehicle_input):
     errors = []
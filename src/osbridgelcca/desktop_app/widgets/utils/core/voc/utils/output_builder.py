@@ -1,6 +1,82 @@
+from dataclasses import dataclass
 from typing import Dict, Any
 
-def build_voc_output(
+# Layout of the VOC output of one vehicle: (group, entry, ((key, VOCRecord field), ...), unit, iHTC).
+# Units and iHTC flags are held here once instead of in every record.
+VOC_SCHEMA = (
+    ("distance_related", "fuel_consumption", (("petrol", "petrol"), ("diesel", "diesel")), "liters per 1000 km", False),
+    ("distance_related", "spare_parts", (("ET", "SP_ET"), ("IT", "SP_IT")), "Rs/km", True),
+    ("distance_related", "maintenance_labour", (("value", "ML"),), "Rs/km", False),
+    ("distance_related", "tyre_life", (("value", "TL"),), "km/tyre", False),
+    ("distance_related", "engine_oil", (("value", "EOL"),), "liters per 1000 km", False),
+    ("distance_related", "other_oil", (("value", "OL"),), "liters per 10000 km", False),
+    ("distance_related", "grease", (("value", "G"),), "liters per 10000 km", False),
+    ("time_related", "fixed_cost", (("ET", "FXC_ET"), ("IT", "FXC_IT")), "Rs/km", True),
+    ("time_related", "depreciation_cost", (("ET", "DC_ET"), ("IT", "DC_IT")), "Rs/km", True),
+    ("time_related", "passenger_time_cost", (("value", "PT"),), "Rs/km", False),
+    ("time_related", "crew_cost", (("value", "crew"),), "Rs/km", False),
+    ("time_related", "commodity_holding_cost", (("value", "CHC"),), "Rs/km", False),
+    ("utilisation", None, (("value", "UPD"),), None, False),
+)
+VELOCITY_UNIT = "kmph"
+VOC_NOTE = "All Values mentioned here are without WPI adjustments!"
+
+
+@dataclass(slots=True)
+class VOCRecord:
+    """
+    VOC of one vehicle type without WPI adjustments.
+
+    Values are clipped at zero; spare parts and maintenance labour are in
+    Rs/km. Units and iHTC flags are in VOC_SCHEMA; to_dict() expands the
+    record into the nested build_voc_output layout for debug output and the UI.
+    """
+    vehicle_type: str
+    lane_type: str
+    velocity: float
+    petrol: float
+    diesel: float
+    SP_ET: float
+    SP_IT: float
+    ML: float
+    TL: float
+    EOL: float
+    OL: float
+    G: float
+    FXC_ET: float
+    FXC_IT: float
+    DC_ET: float
+    DC_IT: float
+    PT: float
+    crew: float
+    CHC: float
+    UPD: float
+
+    def __getitem__(self, name: str) -> float:
+        # Column style access, so records can be passed where VOC columns are expected
+        return getattr(self, name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {"distance_related": {}, "time_related": {}}
+        for group, entry, fields, unit, iHTC in VOC_SCHEMA:
+            block: Dict[str, Any] = {key: getattr(self, field) for key, field in fields}
+            if unit is not None:
+                block["unit"] = unit
+            block["iHTC"] = iHTC
+            if entry is None:
+                summary[group] = block
+            else:
+                summary[group][entry] = block
+        summary["note"] = VOC_NOTE
+        return {
+            "vehicle_type": self.vehicle_type,
+            "lane_type": self.lane_type,
+            "velocity": {"value": self.velocity, "unit": VELOCITY_UNIT},
+            "VOC_summary": summary,
+        }
+
+
+def build_voc_record(
     vt: str,
     lane: str,
     velocity: float,
@@ -21,94 +97,41 @@ def build_voc_output(
     crew: float,
     CHC: float,
     UPD: float
-) -> Dict[str, Any]:
- 
+) -> VOCRecord:
+
     def nn(x):
         # Helper to ensure non-negative values
         return max(x, 0)
-    
-    return {
-        "vehicle_type": vt,
-        "lane_type": lane,
-        "velocity": {
-            "value": nn(velocity),
-            "unit": "kmph"
-        },
-        "VOC_summary": {
-            "distance_related": {
-                "fuel_consumption": {
-                    "petrol": nn(petrol),
-                    "diesel": nn(diesel),
-                    "unit": "liters per 1000 km",
-                    "iHTC": False
-                },
-                "spare_parts": {
-                    "ET": nn(SP_ET)/100,
-                    "IT": nn(SP_IT)/100,
-                    "unit": "Rs/km",
-                    "iHTC": True
-                },
-                "maintenance_labour": {
-                    "value": nn(ML)/100,
-                    "unit": "Rs/km",
-                    "iHTC": False
-                },
-                "tyre_life": {
-                    "value": nn(TL),
-                    "unit": "km/tyre",
-                    "iHTC": False
-                },
-                "engine_oil": {
-                    "value": nn(EOL),
-                    "unit": "liters per 1000 km",
-                    "iHTC": False
-                },
-                "other_oil": {
-                    "value": nn(OL),
-                    "unit": "liters per 10000 km",
-                    "iHTC": False
-                },
-                "grease": {
-                    "value": nn(G),
-                    "unit": "liters per 10000 km",
-                    "iHTC": False
-                },
-            },
 
-            "time_related": {
-                "fixed_cost": {
-                    "ET": nn(FXC_ET),
-                    "IT": nn(FXC_IT),
-                    "unit": "Rs/km",
-                    "iHTC": True
-                },
-                "depreciation_cost": {
-                    "ET": nn(DC_ET),
-                    "IT": nn(DC_IT),
-                    "unit": "Rs/km",
-                    "iHTC": True
-                },
-                "passenger_time_cost": {
-                    "value": nn(PT),
-                    "unit": "Rs/km",
-                    "iHTC": False
-                },
-                "crew_cost": {
-                    "value": nn(crew),
-                    "unit": "Rs/km",
-                    "iHTC": False
-                },
-                "commodity_holding_cost": {
-                    "value": nn(CHC),
-                    "unit": "Rs/km",
-                    "iHTC": False
-                },
-            },
+    return VOCRecord(
+        vt, lane, nn(velocity), nn(petrol), nn(diesel), nn(SP_ET)/100, nn(SP_IT)/100, nn(ML)/100, nn(TL),
+        nn(EOL), nn(OL), nn(G), nn(FXC_ET), nn(FXC_IT), nn(DC_ET), nn(DC_IT), nn(PT), nn(crew), nn(CHC), nn(UPD)
+    )
 
-            "utilisation": {
-                "value": nn(UPD),
-                "iHTC": False
-            },
-            "note": "All Values mentioned here are without WPI adjustments!"
-        }
-    }
+
+def build_voc_output(
+    vt: str,
+    lane: str,
+    velocity: float,
+    petrol: float,
+    diesel: float,
+    SP_ET: float,
+    SP_IT: float,
+    ML: float,
+    TL: float,
+    EOL: float,
+    OL: float,
+    G: float,
+    FXC_ET: float,
+    FXC_IT: float,
+    DC_ET: float,
+    DC_IT: float,
+    PT: float,
+    crew: float,
+    CHC: float,
+    UPD: float
+) -> Dict[str, Any]:
+    return build_voc_record(
+        vt, lane, velocity, petrol, diesel, SP_ET, SP_IT, ML, TL, EOL, OL, G,
+        FXC_ET, FXC_IT, DC_ET, DC_IT, PT, crew, CHC, UPD
+    ).to_dict()
@@ -1,7 +1,9 @@
-import IRC_standards.IRCSP30_2019 as tableC1
-from voc.utils.constants import vehicle_type_list, petrolToDieselRatio
+from osbridgelcca.desktop_app.widgets.utils.core.IRC_standards import IRCSP30_2019 as tableC1
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.constants import vehicle_type_list, petrolToDieselRatio
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.output_builder import VOCRecord
 import json
 import os
+import numpy as np
 from typing import Any, Dict, Union
 
 
@@ -54,18 +56,20 @@ def calculate_total_cost(data: Dict[str, Any]) -> Dict[str, Any]:
     return total_cost
 
 
-def getWPI(category, vehicle_type, wpi):
-    mapping = {
-        "small_cars": "Small Cars",
-        "big_cars": "Big Cars",
-        "two_wheelers": "Two Wheeler",
-        "buses": "Ordinary Buses",
-        "lcv": "LCV",
-        "hcv": "HCV",
-        "mcv": "MCV"
-    }
+# Vehicle type -> vehicle name used in the WPI tables
+VEHICLE_NAMES = {
+    "small_cars": "Small Cars",
+    "big_cars": "Big Cars",
+    "two_wheelers": "Two Wheeler",
+    "buses": "Ordinary Buses",
+    "lcv": "LCV",
+    "hcv": "HCV",
+    "mcv": "MCV"
+}
+
 
-    vt = mapping.get(vehicle_type)
+def getWPI(category, vehicle_type, wpi):
+    vt = VEHICLE_NAMES.get(vehicle_type)
     if vt is None:
         raise ValueError(f"Invalid vehicle type: {vehicle_type}")
 
@@ -124,9 +128,189 @@ def apply_wpi(cost: Dict[str, float], wpi_val: Union[float, Dict[str, Any], None
     }
 
 
+# ----------------- Compiled WPI -----------------
+
+# Rows of a compiled WPI matrix (columns follow vehicle_type_list)
+WPI_CATEGORIES = ("Petrol", "Diesel", "Engine Oil", "Other Oil", "Grease", "tyreCost", "spareParts",
+                  "fixedDepreciation", "commodityHoldingCost", "Passenger Cost", "Crew Cost")
+
+# Oils without a WPI are not adjusted (as apply_wpi)
+_UNADJUSTED_IF_MISSING = ("Engine Oil", "Other Oil", "Grease")
+
+# Per-km cost components of the VOC output: (name, WPI category, distance related)
+VOC_COMPONENTS = (
+    ("tyre_cost", "tyreCost", True),
+    ("petrol", "Petrol", True),
+    ("diesel", "Diesel", True),
+    ("engine_oil", "Engine Oil", True),
+    ("other_oil", "Other Oil", True),
+    ("grease", "Grease", True),
+    ("spare_parts", "spareParts", True),
+    ("maintenance_labour", "spareParts", True),
+    ("fixed_cost", "fixedDepreciation", False),
+    ("depreciation_cost", "fixedDepreciation", False),
+    ("passenger_time_cost", "Passenger Cost", False),
+    ("crew_cost", "Crew Cost", False),
+    ("commodity_holding_cost", "commodityHoldingCost", False),
+)
+_COMPONENT_ROWS = np.array([WPI_CATEGORIES.index(category) for _, category, _ in VOC_COMPONENTS])
+_DISTANCE = np.array([distance for _, _, distance in VOC_COMPONENTS])
+
+
+def compile_wpi(wpi: Dict[str, Any]) -> np.ndarray:
+    """
+    Flatten a WPI dictionary (IRC_SP_30.getWPI) into a dense
+    (WPI_CATEGORIES x vehicle_type_list) array of multipliers.
+    """
+    WPI_data = wpi.get("WPI", {})
+    vehicle_cost = WPI_data.get("vehicleCost", {})
+    blocks = {
+        "tyreCost": vehicle_cost.get("tyreCost", {}),
+        "spareParts": vehicle_cost.get("spareParts", {}),
+        "fixedDepreciation": vehicle_cost.get("fixedDepreciation", {}),
+        "commodityHoldingCost": WPI_data.get("commodityHoldingCost", {}),
+    }
+    shared = {**WPI_data.get("fuelCost", {}), **WPI_data.get("passengerCrewCost", {})}
+
+    matrix = np.empty((len(WPI_CATEGORIES), len(vehicle_type_list)))
+    missing = []
+    for row, category in enumerate(WPI_CATEGORIES):
+        for col, vt in enumerate(vehicle_type_list):
+            value = blocks[category].get(VEHICLE_NAMES[vt]) if category in blocks else shared.get(category)
+            if value is None:
+                if category not in _UNADJUSTED_IF_MISSING:
+                    missing.append(f"{category}/{vt}")
+                value = 1.0
+            matrix[row, col] = value
+    if missing:
+        raise ValueError(f"WPI for year {wpi.get('year')} is missing: {missing}")
+    return matrix
+
+
+class WPIResolver:
+    """
+    Compiled WPI matrices per year.
+
+    Args:
+        source: Object with getWPI(year), e.g. IRC_SP_30. Each year is compiled
+            once and reused.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._matrices: Dict[int, np.ndarray] = {}
+
+    def matrix(self, year: int) -> np.ndarray:
+        if year not in self._matrices:
+            self._matrices[year] = compile_wpi(self.source.getWPI(year))
+        return self._matrices[year]
+
+    def matrices(self, years) -> np.ndarray:
+        """(years x WPI_CATEGORIES x vehicles) stack for sweeping base years."""
+        return np.stack([self.matrix(year) for year in years])
+
+
+def voc_components(columns: Dict[str, Dict[str, Any]]) -> np.ndarray:
+    """
+    Unadjusted per-km costs of the column output of voc.vectorized.
+
+    Returns:
+        Array (IT/ET, VOC_COMPONENTS, vehicles in the order of `columns`, points)
+    """
+    prices = tableC1.petroleum_products_costs
+    points = np.shape(next(iter(columns.values()))["velocity"]) if columns else (0,)
+    components = np.empty((2, len(VOC_COMPONENTS), len(columns)) + points)
+    for v, (vt, c) in enumerate(columns.items()):
+        ratio = petrolToDieselRatio.get(vt, {"petrol": 0, "diesel": 0})
+        tyre = tableC1.new_tyres_costs[vt]
+        for b, basis in enumerate(("IT", "ET")):
+            components[b, :, v] = (
+                tyre[basis] * tyre["num_of_wheels"] / c["TL"],
+                ratio["petrol"] * c["petrol"] * prices["petrol"][basis] / 1000,
+                ratio["diesel"] * c["diesel"] * prices["diesel"][basis] / 1000,
+                c["EOL"] * prices["engine_oil"][basis] / 1000,
+                c["OL"] * prices["other_oil"][basis] / 10000,
+                c["G"] * prices["grease"][basis] / 10000,
+                c[f"SP_{basis}"],
+                c["ML"],
+                c[f"FXC_{basis}"],
+                c[f"DC_{basis}"],
+                c["PT"],
+                c["crew"],
+                c["CHC"],
+            )
+    return components
+
+
+def apply_wpi_matrix(components: np.ndarray, matrix: np.ndarray, vehicles) -> Dict[str, Dict[str, Any]]:
+    """
+    WPI adjust voc_components with a compiled matrix in one elementwise multiply.
+
+    Returns:
+        Vehicle type -> {"distanceCost": {"IT", "ET"}, "timeCost": {"IT", "ET"}}
+    """
+    columns = [vehicle_type_list.index(vt) for vt in vehicles]
+    multipliers = matrix[np.ix_(_COMPONENT_ROWS, columns)]
+    adjusted = components * multipliers.reshape(multipliers.shape + (1,) * (components.ndim - 3))
+    distance = adjusted[:, _DISTANCE].sum(axis=1)
+    time = adjusted[:, ~_DISTANCE].sum(axis=1)
+    return {vt: {"distanceCost": {"IT": distance[0, v], "ET": distance[1, v]},
+                 "timeCost": {"IT": time[0, v], "ET": time[1, v]}}
+            for v, vt in enumerate(vehicles)}
+
+
+def post_process_arrays(columns: Dict[str, Dict[str, Any]], wpi: Union[Dict[str, Any], np.ndarray]) -> Dict[str, Dict[str, Any]]:
+    """
+    WPI adjusted per-km costs of the column output of voc.vectorized.
+
+    Same adjustments as post_process, applied to whole arrays at once and
+    without the nested per-component dictionaries.
+
+    Args:
+        columns: Vehicle type -> VOC columns
+        wpi: WPI dictionary or a matrix from compile_wpi
+
+    Returns:
+        Vehicle type -> {"distanceCost": {"IT", "ET"}, "timeCost": {"IT", "ET"}}
+        with arrays in Rs/km/veh, as the per-vehicle totals of post_process.
+    """
+    matrix = wpi if isinstance(wpi, np.ndarray) else compile_wpi(wpi)
+    return apply_wpi_matrix(voc_components(columns), matrix, list(columns))
+
+
+def post_process_records(records: Dict[str, VOCRecord], wpi: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summary of post_process for the VOCRecords of the vehicle models.
+
+    Works on the flat record fields with the compiled WPI matrix instead of
+    annotating and walking the nested output dictionaries.
+    """
+    vehicles = [vt for vt in vehicle_type_list if vt in records]
+    totals = apply_wpi_matrix(voc_components({vt: records[vt] for vt in vehicles}), compile_wpi(wpi), vehicles)
+
+    summaryOfVOC: Dict[str, Any] = {}
+    for cost_type in ["distanceCost", "timeCost"]:
+        block: Dict[str, Any] = {"total": {"IT": 0.0, "ET": 0.0}}
+        for vt in vehicles:
+            block[vt] = {basis: float(totals[vt][cost_type][basis]) for basis in ("IT", "ET")}
+            block["total"]["IT"] += block[vt]["IT"]
+            block["total"]["ET"] += block[vt]["ET"]
+        block["units"] = "Rs/km/veh"
+        summaryOfVOC[cost_type] = block
+    return summaryOfVOC
+
+
 # ----------------- Main function -----------------
 
 def post_process(outputFromVocOutputBuilder: Dict[str, Any], wpi: Dict[str, Any], debug: bool = False) -> Dict[str, Any]:
+    records = {vt: output for vt, output in outputFromVocOutputBuilder.items() if isinstance(output, VOCRecord)}
+    if records and not debug and not any(isinstance(output, dict) and "VOC_summary" in output
+                                         for output in outputFromVocOutputBuilder.values()):
+        return post_process_records(records, wpi)
+    # Debug files and nested outputs need the dictionary layout
+    outputFromVocOutputBuilder = {vt: output.to_dict() if isinstance(output, VOCRecord) else output
+                                  for vt, output in outputFromVocOutputBuilder.items()}
+
     wpiAdjustedValues: Dict[str, Any] = {"distanceCost": {}, "timeCost": {}}
 
     for vt in vehicle_type_list:
@@ -0,0 +1,311 @@
+"""
+Vectorized vehicle operating cost (VOC) engine.
+
+Evaluates the IRC SP-30:2019 VOC relations of every vehicle type over arrays
+of road conditions (one entry per road link) in a single NumPy pass. The
+formulas are those of the scalar modules in voc/vehicle_types; the outputs
+match build_voc_output (values clipped at zero, spare parts and maintenance
+labour in Rs/km) but are returned as columns instead of nested dictionaries.
+
+Example:
+    columns = compute_voc_arrays(
+        {"rg_roughness_factor": rg, "fl_fall_factor": fl, "rs_rise_factor": rs,
+         "lane_type": lanes, "power_weight_ratio_pwr": {"hcv": 7.22, "mcv": 8}},
+        vehicle_types=["small_cars", "hcv"])
+    columns["hcv"]["velocity"]
+"""
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from osbridgelcca.desktop_app.widgets.utils.core.IRC_standards import IRCSP30_2019
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.carriage_way_standards import CarriagewayStandards
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.constants import vehicle_type_list
+
+# Lane types in the order of the coefficient tables below
+LANE_TYPES = ("SL", "IL", "2L", "4L", "6L", "8L", "EW")
+LANE_INDEX = {lane: index for index, lane in enumerate(LANE_TYPES)}
+EXPRESSWAY = LANE_INDEX["EW"]
+
+# Output columns, in the order of build_voc_output
+VOC_COLUMNS = ("velocity", "petrol", "diesel", "SP_ET", "SP_IT", "ML", "TL", "EOL", "OL", "G",
+               "FXC_ET", "FXC_IT", "DC_ET", "DC_IT", "PT", "crew", "CHC", "UPD")
+
+# Speed V = a - b * RF - c * (RG - RG0) + w * W, one row per lane type:
+# (a, b, c, RG0, w)
+SPEED_COEFFICIENTS = {
+    "small_cars": [(66.44, 0.6922, 0.002874, 2000, 0), (73.16, 0.7298, 0.002231, 2000, 0),
+                   (81.19, 0.7892, 0.001891, 2000, 0), (100.625, 0.394, 0.00330, 0, 0),
+                   (101.065, 0.386, 0.00323, 0, 0), (103.517, 0.386, 0.00323, 0, 0),
+                   (93.71, 0.386, 0.00323, 0, 0.701)],
+    "big_cars": [(67.04, 0.6984, 0.002956, 2000, 0), (73.82, 0.7364, 0.002251, 2000, 0),
+                 (81.92, 0.7963, 0.001915, 2000, 0), (100.625, 0.394, 0.00330, 0, 0),
+                 (104.159, 0.398, 0.00333, 0, 0), (107.743, 0.402, 0.00337, 0, 0),
+                 (97.53, 0.402, 0.00337, 0, 0.729)],
+    "two_wheelers": [(52.91, 0.6922, 0.002874, 2000, 0), (58.86, 0.7298, 0.002231, 2000, 0),
+                     (59.71, 0.7892, 0.001891, 2000, 0), (78.57, 0.7235, 0.001729, 0, 0),
+                     (81.35, 0.7235, 0.001729, 0, 0), (82.73, 0.7235, 0.001729, 0, 0),
+                     (77.19, 0.7235, 0.001729, 0, 0.396)],
+    "buses": [(47.25, 0.3698, 0.00165, 2000, 0), (52.65, 0.4031, 0.00123, 2000, 0),
+              (54.23, 0.4111, 0.00098, 2000, 0), (75.43, 0.214, 0.00198, 0, 0),
+              (77.58, 0.214, 0.00198, 0, 0), (79.73, 0.214, 0.00198, 0, 0),
+              (71.13, 0.214, 0.00198, 0, 0.614)],
+    "lcv": [(49.87, 0.4447, 0.00088, 2000, 0), (53.70, 0.4788, 0.00095, 2000, 0),
+            (57.41, 0.5119, 0.00102, 2000, 0), (74.897, 0.163, 0.0031, 0, 0),
+            (77.036, 0.163, 0.0031, 0, 0), (79.174, 0.163, 0.0031, 0, 0),
+            (70.620, 0.163, 0.0031, 0, 0.611)],
+    "hcv": [(48.29, 0.4306, 0.00086, 2000, 0), (53.12, 0.4736, 0.00094, 2000, 0),
+            (56.52, 0.5040, 0.00100, 2000, 0), (75.15, 0.6487, 0.001285, 0, 0),
+            (77.17, 0.6487, 0.001285, 0, 0), (79.19, 0.6487, 0.001285, 0, 0),
+            (71.11, 0.6487, 0.001285, 0, 0.577)],
+    "mcv": [(38.27, 0.3412, 0.00068, 2000, 0), (42.01, 0.3753, 0.00074, 2000, 0),
+            (44.79, 0.3994, 0.00079, 2000, 0), (74.16, 0.6405, 0.00128, 0, 0),
+            (76.60, 0.6405, 0.00128, 0, 0), (79.03, 0.6405, 0.00128, 0, 0),
+            (69.29, 0.6405, 0.00128, 0, 0.696)],
+}
+
+# Lane dependent numerators of the passenger time cost (PT) and commodity
+# holding cost (CHC), per lane type. PT is divided by V for cars and two
+# wheelers and by UPD for buses; CHC is divided by UPD.
+PASSENGER_TIME = {
+    "small_cars": (244.07, 244.07, 328.06, 498.65, 498.65, 498.65, 721.73),
+    "big_cars": (244.07, 244.07, 328.06, 721.73, 721.73, 721.73, 721.73),
+    "two_wheelers": (49.28, 49.28, 70.29, 70.77, 70.77, 70.77, 70.77),
+    "buses": (7297.63, 7297.63, 15509.80, 23721.98, 23721.98, 23721.98, 28385.28),
+}
+# MCVs are not used on single and intermediate lanes; their CHC is 0 there
+COMMODITY_HOLDING = {
+    "lcv": (64.71, 64.71, 71.35, 149.12, 149.12, 149.12, 149.12),
+    "hcv": (182.79, 182.79, 218.75, 1084.14, 1084.14, 1084.14, 1084.14),
+    "mcv": (0.0, 0.0, 409.28, 1707.37, 1707.37, 1707.37, 1707.37),
+}
+
+# Vehicles whose fuel consumption depends on the power to weight ratio
+PWR_VEHICLES = ("hcv", "mcv")
+
+
+def lane_codes(lane_type) -> np.ndarray:
+    """Index into LANE_TYPES for a lane type or an array of lane types."""
+    lanes = np.atleast_1d(np.asarray(lane_type))
+    if lanes.dtype.kind in "iu":
+        if ((lanes < 0) | (lanes >= len(LANE_TYPES))).any():
+            raise ValueError(f"Lane codes must be in 0..{len(LANE_TYPES) - 1}")
+        return lanes.astype(np.intp)
+    unique, inverse = np.unique(lanes.astype(str), return_inverse=True)
+    invalid = [lane for lane in unique if lane not in LANE_INDEX]
+    if invalid:
+        raise ValueError(f"lane_type {invalid} is invalid. Allowed: {list(LANE_TYPES)}")
+    return np.array([LANE_INDEX[lane] for lane in unique], dtype=np.intp)[inverse.ravel()]
+
+
+def carriageway_widths(lanes: np.ndarray, width=None) -> np.ndarray:
+    """Standard width per lane type; expressways take the given (custom) width."""
+    standard = np.array([CarriagewayStandards.get_width(lane)[0] or np.nan for lane in LANE_TYPES])
+    widths = standard[lanes]
+    expressway = lanes == EXPRESSWAY
+    if expressway.any():
+        custom = np.broadcast_to(np.asarray(np.nan if width is None else width, dtype=float), lanes.shape)
+        widths = np.where(expressway, custom, widths)
+        if not (widths[expressway] > 0).all():
+            raise ValueError("For Expressway type, 'carriageway_width' must be a positive number (custom width required).")
+    return widths
+
+
+def _speed(vehicle, lanes, RG, RF, W):
+    a, b, c, rg0, w = np.asarray(SPEED_COEFFICIENTS[vehicle], dtype=float)[lanes].T
+    return a - b * RF - c * (RG - rg0) + w * W
+
+
+def _pwr(pwr, vehicle):
+    if isinstance(pwr, dict):
+        pwr = pwr.get(vehicle)
+    if pwr is None:
+        raise ValueError(f"Power to weight ratio (pwr) must be provided for {vehicle.upper()} vehicles.")
+    return np.asarray(pwr, dtype=float)
+
+
+def _cars(V, RG, RS, FL, RF, W, sp_coefficient, upd_coefficient):
+    """Small and big cars share every relation except spare parts and utilisation."""
+    UPD = upd_coefficient * V
+    return {
+        "petrol": 30 + 844.085 / V + 0.003 * V ** 2 + 0.001 * RG + 0.3414 * RS - 0.2225 * FL,
+        "diesel": 35 + 983.503 / V + 0.003 * V ** 2 + 0.002 * RG + 0.339 * RS - 0.4785 * FL,
+        "SP": sp_coefficient * (RG - 2000) * 1e-5,
+        "ML_factor": 1.79934,
+        "TL": 68771 - 147.9 * RF - 26.72 * (RG / W),
+        "EOL": 1.8807 + 0.036615 * RF + 0.000578 * (RG / W),
+        "OL": 1.631 + 0.05167 * RF + 0.001867 * (RG / W),
+        "G": 2.816 + 0.2007 * RF,
+        "UPD": UPD,
+        "FXC": (395.65, 400.61), "DC": (42.83, 76.68),
+        "crew": 0.0,
+    }
+
+
+def _vehicle_terms(vehicle, V, RG, RS, FL, RF, W, pwr):
+    """Distance and time related terms of one vehicle type (before the lane dependent costs)."""
+    if vehicle == "small_cars":
+        return _cars(V, RG, RS, FL, RF, W, 0.0075, 6.7127)
+    if vehicle == "big_cars":
+        return _cars(V, RG, RS, FL, RF, W, 0.0045, 6.7378)
+    if vehicle == "two_wheelers":
+        return {
+            "petrol": 2.704 + 439.656 / V + 0.00349 * V ** 2 + 0.000157 * RG + 0.3642 * RS - 0.2709 * FL,
+            "diesel": 0.0,
+            "SP": (-55.879 + 0.024 * RG) * 1e-5,
+            "ML_factor": 0.5498,
+            "TL": 47340 - 101.8 * RF - 18.39 * (RG / W),
+            "EOL": 0.405 + 0.007899 * RF + 0.000125 * (RG / W),
+            "OL": 0.0, "G": 0.0,
+            "UPD": 2.119 * V,
+            "FXC": (24.32, 24.86), "DC": (4.26, 5.85),
+            "crew": 0.0,
+        }
+    if vehicle == "buses":
+        exponent = 0.007373 * RF + 0.0000723 * RG + 1.925 / W
+        UPD = 22.7134 + 12.2569 * V
+        return {
+            "petrol": 0.0,
+            "diesel": 34.23 + 4054.42 / V + 0.02149 * V ** 2 + 0.001246 * RG + 3.4557 * RS - 1.8454 * FL,
+            "SP": (np.exp(-9.7871 + exponent), np.exp(-10.1126 + exponent)),
+            "ML_factor": 1.1781,
+            "TL": 38519 - 389.52 * RF - 1.32 * RG + 983.829 * W,
+            "EOL": 0.4303 + 0.001494 * RF + 0.0007885 * (RG / W),
+            "OL": 3.3201 + 0.002889 * RF + 0.0008217 * RG - 0.3295 * W,
+            "G": 4.992 + 0.03376 * RF + 0.3634 * W,
+            "UPD": UPD,
+            "FXC": (772.89, 1415.09), "DC": (221.00, 355.71),
+            "crew": 3775.3 / UPD,
+        }
+    if vehicle == "lcv":
+        UPD = 28.807 + 2.1836 * V
+        return {
+            "petrol": 0.0,
+            "diesel": 22.504 + 1708.244 / V + 0.02591 * V ** 2 + 0.001612 * RG + 5.6863 * RS - 0.8744 * FL,
+            "SP": np.exp(-10.5615 + 0.000141 * RG + 3.493 / W),
+            "ML_factor": 0.85773,
+            "TL": 22382 + 3817 * W - 375.3 * RF - 1.037 * RG,
+            "EOL": 0.80679 + 0.019496 * RF + 0.0001297 * (RG / W),
+            "OL": 2.0415 + 0.0001058 * RG,
+            "G": 0.3661 + 0.0283 * RF + 0.000251 * RG,
+            "UPD": UPD,
+            "FXC": (723.80, 829.56), "DC": (120.90, 173.51),
+            "crew": 900 / UPD,
+        }
+    if vehicle == "hcv":
+        UPD = 55.6719 + 4.22 * V
+        return {
+            "petrol": 0.0,
+            "diesel": (50 + 8049.955 / V + 0.012 * V ** 2 + 0.005 * RG + 4.565 * RS - 4.904 * FL
+                       - 7.285 * _pwr(pwr, vehicle)),
+            "SP": np.exp(-9.492638 + 0.0001413 * RG + 3.493 / W),
+            "ML_factor": 0.7912,
+            "TL": 24662 + 4205 * W - 413.6 * RF - 1.142 * RG,
+            "EOL": 1.0277 + 0.02495 * RF + 0.0001782 * (RG / W),
+            "OL": 5.1037 + 0.0002646 * RG,
+            "G": 0.9153 + 0.0707 * RF + 0.000627 * RG,
+            "UPD": UPD,
+            "FXC": (924.28, 1056.82), "DC": (154.84, 256.80),
+            "crew": 1500 / UPD,
+        }
+    if vehicle == "mcv":
+        UPD = 77.7233 + 5.8915 * V
+        return {
+            "petrol": 0.0,
+            "diesel": (90 + 14489.919 / V + 0.0216 * V ** 2 + 0.01 * RG + 8.217 * RS - 8.8272 * FL
+                       - 13.113 * _pwr(pwr, vehicle)),
+            "SP": np.exp(-9.492638 + 0.0001413 * RG + 3.493 / W),
+            "ML_factor": 0.7912,
+            "TL": 23726 + 4046 * W - 398 * RF - 1.0099 * RG,
+            "EOL": 1.3826 + 0.03348 * RF + 0.002319 * (RG / W),
+            "OL": 5.1037 + 0.0002646 * RG,
+            "G": 0.9153 + 0.0707 * RF + 0.000627 * RG,
+            "UPD": UPD,
+            "FXC": (1238.28, 1479.30), "DC": (238.54, 425.84),
+            "crew": 1800 / UPD,
+        }
+    raise ValueError(f"Unknown vehicle type '{vehicle}'. Allowed: {vehicle_type_list}")
+
+
+def compute_vehicle_arrays(vehicle: str, lanes: np.ndarray, W, RG, FL, RS, RF, pwr=None) -> Dict[str, np.ndarray]:
+    """
+    VOC columns of one vehicle type over already prepared condition arrays.
+
+    Args:
+        vehicle: Vehicle type, one of voc.utils.constants.vehicle_type_list
+        lanes: Lane codes (see lane_codes)
+        W, RG, FL, RS, RF: Width, roughness, fall, rise and rise-and-fall arrays
+        pwr: Power to weight ratio (HCV and MCV only), scalar, array or
+            dictionary keyed by vehicle type
+
+    Returns:
+        Dictionary of VOC_COLUMNS -> ndarray, as build_voc_output
+    """
+    if vehicle not in SPEED_COEFFICIENTS:
+        raise ValueError(f"Unknown vehicle type '{vehicle}'. Allowed: {vehicle_type_list}")
+    V = _speed(vehicle, lanes, RG, RF, W)
+    terms = _vehicle_terms(vehicle, V, RG, RS, FL, RF, W, pwr)
+    NP = IRCSP30_2019.vehicle_costs[vehicle]
+
+    sp = terms["SP"]
+    sp_et, sp_it = sp if isinstance(sp, tuple) else (sp, sp)
+    SP_ET, SP_IT = sp_et * NP["ET"], sp_it * NP["IT"]
+    UPD = terms["UPD"]
+
+    if vehicle in PASSENGER_TIME:
+        numerator = np.asarray(PASSENGER_TIME[vehicle])[lanes]
+        PT = numerator / (UPD if vehicle == "buses" else V)
+    else:
+        PT = 0.0
+    CHC = np.asarray(COMMODITY_HOLDING[vehicle])[lanes] / UPD if vehicle in COMMODITY_HOLDING else 0.0
+
+    columns = {
+        "velocity": V,
+        "petrol": terms["petrol"], "diesel": terms["diesel"],
+        "SP_ET": SP_ET / 100, "SP_IT": SP_IT / 100,
+        "ML": terms["ML_factor"] * SP_ET / 100,
+        "TL": terms["TL"], "EOL": terms["EOL"], "OL": terms["OL"], "G": terms["G"],
+        "FXC_ET": terms["FXC"][0] / UPD, "FXC_IT": terms["FXC"][1] / UPD,
+        "DC_ET": terms["DC"][0] / UPD, "DC_IT": terms["DC"][1] / UPD,
+        "PT": PT, "crew": terms["crew"], "CHC": CHC,
+        "UPD": UPD,
+    }
+    # Non-negative values, broadcast to one entry per road link
+    return {name: np.maximum(np.broadcast_to(value, lanes.shape), 0.0) for name, value in columns.items()}
+
+
+def compute_voc_arrays(conditions: Dict[str, Any],
+                       vehicle_types: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    VOC of every vehicle type over arrays of road conditions.
+
+    Args:
+        conditions: Same keys as the vehicle input of voc.core.main, with
+            arrays (or scalars, which broadcast) instead of single values:
+            rg_roughness_factor, fl_fall_factor, rs_rise_factor, lane_type
+            (names or codes), carriageway_width (expressways only; other lanes
+            use the standard width), power_weight_ratio_pwr and optionally
+            rf_rise_and_fall_factor (defaults to rise + fall).
+        vehicle_types: Vehicle types to evaluate, default all
+
+    Returns:
+        Vehicle type -> {VOC_COLUMNS -> ndarray with one entry per road link}
+    """
+    try:
+        RG = np.asarray(conditions["rg_roughness_factor"], dtype=float)
+        FL = np.asarray(conditions["fl_fall_factor"], dtype=float)
+        RS = np.asarray(conditions["rs_rise_factor"], dtype=float)
+        lane_type = conditions["lane_type"]
+    except KeyError as e:
+        raise ValueError(f"Missing VOC input: {e}")
+    RF = conditions.get("rf_rise_and_fall_factor")
+    RF = FL + RS if RF is None else np.asarray(RF, dtype=float)
+
+    lanes = lane_codes(lane_type)
+    shape = np.broadcast_shapes(lanes.shape, RG.shape, FL.shape, RS.shape, RF.shape)
+    lanes = np.broadcast_to(lanes, shape)
+    W = carriageway_widths(lanes, conditions.get("carriageway_width"))
+
+    pwr = conditions.get("power_weight_ratio_pwr")
+    vehicles = vehicle_type_list if vehicle_types is None else list(vehicle_types)
+    return {vehicle: compute_vehicle_arrays(vehicle, lanes, W, RG, FL, RS, RF, pwr) for vehicle in vehicles}
@@ -1,15 +1,15 @@
 from typing import Dict, Any, TypedDict
-import IRC_standards.IRCSP30_2019
-from voc.utils.output_builder import build_voc_output
-from voc.utils.pre_processor import VehicleInput, extract_vehicle_inputs
+from osbridgelcca.desktop_app.widgets.utils.core.IRC_standards import IRCSP30_2019
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.output_builder import VOCRecord, build_voc_record
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.pre_processor import VehicleInput, extract_vehicle_inputs
 
 
 Vehicle = "big_cars"
 
 
-def compute_voc(vehicle_input: VehicleInput) -> Dict[str, Any]:
+def compute_voc(vehicle_input: VehicleInput) -> VOCRecord:
     vt, W, RG, FL, RS, lane, RF = extract_vehicle_inputs(vehicle_input)
-    NP: Dict[str, int] = IRC_standards.IRCSP30_2019.vehicle_costs[Vehicle]
+    NP: Dict[str, int] = IRCSP30_2019.vehicle_costs[Vehicle]
 
     if vt == Vehicle:
         # -----------------------------
@@ -88,7 +88,7 @@ def compute_voc(vehicle_input: VehicleInput) -> Dict[str, Any]:
         # -----------------------------
         # BUILD FINAL OUTPUT
         # -----------------------------
-        return build_voc_output(
+        return build_voc_record(
             vt=vt, lane=lane,
             velocity=V,
             petrol=petrol, diesel=diesel,
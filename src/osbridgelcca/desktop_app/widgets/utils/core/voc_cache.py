@@ -0,0 +1,165 @@
+"""
+Memoization of calc_voc.
+
+Results are keyed by a canonical fingerprint of everything the VOC depends
+on: the traffic per vehicle type, road roughness, rise and fall, lane type,
+carriageway width, power to weight ratios, the WPI (year and values) and the
+volume to capacity ratio. A bounded LRU keeps recent results in memory; an
+optional directory adds a persistent tier shared between sessions.
+
+Example:
+    cache = VOCCache(maxsize=256, directory="~/.osbridgelcca/voc_cache")
+    calc_voc(inputs, wpi, cache=cache)
+    cache.stats()   # {"hits": ..., "disk_hits": ..., "misses": ..., ...}
+"""
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Inputs of calc_voc that enter the fingerprint
+FINGERPRINT_KEYS = ("vehicle_info", "rg_roughness_factor", "fl_fall_factor", "rs_rise_factor", "lane_type",
+                    "carriageway_width", "power_weight_ratio_pwr")
+
+
+def _canonical(value):
+    """JSON-ready form in which equal inputs compare equal (2000 == 2000.0)."""
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if hasattr(value, "tolist"):
+        # NumPy arrays and scalars; str() of an array elides long arrays
+        return _canonical(value.tolist())
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def fingerprint(inputs: Dict[str, Any], all_wpi: Dict[str, Any], vc: Optional[float] = None, **options) -> str:
+    """
+    SHA-256 of the canonical VOC inputs, WPI and v/c ratio.
+
+    options are further arguments the result depends on (e.g. the years of
+    calc_annual_voc); they only enter the fingerprint when given.
+    """
+    payload = {
+        "inputs": {key: _canonical(inputs.get(key)) for key in FINGERPRINT_KEYS},
+        "wpi": _canonical(all_wpi),
+        "vc": _canonical(vc),
+    }
+    if options:
+        payload["options"] = _canonical(options)
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class VOCCache:
+    """
+    Size-bounded LRU of calc_voc results with an optional on-disk tier.
+
+    Values are deep-copied in and out, so callers may modify what they get.
+    Lookups and stores are serialised by a lock, so background workers can
+    share one cache with the UI thread.
+    """
+
+    def __init__(self, maxsize: int = 128, directory: Optional[str] = None):
+        """
+        Args:
+            maxsize: Number of results kept in memory (0 disables the memory tier)
+            directory: Folder for the persistent tier (one JSON file per
+                result); None keeps the cache in memory only
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        self.maxsize = int(maxsize)
+        self.directory = None if directory is None else os.path.expanduser(directory)
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _remember(self, key, value):
+        if self.maxsize == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str):
+        """Cached result for `key` or None; counts a hit or a miss."""
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(self._entries[key])
+        if self.directory is not None:
+            try:
+                with open(self._path(key), encoding="utf-8") as file:
+                    value = json.load(file)
+            except (OSError, ValueError):
+                value = None
+            if value is not None:
+                self._remember(key, value)
+                self.disk_hits += 1
+                return copy.deepcopy(value)
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """Store a result in memory and, if configured, on disk."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+        if self.directory is not None:
+            # Write to a temporary file first so readers never see a partial entry
+            handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as file:
+                    json.dump(value, file)
+                os.replace(temp_path, self._path(key))
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    def clear(self, disk: bool = False):
+        """Empty the memory tier (and the disk tier if `disk`) and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the hit rate over all lookups."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
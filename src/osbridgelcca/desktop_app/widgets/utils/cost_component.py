@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 import os
-import sqlite3
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
+from osbridgelcca.core.present_worth import present_worth_factor, single_present_worth_factor
 
 class CostComponent(ABC):
     """Abstract Base Class for different cost components in Life Cycle Cost Analysis."""
@@ -70,9 +70,7 @@ class RoutineInspectionCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        print(type(frequency),type(design_life))
-        
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life)
         return init_construction_cost * self.present_worth_factor * cost
 
 class PeriodicMaintenanceCost:
@@ -88,7 +86,7 @@ class PeriodicMaintenanceCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life)
         return init_construction_cost * self.present_worth_factor * cost
 
 class MajorInspectionCost:
@@ -103,7 +101,7 @@ class MajorInspectionCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life)
         return init_construction_cost * self.present_worth_factor * cost
 
 class MajorRepairCost:
@@ -118,7 +116,7 @@ class MajorRepairCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life)
         return init_construction_cost * self.present_worth_factor * cost
     
 class BearingAndExpansionJointReplacementCost:
@@ -133,7 +131,7 @@ class BearingAndExpansionJointReplacementCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life)
         return total_superstructure_cost * self.present_worth_factor * cost
 
 class PeriodicMaintenanceCarbonCost:
@@ -149,7 +147,7 @@ class PeriodicMaintenanceCarbonCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life)
         return total_carbon_emission_cost * self.present_worth_factor * cost
 
 class MajorRepairRelCarbonEmissionCost:
@@ -164,7 +162,7 @@ class MajorRepairRelCarbonEmissionCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life)
         return total_carbon_emission_cost * self.present_worth_factor * cost
 
 class CarbonEmissionDueToRerouting:
@@ -183,7 +181,7 @@ class CarbonEmissionDueToRerouting:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(repair_freq, design_life, repair_freq))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, repair_freq, design_life)
         return total_traffic * duration_major_repair * working_days_month * scc * co2_emission_per_km * self.present_worth_factor * additional_rerouting_dist
 
 class DemolitionCost:
@@ -198,7 +196,7 @@ class DemolitionCost:
                              inflation_rate:float,
                              discount_rate:float) -> float:
 
-        self.present_worth_factor = ((1 + inflation_rate) / (1 + discount_rate)) ** analysis_period                   
+        self.present_worth_factor = single_present_worth_factor(inflation_rate, discount_rate, analysis_period)                   
         return init_constr_cost * self.present_worth_factor * demolition_disposal_cost
 
 class DemolitionCarbonCost:
@@ -212,7 +210,7 @@ class DemolitionCarbonCost:
                              inflation_rate:float,
                              discount_rate:float) -> float:
                              
-        self.present_worth_factor = ((1 + inflation_rate) / (1 + discount_rate)) ** analysis_period                   
+        self.present_worth_factor = single_present_worth_factor(inflation_rate, discount_rate, analysis_period)                   
         return init_carbon_emission_cost * self.present_worth_factor * demolition_disposal_cost
 
 class DemolitionCarbonReroutingCost:
@@ -231,7 +229,7 @@ class DemolitionCarbonReroutingCost:
                              inflation_rate:float,
                              discount_rate:float) -> float:
 
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(analysis_period, design_life, analysis_period))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, analysis_period, design_life)
         return init_constr_cost * self.present_worth_factor * demolition_disposal_time * working_days_month * scc * co2_emission_per_km * additional_rerouting_dist
 
 class RecyclingCost:
@@ -248,7 +246,7 @@ class RecyclingCost:
                              inflation_rate:float,
                              discount_rate:float) -> float:
 
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(analysis_period, design_life, analysis_period))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, analysis_period, design_life)
         return material_scrap_rate * material_recyclability * total_material_cost * self.present_worth_factor
 
 class RoadUserCost(CostComponent):
@@ -353,6 +351,9 @@ class UserInputs:
 
 
 if __name__ == "__main__":
+    from osbridgelcca.desktop_app.widgets.utils.data import ROAD_LANE_TYPE, VOC_VEHICLE_TYPE
+    from osbridgelcca.desktop_app.widgets.utils.core.main import vehicle_input, voc_grid, wpi
+    from osbridgelcca.core.cost_registry import CostRegistry
 
     # === USER INPUTS (all overridable parameters grouped) ===
     inputs = UserInputs()
@@ -382,14 +383,10 @@ if __name__ == "__main__":
     scrap_value = inputs.scrap_value
     scrap_rate = inputs.scrap_rate
 
-    # 1. Initial Construction Cost Calculation
-    total_initial_construction_cost = 0
-    for item in user_materials:
-        component = InitialConstructionCost(
-            quantity=item["quantity"],
-            rate=item["rate"]
-        )
-        total_initial_construction_cost += component.calculate_cost()
+    # 1. Initial Construction Cost Calculation (one registry row per BOQ item)
+    registry = CostRegistry.from_columns(quantity=[item["quantity"] for item in user_materials],
+                                         rate=[item["rate"] for item in user_materials])
+    total_initial_construction_cost = registry.total(is_initial=True)
     print("Total Initial Construction Cost:", total_initial_construction_cost)  # INR
 
     # 2. Initial Carbon Emission Cost Calculation (Concrete + Steel)
@@ -426,39 +423,32 @@ if __name__ == "__main__":
     # 4. Road User Cost Calculation
 
     total_vehicles_affected = sum(v["Count"] for v in road_user_inputs["Vehicles"])
-    
-    # Use a relative path for the database
-    db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'databases', 'IRC_Road_Costs.db')
-    db_path = os.path.abspath(db_path)
+
+    # Per-km VOC from the shared lookup grid of the WPI year (see core.main.voc_grid)
+    grid = voc_grid(wpi, vehicle_input["power_weight_ratio_pwr"])
 
     total_road_user_cost = 0
     # construction_time and reroute_distance are now shared variables
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        table_name = cursor.fetchone()[0]
-        for vehicle in road_user_inputs["Vehicles"]:
-            vehicle_type = vehicle["Vehicle_Type"]
-            count = vehicle["Count"]
-            lane_type = road_user_inputs["Lane_Type"]
-            roughness = road_user_inputs["Roughness"]
-            rf = road_user_inputs["RF"]
-            cursor.execute(f'''
-                SELECT Grand_Cost FROM {table_name} WHERE 
-                    Vehicle_Type = ? AND Lane_Type = ? AND Roughness = ? AND RF = ?
-            ''', (vehicle_type, lane_type, roughness, rf))
-            result = cursor.fetchone()
-            if result:
-                grand_cost = result[0]
-                ct = construction_time * reroute_distance
-                road_user_cost_component = RoadUserCost(
-                    vehicles_affected=count,
-                    vehicle_operation_cost=grand_cost,
-                    construction_time=ct
-                )
-                total_road_user_cost += road_user_cost_component.calculate_cost()
-            else:
-                print(f"No Grand_Cost found for {vehicle_type}, {lane_type}, {roughness}, {rf}")
+    for vehicle in road_user_inputs["Vehicles"]:
+        vehicle_type = vehicle["Vehicle_Type"]
+        count = vehicle["Count"]
+        lane_type = road_user_inputs["Lane_Type"]
+        roughness = road_user_inputs["Roughness"]
+        rf = road_user_inputs["RF"]
+        try:
+            grand_cost = grid.lookup(VOC_VEHICLE_TYPE.get(vehicle_type, vehicle_type.lower().replace(" ", "_")),
+                                     ROAD_LANE_TYPE.get(lane_type, lane_type), wpi["year"],
+                                     roughness=roughness, rise_fall=rf, basis="ET")
+        except ValueError as e:
+            print(f"No Grand_Cost found for {vehicle_type}, {lane_type}, {roughness}, {rf}: {e}")
+            continue
+        ct = construction_time * reroute_distance
+        road_user_cost_component = RoadUserCost(
+            vehicles_affected=count,
+            vehicle_operation_cost=grand_cost,
+            construction_time=ct
+        )
+        total_road_user_cost += road_user_cost_component.calculate_cost()
     print("Total Road User Cost:", total_road_user_cost)  # INR
     
 
@@ -1,3 +1,5 @@
+import osbridgelcca.desktop_app.widgets.utils.core.voc.utils.constants as _voc_constants
+
 # WPI Calculation
 BASE_YEAR = 2019
 KEY_PASSENGER_COST = "Passenger Cost"
@@ -92,6 +94,7 @@ COST_TOTAL_INIT_CARBON_EMISSION = "Total Initial Carbon Emission Cost"
 COST_TIME = "Time Cost"
 COST_CARBON_EMISSION_REROUTING_INIT = "Carbon Emission due to Rerouting during Initial Construction"
 COST_TOTAL_ROAD_USER = "Total Road User Cost"
+COST_REROUTING_VOC = "Vehicle Operating Cost due to Rerouting"
 COST_ADDITIONAL_CARBON_EMISSION = "Additional Carbon Emission Cost"
 COST_PERIODIC_MAINTAINANCE = "Periodic Maintenance Cost"
 COST_MAJOR_INSPECTION = "Major Inspection Cost"
@@ -100,6 +103,7 @@ COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION = "Periodic Maintenance Carbon Emissi
 COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION = "Major Repair Related Carbon Emisson Cost"
 COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR = "Carbon Emission due to rerouting during Major Repairs"
 COST_CARBON_EMISSION_RR_DURING_REPLACEMENT = "Carbon Emission due to rerouting during Replacement"
+COST_BEARING_EXP_JOINT_REPLACEMENT = "Replacement cost of Bearing and Expansion Joints"
 COST_DEMOLITION_DISPOSAL_CARBON = "Demolition and Disposal related Carbon Emission"
 COST_DEMOLITION_DISPOSAL_CARBON_REROUTING = "Carbon Emission due to Rerouting during Demolition and Disposal"
 COST_TOTAL_ROUTINE_INSPECTION = "Total Routine Inspection Cost"
@@ -107,6 +111,33 @@ COST_REPAIR_REHAB = "Repair and Rehabilitation Cost"
 COST_DEMOLITION_DISPOSAL = "Demolition and Disposal Cost"
 COST_RECYCLING = "Recycling Cost"
 COST_RECONSTRUCTION = "Reconstruction Cost"
+COST_VOT = "Value of Travel Time Cost"
+COST_ACCIDENT = "Accident Related Cost"
+COST_TOTAL_LCC = "Total Life Cycle Cost"
+
+# Result heads of core.lcc_kernel mapped to the cost keys above
+KERNEL_HEAD_KEYS = {
+    "initial_construction": COST_TOTAL_INIT_CONST,
+    "initial_carbon_emission": COST_TOTAL_INIT_CARBON_EMISSION,
+    "time_cost": COST_TIME,
+    "rerouting_carbon_initial": COST_CARBON_EMISSION_REROUTING_INIT,
+    "routine_inspection": COST_TOTAL_ROUTINE_INSPECTION,
+    "periodic_maintenance": COST_PERIODIC_MAINTAINANCE,
+    "periodic_maintenance_carbon": COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION,
+    "major_inspection": COST_MAJOR_INSPECTION,
+    "major_repair": COST_MAJOR_REPAIR,
+    "major_repair_carbon": COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION,
+    "rerouting_carbon_major_repair": COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR,
+    "bearing_joint_replacement": COST_BEARING_EXP_JOINT_REPLACEMENT,
+    "rerouting_carbon_replacement": COST_CARBON_EMISSION_RR_DURING_REPLACEMENT,
+    "demolition_disposal": COST_DEMOLITION_DISPOSAL,
+    "demolition_disposal_carbon": COST_DEMOLITION_DISPOSAL_CARBON,
+    "demolition_disposal_rerouting_carbon": COST_DEMOLITION_DISPOSAL_CARBON_REROUTING,
+    "recycling": COST_RECYCLING,
+    "value_of_time": COST_VOT,
+    "accident": COST_ACCIDENT,
+    "total_lcc": COST_TOTAL_LCC,
+}
 
 # Keys for Carbon Emission Cost Data
 KEY_SCC = "Social Cost of Carbon"
@@ -159,6 +190,39 @@ KEY_ROAD_RISE = "Road Rise"
 KEY_ROAD_FALL = "Road Fall"
 KEY_ROAD_TYPE = "Type of Road"
 KEY_CRASH_RATE = "Crash Rate"
+KEY_TRAFFIC_GROWTH_RATE = "Annual Traffic Growth Rate"
+
+# Lane type of the VOC models for each alternate road carriageway
+ROAD_LANE_TYPE = {
+    KEY_SINGLE_LANE_ROAD: "SL",
+    KEY_INTERMEDIATE_LANE_ROAD: "IL",
+    KEY_TWO_LANE_ROAD: "2L",
+    KEY_FOUR_LANE_DIVIDED_ROAD: "4L",
+    KEY_SIX_LANE_DIVIDED_ROAD: "6L",
+    KEY_FOUR_LANE_DIVIDED_EXPRESSWAY: "4L",
+    KEY_SIX_LANE_DIVIDED_EXPRESSWAY: "6L",
+    KEY_EIGHT_LANE_DIVIDED_URBAN_EXPRESSWAY: "8L",
+}
+
+# Vehicle type of the VOC models for each vehicle class (buses are combined)
+VOC_VEHICLE_TYPE = {
+    KEY_TWO_WHEELER: "two_wheelers",
+    KEY_SMALL_CARS: "small_cars",
+    KEY_BIG_CARS: "big_cars",
+    KEY_ORDINARY_BUS: "buses",
+    KEY_DELUXE_BUS: "buses",
+    KEY_LCV: "lcv",
+    KEY_HCV: "hcv",
+    KEY_MCV: "mcv",
+}
+
+# Capacity of the alternate road (PCU/day, both directions) at which the
+# projected traffic saturates, from the lane capacities of the VOC models
+ROAD_CAPACITY_PCU_PER_DAY = {road: _voc_constants.lane_capacity_pcu_per_day[lane_type]
+                             for road, lane_type in ROAD_LANE_TYPE.items()}
+
+# Passenger car units per vehicle class, from the VOC models
+VEHICLE_PCU = {vehicle: _voc_constants.pcu[voc_type] for vehicle, voc_type in VOC_VEHICLE_TYPE.items()}
 
 
 construction_materials = {
@@ -1,18 +1,50 @@
 import sqlite3
-from typing import List, Dict, Tuple
-from osbridgelcca.desktop_app.widgets.utils.cost_component import ( BearingAndExpansionJointReplacementCost, CarbonEmissionDueToRerouting, DemolitionCarbonCost, DemolitionCarbonReroutingCost,
-                                InitialConstructionCost, MajorInspectionCost, MajorRepairCost,
-                                MajorRepairRelCarbonEmissionCost, TimeCost, RoadUserCost,
-                                AdditionalCarbonEmissionCost, PeriodicMaintenanceCost,
-                                RoutineInspectionCost, RepairAndRehabilitationCost, 
-                                DemolitionCost, RecyclingCost, ReconstructionCost,
-                                PeriodicMaintenanceCarbonCost
-)
+import numpy as np
+from typing import Callable, Iterator, List, Dict, Set, Tuple
+from osbridgelcca.desktop_app.widgets.utils.cost_component import RepairAndRehabilitationCost
 from osbridgelcca.desktop_app.widgets.utils.data import *
 from osbridgelcca.desktop_app.widgets.utils.IRC_SP_30 import IRC_SP_30
+from osbridgelcca.desktop_app.widgets.utils.standards_store import DEFAULT_EDITION, default_store
+from osbridgelcca.desktop_app.widgets.utils.dependency_graph import DependencyGraph, TrackedInput
+from osbridgelcca.core.cash_flow import CashFlowTimeline, event_schedule, repeat_cycles
+from osbridgelcca.core import accident_cost, lcc_kernel
+from osbridgelcca.core.traffic_projection import discounted_mean, growth_factors, period_mean, project_adt
+
+# Input sources of the dependency graph (input dictionaries and tables)
+SRC_FINANCIAL = "financial_data"
+SRC_CARBON_COST = "carbon_emission_cost_data"
+SRC_DAILY_TRAFFIC = "daily_average_traffic_data"
+SRC_MAINTENANCE = "maintainance_and_repair_data"
+SRC_DEMOLITION = "demolition_and_recycling_data"
+SRC_TRAFFIC = "traffic_data"
+SRC_ACCIDENT_DIST = "accident_distribution"
+SRC_VEHICLE_DIST = "vehicle_distribution"
+TABLE_COMPONENT = "component"
+TABLE_CARBON_EMISSION = "carbon_emission"
+# Standards edition and WPI year (see set_standards)
+SRC_STANDARDS = "standards"
+# Inputs with a default that a cost head may be computed without
+OPTIONAL_INPUTS = {(SRC_TRAFFIC, KEY_TRAFFIC_GROWTH_RATE)}
+# Injury and vehicle categories of the accident cost
+ACCIDENT_CATEGORIES = (KEY_MINOR_INJURY, KEY_MAJOR_INJURY, KEY_FATAL)
+DAMAGE_CATEGORIES = (KEY_TWO_WHEELER, KEY_SMALL_CARS, KEY_BIG_CARS, KEY_ORDINARY_BUS, KEY_DELUXE_BUS,
+                     KEY_LCV, KEY_HCV, KEY_MCV)
+# Cost head -> name of the head in core.lcc_kernel
+KERNEL_HEAD_NAMES = {head: name for name, head in KERNEL_HEAD_KEYS.items()}
 
 class DatabaseManager:
     """Database manager for Structure Works Data"""
+
+    # UI inputs. Assigning a new dictionary invalidates only the cost heads
+    # reading a changed key; see refresh().
+    financial_data = TrackedInput()
+    carbon_emission_cost_data = TrackedInput()
+    daily_average_traffic_data = TrackedInput()
+    maintainance_and_repair_data = TrackedInput()
+    demolition_and_recycling_data = TrackedInput()
+    traffic_data = TrackedInput()
+    accident_distribution = TrackedInput()
+    vehicle_distribution = TrackedInput()
     
     def __init__(self, db_path: str = "widgets/utils/structure_works.db", recreate: bool = True):
         """
@@ -23,8 +55,18 @@ class DatabaseManager:
             recreate: If True, delete existing database and create fresh. If False, use existing database.
         """
 
-        # Instantiate IRC_SP_30
-        self.irc_sp_30 = IRC_SP_30()
+        # Instantiate IRC_SP_30, WPI adjusted to the latest year of the edition
+        self.standards_edition = DEFAULT_EDITION
+        self.irc_sp_30 = IRC_SP_30(self.standards_edition)
+        self.wpi_year = self.wpi_years()[-1]
+
+        # Cost heads with their inputs, and memoized table reads
+        self.graph = DependencyGraph()
+        self._query_cache = {}
+        # Heads refresh() leaves to a background worker, and callbacks told
+        # which heads an input change made dirty (see add_input_listener)
+        self.background_heads: Set[str] = set()
+        self._input_listeners: List[Callable[[Set[str]], None]] = []
 
         self.db_path = db_path
         self.conn = None
@@ -115,7 +157,11 @@ class DatabaseManager:
         }
 
         # Some Constants
+        # Flat kg CO2e per vehicle-km, used for rerouting when there is no traffic mix
+        # to derive it from (see rerouting_emission_factor)
         self.CO2_EMISSION_PER_KM = 0.1213
+        # Traffic scenarios whose rerouting emission factor is kept
+        self.EMISSION_FACTOR_CACHE_SIZE = 8
         self.WORKING_DAYS_IN_MONTH = 26
         # Duration of Major Repairs (Month)
         self.DURATION_MAJOR_REPAIRS = 3
@@ -123,6 +169,8 @@ class DatabaseManager:
         self.DURATION_REPLACEMENT = 2/self.WORKING_DAYS_IN_MONTH
         # Duration of Demolition and Disposal (Month)
         self.DURATION_DEMOLITION_DISPOSAL = 2
+
+        self._register_cost_nodes()
     
     def create_database(self, recreate: bool = True):
         """
@@ -133,11 +181,14 @@ class DatabaseManager:
         """
         import os
         
+        in_memory = self.db_path == ":memory:"
+
         # Ensure directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        if not in_memory and os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         # Delete existing database if recreate is True
-        if recreate and os.path.exists(self.db_path):
+        if recreate and not in_memory and os.path.exists(self.db_path):
             try:
                 os.remove(self.db_path)
                 print(f"Deleted existing database: {self.db_path}")
@@ -210,8 +261,15 @@ class DatabaseManager:
                 PRIMARY KEY (type_material, grade, unit)
             )
         ''')
+
+        # Indexes for the cost aggregation queries
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_component_comp_id ON component(comp_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_component_type_material ON component(type_material)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_struct_works_type ON struct_works_data(type)')
         
         self.conn.commit()
+        self._invalidate_table(TABLE_COMPONENT)
+        self._invalidate_table(TABLE_CARBON_EMISSION)
     
     def insert_structure_work(self, work_type: str, component_type: str) -> int:
         """
@@ -233,6 +291,7 @@ class DatabaseManager:
         
         comp_id = cursor.lastrowid
         self.conn.commit()
+        self._invalidate_table(TABLE_COMPONENT)
         return comp_id
     
     def insert_component(self, comp_id: int, type_material: str, grade: str, 
@@ -261,6 +320,7 @@ class DatabaseManager:
         
         component_id = cursor.lastrowid
         self.conn.commit()
+        self._invalidate_table(TABLE_COMPONENT)
         return component_id
     
     def input_data_row(self, work_type: str, rows_data: List[Dict]) -> List[int]:
@@ -348,12 +408,14 @@ class DatabaseManager:
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM struct_works_data WHERE comp_id = ?', (comp_id,))
         self.conn.commit()
+        self._invalidate_table(TABLE_COMPONENT)
     
     def delete_component(self, component_id: int):
         """Delete a specific component by its ID"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM component WHERE comp_id = ?', (component_id,))
         self.conn.commit()
+        self._invalidate_table(TABLE_COMPONENT)
 
     def get_all_materials_info(self) -> List[Dict]:
         """
@@ -365,7 +427,13 @@ class DatabaseManager:
             - grade: The grade of the material
             - quantity: The quantity used
             - unit: The unit of measurement
+
+            The rows are copies of a memoized read; changing them does not
+            affect later calls.
         """
+        if "materials" in self._query_cache:
+            return [dict(item) for item in self._query_cache["materials"]]
+
         cursor = self.conn.cursor()
         cursor.execute('''
             SELECT type_material, grade, quantity, unit, rate
@@ -384,7 +452,8 @@ class DatabaseManager:
             }
             results.append(material_info)
         
-        return results
+        self._query_cache["materials"] = results
+        return [dict(item) for item in results]
     
     def get_all_superstructures_data(self) -> List[Dict]:
         """
@@ -397,15 +466,19 @@ class DatabaseManager:
             - grade: The grade of the material
             - quantity: The quantity used
             - unit: The unit of measurement
+
+            The rows are copies of a memoized read; changing them does not
+            affect later calls.
         """
+        if "superstructures" in self._query_cache:
+            return [dict(item) for item in self._query_cache["superstructures"]]
+
         cursor = self.conn.cursor()
         cursor.execute('''
-            SELECT comp_id, type_material, grade, quantity, unit, rate
-            FROM component
-            WHERE comp_id IN
-            (SELECT comp_id
-             FROM struct_works_data
-             WHERE type = ?);
+            SELECT c.comp_id, c.type_material, c.grade, c.quantity, c.unit, c.rate
+            FROM component c
+            JOIN struct_works_data s ON s.comp_id = c.comp_id
+            WHERE s.type = ?
         ''', (KEY_SUPERSTRUCTURE,))
         
         results = []
@@ -419,7 +492,43 @@ class DatabaseManager:
             }
             results.append(material_info)
         
-        return results
+        self._query_cache["superstructures"] = results
+        return [dict(item) for item in results]
+
+    def get_cost_totals(self) -> Dict[Tuple[str, str, str], float]:
+        """
+        SUM(quantity * rate) of the component table grouped by work type,
+        material and grade, computed by SQLite in a single pass.
+
+        Returns:
+            Dictionary keyed by (work_type, type_material, grade). work_type is
+            None for components without a structure work entry.
+        """
+        if "cost_totals" in self._query_cache:
+            return dict(self._query_cache["cost_totals"])
+
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT s.type, c.type_material, c.grade, SUM(c.quantity * c.rate)
+            FROM component c
+            LEFT JOIN struct_works_data s ON s.comp_id = c.comp_id
+            GROUP BY s.type, c.type_material, c.grade
+        ''')
+        totals = {(row[0], row[1], row[2]): row[3] or 0.0 for row in cursor.fetchall()}
+        self._query_cache["cost_totals"] = totals
+        return dict(totals)
+
+    def get_total_cost(self, work_type: str = None, type_material: str = None) -> float:
+        """
+        Total cost of the component table, optionally filtered by work type and/or material
+
+        Args:
+            work_type: e.g. KEY_SUPERSTRUCTURE. None includes every work type.
+            type_material: e.g. "Steel Rebar". None includes every material.
+        """
+        return sum(cost for (row_work_type, row_material, _), cost in self.get_cost_totals().items()
+                   if (work_type is None or row_work_type == work_type)
+                   and (type_material is None or row_material == type_material))
 
     def get_unique_materials_and_grades(self) -> List[List[str]]:
         """
@@ -479,6 +588,7 @@ class DatabaseManager:
             # Execute batch insert
             cursor.executemany(insert_query, records)
             self.conn.commit()
+            self._invalidate_table(TABLE_CARBON_EMISSION)
             
             print(f"Successfully inserted {len(records)} records")
             return True
@@ -492,6 +602,9 @@ class DatabaseManager:
             return False
     
     def get_carbon_emission_data(self) -> List[Dict]:        
+        if "carbon_emission" in self._query_cache:
+            return [dict(item) for item in self._query_cache["carbon_emission"]]
+
         cursor = self.conn.cursor()
         cursor.execute('''
             SELECT type_material, unit, quantity, emission_factor
@@ -508,33 +621,201 @@ class DatabaseManager:
                 KEY_CARBON_EMISSION_FACTOR: row[3]
             }
             results.append(material_info)
-        return results
+        self._query_cache["carbon_emission"] = results
+        return [dict(item) for item in results]
 
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
 
+    #========================Dependency-Graph========================
+
+    def _invalidate_table(self, table: str):
+        """Drop memoized reads of a table and mark the cost heads using it dirty"""
+        if table == TABLE_COMPONENT:
+            self._query_cache.pop("materials", None)
+            self._query_cache.pop("superstructures", None)
+            self._query_cache.pop("cost_totals", None)
+        elif table == TABLE_CARBON_EMISSION:
+            self._query_cache.pop("carbon_emission", None)
+        self._notify(self.graph.invalidate(table))
+
+    def _on_input_changed(self, source: str, keys):
+        self._notify(self.graph.invalidate(source, keys))
+
+    def _notify(self, affected: Set[str]):
+        if affected:
+            for listener in list(self._input_listeners):
+                listener(affected)
+
+    def add_input_listener(self, listener: Callable[[Set[str]], None]):
+        """Call `listener(affected_heads)` whenever an input change makes cost heads dirty"""
+        self._input_listeners.append(listener)
+
+    def remove_input_listener(self, listener: Callable[[Set[str]], None]):
+        if listener in self._input_listeners:
+            self._input_listeners.remove(listener)
+
+    def invalidate_input(self, source: str, keys: List[str] = None):
+        """
+        Mark the cost heads reading an input dirty after it was edited in place,
+        e.g. dm.financial_data[KEY_DESIGN_LIFE] = 60.
+
+        Args:
+            source: Name of the input dictionary (e.g. "financial_data")
+            keys: Edited keys; None invalidates every reader of the source
+        """
+        self._notify(self.graph.invalidate(source, keys))
+
+    def wpi_years(self, edition: str = None) -> List[int]:
+        """Years with WPI values in a standards edition (default: the current one)"""
+        return default_store().wpi_years(edition or self.standards_edition, TABLE_VOT)
+
+    def set_standards(self, edition: str = None, wpi_year: int = None):
+        """
+        Select the standards edition and the year its costs are WPI adjusted to.
+
+        Changing the edition without a wpi_year moves to its latest WPI year.
+        A year beyond the WPI tables is projected by their fitted trend (see
+        wpi_projection). The road user cost heads are marked dirty.
+
+        Args:
+            edition: Edition in the standards store, e.g. "IRC SP-30:2019"
+            wpi_year: Year the costs are adjusted to
+        """
+        if edition is not None and edition != self.standards_edition:
+            self.irc_sp_30 = IRC_SP_30(edition)
+            self.standards_edition = edition
+            if wpi_year is None:
+                wpi_year = self.wpi_years()[-1]
+        if wpi_year is not None:
+            if int(wpi_year) != wpi_year:
+                raise ValueError(f"wpi_year must be a whole year. Provided: {wpi_year}")
+            self.wpi_year = int(wpi_year)
+        self._notify(self.graph.invalidate(SRC_STANDARDS))
+
+    def _register_cost_nodes(self):
+        """Declare every cost head with the inputs it is computed from"""
+        fin = lambda *keys: [(SRC_FINANCIAL, key) for key in keys]
+        maint = lambda *keys: [(SRC_MAINTENANCE, key) for key in keys]
+        scc = [(SRC_CARBON_COST, KEY_SCC)]
+        growth = [(SRC_TRAFFIC, KEY_TRAFFIC_GROWTH_RATE), (SRC_TRAFFIC, KEY_ALTER_ROAD_CARRIAGEWAY)]
+        rerouting = [(SRC_DAILY_TRAFFIC, None), (SRC_TRAFFIC, KEY_ADDIT_REROUTING_DISTANCE)] + growth + scc
+        fuel = [(SRC_DAILY_TRAFFIC, None), (SRC_TRAFFIC, KEY_ALTER_ROAD_CARRIAGEWAY)]
+        discounting = fin(KEY_INFLATION_RATE, KEY_DISCOUNT_RATE_IA, KEY_DESIGN_LIFE)
+        end_of_life = fin(KEY_INFLATION_RATE, KEY_DISCOUNT_RATE_IA, KEY_ANALYSIS_PERIOD)
+
+        nodes = [
+            # Initial stage
+            (COST_TOTAL_INIT_CONST, self.calculate_total_initial_cost, [(TABLE_COMPONENT, None)]),
+            (COST_TOTAL_SUPERSTRUCTURE, self._calculate_superstructure_cost, [(TABLE_COMPONENT, None)]),
+            (COST_TOTAL_INIT_CARBON_EMISSION, self.carbon_emission_cost,
+             [(TABLE_CARBON_EMISSION, None), (SRC_CARBON_COST, KEY_SOURCE), (SRC_CARBON_COST, KEY_USD_T_INR)] + scc),
+            (COST_TIME, self.calculate_time_cost,
+             [COST_TOTAL_INIT_CONST] + fin(KEY_INTEREST_RATE, KEY_CONSTR_TIME, KEY_INVESTMENT_RATIO)),
+            (COST_CARBON_EMISSION_REROUTING_INIT, self.init_carbon_emission_rerouting,
+             rerouting + fin(KEY_CONSTR_TIME)),
+            # Use stage
+            (COST_TOTAL_ROUTINE_INSPECTION, self.routine_inspection_cost,
+             [COST_TOTAL_INIT_CONST] + discounting + maint(KEY_ROUTINE_INSP_COST, KEY_ROUTINE_INSP_FREQ)),
+            (COST_PERIODIC_MAINTAINANCE, self.periodic_maintainance_cost,
+             [COST_TOTAL_INIT_CONST] + discounting + maint(KEY_PERIODIC_MAINT_COST, KEY_PERIODIC_MAINT_FREQ)),
+            (COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION, self.periodic_maintainance_carbon_emission_cost,
+             [COST_TOTAL_INIT_CARBON_EMISSION] + discounting + maint(KEY_PERIODIC_MAINT_COST, KEY_PERIODIC_MAINT_FREQ)),
+            (COST_MAJOR_INSPECTION, self.major_inspection_cost,
+             [COST_TOTAL_INIT_CONST] + discounting + maint(KEY_MAJOR_INSP_COST, KEY_MAJOR_INSP_FREQ)),
+            (COST_MAJOR_REPAIR, self.major_repair_cost,
+             [COST_TOTAL_INIT_CONST] + discounting + maint(KEY_MAJOR_REPAIR_COST, KEY_MAJOR_REPAIR_FREQ)),
+            (COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION, self.major_repair_related_carbon_emission_cost,
+             [COST_TOTAL_INIT_CARBON_EMISSION] + discounting + maint(KEY_MAJOR_REPAIR_COST, KEY_MAJOR_REPAIR_FREQ)),
+            (COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR, self.carbon_emission_rerouting_during_major_repairs,
+             rerouting + discounting + maint(KEY_MAJOR_REPAIR_FREQ)),
+            (COST_BEARING_EXP_JOINT_REPLACEMENT, self.bearing_expansion_joint_replacement_cost,
+             [COST_TOTAL_SUPERSTRUCTURE] + discounting + maint(KEY_MAJOR_INSP_COST, KEY_MAJOR_REPAIR_FREQ)),
+            (COST_CARBON_EMISSION_RR_DURING_REPLACEMENT, self.carbon_emission_rerouting_during_replacement,
+             rerouting + discounting + maint(KEY_BEARING_EXP_JOINT_REPAIR_FREQ)),
+            # End of life
+            (COST_DEMOLITION_DISPOSAL, self.demolition_and_disposal_cost,
+             [COST_TOTAL_INIT_CONST, (SRC_DEMOLITION, KEY_DEMOLITION_DISPOSAL_COST)] + end_of_life),
+            (COST_DEMOLITION_DISPOSAL_CARBON, self.demolition_disposal_carbon_emission_cost,
+             [COST_TOTAL_INIT_CARBON_EMISSION, (SRC_DEMOLITION, KEY_DEMOLITION_DISPOSAL_COST)] + end_of_life),
+            (COST_DEMOLITION_DISPOSAL_CARBON_REROUTING, self.demolition_disposal_rerouting_carbon_emission_cost,
+             [COST_TOTAL_INIT_CONST, (SRC_TRAFFIC, KEY_ADDIT_REROUTING_DISTANCE)] + fuel + scc
+             + end_of_life + fin(KEY_DESIGN_LIFE)),
+            (COST_RECYCLING, self.recycling_cost,
+             [(TABLE_COMPONENT, None)] + end_of_life + fin(KEY_DESIGN_LIFE)
+             + [(SRC_DEMOLITION, key) for key in (KEY_STEEL_REBAR_SCRAP_RATE, KEY_STEEL_REBAR_RECYLABILITY,
+                                                  KEY_STRUCT_STEEL_SCRAP_RATE, KEY_STRUCT_STEEL_RECYLABILITY,
+                                                  KEY_PS_TENDONS_SCRAP_RATE, KEY_PS_TENDONS_RECYLABILITY)]),
+            # Road user
+            (COST_VOT, self.vot_per_year,
+             [(SRC_DAILY_TRAFFIC, None), (SRC_TRAFFIC, KEY_ADDIT_TRAVEL_TIME), (SRC_STANDARDS, None)]
+             + growth + fin(KEY_CONSTR_TIME)),
+            (COST_ACCIDENT, self.accident_related_cost,
+             [(SRC_DAILY_TRAFFIC, None), (SRC_TRAFFIC, KEY_CRASH_RATE), (SRC_TRAFFIC, KEY_ADDIT_REROUTING_DISTANCE),
+              (SRC_ACCIDENT_DIST, None), (SRC_VEHICLE_DIST, None), (SRC_STANDARDS, None)]
+             + growth + fin(KEY_CONSTR_TIME)),
+        ]
+        for name, compute, inputs in nodes:
+            self.graph.register(name, compute, inputs)
+
+    def _inputs_available(self, name: str) -> bool:
+        """True when every input of a cost head has been provided and its upstream heads are up to date"""
+        node = self.graph.nodes[name]
+        for parent in node.upstream:
+            if parent in self.graph.dirty or self.results.get(parent) is None:
+                return False
+        for source, key in node.sources:
+            if key is None or (source, key) in OPTIONAL_INPUTS:
+                continue
+            if (getattr(self, source, None) or {}).get(key) is None:
+                return False
+        return True
+
+    def refresh(self, heads: List[str] = None) -> Dict[str, float]:
+        """
+        Recompute the cost heads whose inputs changed since their last evaluation.
+
+        Heads whose inputs have not been entered yet stay pending and are picked
+        up by a later refresh. Clean heads are served from self.results without
+        touching the database. A full refresh skips self.background_heads; they
+        are delivered by a background worker (see road_user_worker).
+
+        Args:
+            heads: Limit the update to these heads (and what they depend on)
+
+        Returns:
+            Dictionary of the heads that were recomputed and their new values
+        """
+        updated = {}
+        for name in self.graph.pending(heads):
+            if heads is None and name in self.background_heads:
+                continue
+            if not self._inputs_available(name):
+                continue
+            value = self.graph.nodes[name].compute()
+            self.results[name] = value
+            self.graph.dirty.discard(name)
+            updated[name] = value
+        return updated
+
+    def get_result(self, head: str) -> float:
+        """Memoized value of a cost head, recomputed first if one of its inputs changed"""
+        self.refresh([head])
+        return self.results.get(head)
+
     #========================Calculations========================
 
     #=================Initial-Stage-Cost-Start===================
     # 1. Initial Cost Calculation 
     def calculate_total_initial_cost(self) -> float:
-        obj = InitialConstructionCost()
-        data = self.get_all_materials_info()
-        total_cost = 0.0
-        for item in data:
-            cost = obj.calculate_cost(
-                quantity=item.get(KEY_QUANTITY),
-                rate=item.get(KEY_RATE)
-            )
-            print(f"\nMaterial={item.get(KEY_TYPE)}\nQuantity={item.get(KEY_QUANTITY)}\nRate={item.get(KEY_RATE)}\nCost={cost}")
-            total_cost += cost
+        totals = self.get_cost_totals()
+        for (work_type, material, grade), cost in totals.items():
+            print(f"\nWork={work_type}\nMaterial={material}\nGrade={grade}\nCost={cost}")
+        total_cost = self._kernel_head(COST_TOTAL_INIT_CONST)
 
         print("\n1.Total Initial Construction Cost:", total_cost)
-
-        # Store Total Initial cost
-        self.results[COST_TOTAL_INIT_CONST] = total_cost
         return total_cost
 
     # 2. Initial Carbon Emission Cost
@@ -542,40 +823,20 @@ class DatabaseManager:
 
         # Get carbon emission data from the database
         data = self.get_carbon_emission_data()
-
-        # SCC
-        if self.carbon_emission_cost_data.get(KEY_SOURCE) == SCC_K_Ricke_et_al:
-            SCC = self.carbon_emission_cost_data.get(KEY_SCC) * self.carbon_emission_cost_data.get(KEY_USD_T_INR)
-        else:
-            SCC = self.carbon_emission_cost_data.get(KEY_SCC)
-        
-        print(f"\nSCC considered is.\nSource={self.carbon_emission_cost_data.get(KEY_SOURCE)}\nSCC={SCC}")
-
-        total_carbon_emission_cost= 0.0
+        print(f"\nSCC considered is.\nSource={self.carbon_emission_cost_data.get(KEY_SOURCE)}"
+              f"\nSCC={self.carbon_emission_cost_data.get(KEY_SCC)}")
         for item in data:
-            qty = float(item.get(KEY_QUANTITY))
-            emission_factor = float(item.get(KEY_CARBON_EMISSION_FACTOR))
-            carbon_emission_cost = (qty * emission_factor) * SCC
-            total_carbon_emission_cost += carbon_emission_cost
-            print(f"Carbon Emission Cost for {item.get(KEY_TYPE)}:", carbon_emission_cost)
-        
+            print(f"Carbon Emission for {item.get(KEY_TYPE)}:",
+                  float(item.get(KEY_QUANTITY)) * float(item.get(KEY_CARBON_EMISSION_FACTOR)))
+
+        total_carbon_emission_cost = self._kernel_head(COST_TOTAL_INIT_CARBON_EMISSION)
         print("\n2.Total Carbon Emission Cost:", total_carbon_emission_cost)
-        self.results[COST_TOTAL_INIT_CARBON_EMISSION] = total_carbon_emission_cost
         return total_carbon_emission_cost
     
     # 3. Time Cost
     def calculate_time_cost(self) -> float:
-
-        component = TimeCost()
-        cost = component.calculate_cost(
-            construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
-            interest_rate=self.financial_data.get(KEY_INTEREST_RATE),
-            time=self.financial_data.get(KEY_CONSTR_TIME),
-            investment_ratio=self.financial_data.get(KEY_INVESTMENT_RATIO)
-        )
+        cost = self._kernel_head(COST_TIME)
         print("\n3.Time Cost: ", cost)
-        # Save the time cost
-        self.results[COST_TIME] = cost
         return cost
 
     # Helper function to get total traffic
@@ -585,17 +846,50 @@ class DatabaseManager:
             total_traffic += count
         return total_traffic
 
-    # 5. Carbon Emission due to Rerouting during Initial Construction
-    def init_carbon_emission_rerouting(self) -> float:
+    def traffic_projection(self) -> np.ndarray:
+        """
+        Projected ADT per year and vehicle class.
 
-        total_traffic = self._get_total_traffic()
-        rerouting_dist = self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
-        
-        init_const_time = self.financial_data.get(KEY_CONSTR_TIME)
-        SCC = self.carbon_emission_cost_data.get(KEY_SCC)
-        cost = total_traffic * init_const_time * 12 * self.WORKING_DAYS_IN_MONTH * SCC * self.CO2_EMISSION_PER_KM * rerouting_dist
+        Years 0..max(design life, analysis period, construction time), classes in
+        the order of daily_average_traffic_data. The traffic grows at the annual
+        traffic growth rate (0 if not entered) and saturates at the capacity of
+        the alternate road carriageway.
+        """
+        fin = self.financial_data
+        horizon = max(fin.get(KEY_DESIGN_LIFE) or 0, fin.get(KEY_ANALYSIS_PERIOD) or 0,
+                      int(np.ceil(fin.get(KEY_CONSTR_TIME) or 0)))
+        vehicles = list(self.daily_average_traffic_data)
+        return project_adt([self.daily_average_traffic_data[vehicle] for vehicle in vehicles], horizon,
+                           growth_rate=self.traffic_data.get(KEY_TRAFFIC_GROWTH_RATE) or 0.0,
+                           capacity=ROAD_CAPACITY_PCU_PER_DAY.get(self.traffic_data.get(KEY_ALTER_ROAD_CARRIAGEWAY)),
+                           pcu=[VEHICLE_PCU.get(vehicle, 1.0) for vehicle in vehicles])
+
+    # Helper function to get the mean ADT per vehicle class during construction
+    def _construction_traffic(self) -> Dict[str, float]:
+        constr_time = self.financial_data.get(KEY_CONSTR_TIME)
+        if not constr_time or constr_time <= 0:
+            return dict(self.daily_average_traffic_data)
+        mean = period_mean(self.traffic_projection(), constr_time)
+        return dict(zip(self.daily_average_traffic_data, mean.tolist()))
+
+    # Helper function to get the construction period traffic relative to the base year
+    def _construction_traffic_factor(self) -> float:
+        constr_time = self.financial_data.get(KEY_CONSTR_TIME)
+        if not constr_time or constr_time <= 0:
+            return 1.0
+        return float(period_mean(growth_factors(self.traffic_projection()), constr_time))
+
+    # Helper function to get the traffic of the events recurring every `frequency` years
+    # relative to the base year, weighted by their present worth
+    def _event_traffic_factor(self, frequency) -> float:
+        growth = growth_factors(self.traffic_projection())
+        schedule = event_schedule(frequency, self.financial_data.get(KEY_DESIGN_LIFE), len(growth))
+        return discounted_mean(growth, schedule, self.financial_data.get(KEY_INFLATION_RATE),
+                               self.financial_data.get(KEY_DISCOUNT_RATE_IA))
 
-        self.results[COST_CARBON_EMISSION_REROUTING_INIT] = cost
+    # 5. Carbon Emission due to Rerouting during Initial Construction
+    def init_carbon_emission_rerouting(self) -> float:
+        cost = self._kernel_head(COST_CARBON_EMISSION_REROUTING_INIT)
         print(f"\n5.Carbon Emission due to Rerouting during Initial Construction. {cost}")
         return cost
     
@@ -604,154 +898,49 @@ class DatabaseManager:
     #=================Use-Stage-Cost-Start=====================
     # 1. Routine Inspection Cost Calculation
     def routine_inspection_cost(self) -> float:
-
-        component = RoutineInspectionCost()
-
-        cost = component.calculate_cost(
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            init_construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
-            cost=self.maintainance_and_repair_data.get(KEY_ROUTINE_INSP_COST),
-            frequency=self.maintainance_and_repair_data.get(KEY_ROUTINE_INSP_FREQ),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_TOTAL_ROUTINE_INSPECTION] = cost
+        cost = self._kernel_head(COST_TOTAL_ROUTINE_INSPECTION)
         print("\n1.Routine Inspection Cost: ", cost)
         return cost
 
-
     # 2. Periodic Maintainance Cost
     def periodic_maintainance_cost(self) -> float:
-
-        component = PeriodicMaintenanceCost()
-
-        cost = component.calculate_cost(
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            init_construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
-            cost=self.maintainance_and_repair_data.get(KEY_PERIODIC_MAINT_COST),
-            frequency=self.maintainance_and_repair_data.get(KEY_PERIODIC_MAINT_FREQ),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_PERIODIC_MAINTAINANCE] = cost
+        cost = self._kernel_head(COST_PERIODIC_MAINTAINANCE)
         print("\n2.Periodic Maintenance Cost: ", cost)
         return cost
-    
+
     # 3. Periodic Maintenance Carbon Emission Cost Calculation
     def periodic_maintainance_carbon_emission_cost(self):
-
-        component = PeriodicMaintenanceCarbonCost()
-
-        cost = component.calculate_cost(
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            total_carbon_emission_cost=self.results.get(COST_TOTAL_INIT_CARBON_EMISSION),
-            cost=self.maintainance_and_repair_data.get(KEY_PERIODIC_MAINT_COST),
-            frequency=self.maintainance_and_repair_data.get(KEY_PERIODIC_MAINT_FREQ),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION] = cost
+        cost = self._kernel_head(COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION)
         print("\n3.Periodic Maintenance Carbon Emission Cost:", cost)
         return cost
-    
+
     # 4. Major Inspection Cost
     def major_inspection_cost(self) -> float:
-
-        component = MajorInspectionCost()
-
-        cost = component.calculate_cost(
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            init_construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
-            cost=self.maintainance_and_repair_data.get(KEY_MAJOR_INSP_COST),
-            frequency=self.maintainance_and_repair_data.get(KEY_MAJOR_INSP_FREQ),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_MAJOR_INSPECTION] = cost
+        cost = self._kernel_head(COST_MAJOR_INSPECTION)
         print("\n4.Major Inspection Cost: ", cost)
         return cost
-    
+
     # 5. Major Repair Cost
     def major_repair_cost(self) -> float:
-
-        component = MajorRepairCost()
-
-        cost = component.calculate_cost(
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            init_construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
-            cost=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_COST),
-            frequency=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_FREQ),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_MAJOR_REPAIR] = cost
+        cost = self._kernel_head(COST_MAJOR_REPAIR)
         print("\n5.Major Repair Cost: ", cost)
         return cost
-    
+
     # 6. Major Repair Related Carbon Emisson Cost
     def major_repair_related_carbon_emission_cost(self):
-
-        component = MajorRepairRelCarbonEmissionCost()
-
-        cost = component.calculate_cost(
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            total_carbon_emission_cost=self.results.get(COST_TOTAL_INIT_CARBON_EMISSION),
-            cost=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_COST),
-            frequency=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_FREQ),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION] = cost
+        cost = self._kernel_head(COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION)
         print("\n6.Major Repair Related Carbon Emisson Cost: ", cost)
         return cost
-    
+
     # 8. Carbon Emission due to rerouting during Major Repairs
     def carbon_emission_rerouting_during_major_repairs(self):
-
-        component = CarbonEmissionDueToRerouting()
-
-        total_traffic = self._get_total_traffic()
-        SCC = self.carbon_emission_cost_data.get(KEY_SCC)
-        rerouting_dist = self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
-
-        cost = component.calculate_cost(
-            additional_rerouting_dist=rerouting_dist,
-            duration_major_repair=self.DURATION_MAJOR_REPAIRS,
-            working_days_month=self.WORKING_DAYS_IN_MONTH,
-            total_traffic=total_traffic,
-            scc=SCC,
-            co2_emission_per_km=self.CO2_EMISSION_PER_KM,
-            repair_freq=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_FREQ),
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR] = cost
+        cost = self._kernel_head(COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR)
         print("\n8.Carbon Emission due to rerouting during Major Repairs: ", cost)
         return cost
-    
+
     # Helper function for 9
     def _calculate_superstructure_cost(self) -> float:
-        obj = InitialConstructionCost()
-        data = self.get_all_superstructures_data()
-        print("\nCalculating Total of SuperStructures")
-        total_cost = 0.0
-        print(data)
-        for item in data:
-            print(item.get(KEY_QUANTITY),item.get(KEY_RATE))
-            cost = obj.calculate_cost(
-                quantity=item.get(KEY_QUANTITY),
-                rate=item.get(KEY_RATE)
-            )
-            print(f"\nMaterial={item.get(KEY_TYPE)}\nQuantity={item.get(KEY_QUANTITY)}\nRate={item.get(KEY_RATE)}\nCost={cost}")
-            total_cost += cost
+        total_cost = self.get_total_cost(work_type=KEY_SUPERSTRUCTURE)
 
         print("\nTotal SuperStructures Cost:", total_cost)
 
@@ -761,177 +950,274 @@ class DatabaseManager:
     
     # 9. Replacement cost of Bearing and Expansion Joints
     def bearing_expansion_joint_replacement_cost(self) -> float:
-
-        component = BearingAndExpansionJointReplacementCost()
-        total_superstructure_cost = self._calculate_superstructure_cost()
-
-        cost = component.calculate_cost(
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            total_superstructure_cost=total_superstructure_cost,
-            cost=self.maintainance_and_repair_data.get(KEY_MAJOR_INSP_COST),
-            frequency=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_FREQ),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_MAJOR_INSPECTION] = cost
+        cost = self._kernel_head(COST_BEARING_EXP_JOINT_REPLACEMENT)
         print("\n9.Replacement cost of Bearing and Expansion Joints: ", cost)
         return cost
 
     # 11. Carbon Emission due to rerouting during Replacement
     def carbon_emission_rerouting_during_replacement(self):
-
-        component = CarbonEmissionDueToRerouting()
-
-        total_traffic = self._get_total_traffic()
-        SCC = self.carbon_emission_cost_data.get(KEY_SCC)
-        rerouting_dist = self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
-
-        cost = component.calculate_cost(
-            additional_rerouting_dist=rerouting_dist,
-            duration_major_repair=self.DURATION_REPLACEMENT,
-            working_days_month=self.WORKING_DAYS_IN_MONTH,
-            total_traffic=total_traffic,
-            scc=SCC,
-            co2_emission_per_km=self.CO2_EMISSION_PER_KM,
-            repair_freq=self.maintainance_and_repair_data.get(KEY_BEARING_EXP_JOINT_REPAIR_FREQ),
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE)
-        )
-
-        self.results[COST_CARBON_EMISSION_RR_DURING_REPLACEMENT] = cost
+        cost = self._kernel_head(COST_CARBON_EMISSION_RR_DURING_REPLACEMENT)
         print("\n11.Carbon Emission due to rerouting during Replacement: ", cost)
         return cost
+
     #=================Use-Stage-Cost-End=====================
     
     #==========End-Of-Life-Stage-Cost-Start==================
     # Helper function to get sum(quantity*rate) for given Type(Material)
     def _get_total_cost_material(self, type:str)->float:
-        obj = InitialConstructionCost()
-        data = self.get_all_materials_info()
-        total_cost = 0.0
-        for item in data:
-            if item.get(KEY_TYPE) == type:
-                cost = obj.calculate_cost(
-                    quantity=item.get(KEY_QUANTITY),
-                    rate=item.get(KEY_RATE)
-                )
-                total_cost += cost
+        total_cost = self.get_total_cost(type_material=type)
         
         print(f"\nMaterial={type}\nTotal Cost={total_cost}")
         return total_cost
     
     # 1. Demolition and Disposal Cost
     def demolition_and_disposal_cost(self) -> float:
-        
-        component = DemolitionCost()
-        
-        cost = component.calculate_cost(
-            init_constr_cost=self.results.get(COST_TOTAL_INIT_CONST),
-            demolition_disposal_cost=self.demolition_and_recycling_data.get(KEY_DEMOLITION_DISPOSAL_COST),
-            analysis_period=self.financial_data.get(KEY_ANALYSIS_PERIOD),
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
-        )
-        self.results[COST_DEMOLITION_DISPOSAL] = cost
+        cost = self._kernel_head(COST_DEMOLITION_DISPOSAL)
         print("\n1.Demolition and Disposal Cost:", cost)
         return cost
-    
+
     # 2. Demolition and Disposal related Carbon Emission
     def demolition_disposal_carbon_emission_cost(self) -> float:
-        
-        component = DemolitionCarbonCost()
-        
-        cost = component.calculate_cost(
-            init_carbon_emission_cost=self.results.get(COST_TOTAL_INIT_CARBON_EMISSION),
-            demolition_disposal_cost=self.demolition_and_recycling_data.get(KEY_DEMOLITION_DISPOSAL_COST),
-            analysis_period=self.financial_data.get(KEY_ANALYSIS_PERIOD),
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
-        )
-        self.results[COST_DEMOLITION_DISPOSAL_CARBON] = cost
+        cost = self._kernel_head(COST_DEMOLITION_DISPOSAL_CARBON)
         print("\n2.Demolition and Disposal related Carbon Emission:", cost)
         return cost
-    
+
     # 4. Carbon Emission due to Rerouting during Demolition and Disposal
     def demolition_disposal_rerouting_carbon_emission_cost(self) -> float:
-        
-        component = DemolitionCarbonReroutingCost()
-        SCC = self.carbon_emission_cost_data.get(KEY_SCC)
-        addit_rerouting = self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
-
-        cost = component.calculate_cost(
-            additional_rerouting_dist=addit_rerouting,
-            init_constr_cost=self.results.get(COST_TOTAL_INIT_CONST),
-            demolition_disposal_time=self.DURATION_DEMOLITION_DISPOSAL,
-            working_days_month=self.WORKING_DAYS_IN_MONTH,
-            scc=SCC,
-            co2_emission_per_km=self.CO2_EMISSION_PER_KM,
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE),
-            analysis_period=self.financial_data.get(KEY_ANALYSIS_PERIOD),
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
-        )
-        self.results[COST_DEMOLITION_DISPOSAL_CARBON_REROUTING] = cost
+        cost = self._kernel_head(COST_DEMOLITION_DISPOSAL_CARBON_REROUTING)
         print("\n4.Carbon Emission due to Rerouting during Demolition and Disposal:", cost)
         return cost
-    
+
     # 5. Recycling Cost
     def recycling_cost(self) -> float:
-        total_recycling_cost = 0.0
-
-        steel_rebar_cost = self._get_total_cost_material(type="Steel Rebar")
-        struct_steel_cost = self._get_total_cost_material(type="Structural Steel")
-        pre_stressed_tendons_cost = self._get_total_cost_material(type="Tendons")
-        
-        component = RecyclingCost()
-
-        #-------Steel-Rebar-Cost-----------------------------------
-        steel_rebar_recycle_cost = component.calculate_cost(
-            total_material_cost=steel_rebar_cost,
-            material_scrap_rate=self.demolition_and_recycling_data.get(KEY_STEEL_REBAR_SCRAP_RATE),
-            material_recyclability=self.demolition_and_recycling_data.get(KEY_STEEL_REBAR_RECYLABILITY),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE),
-            analysis_period=self.financial_data.get(KEY_ANALYSIS_PERIOD),
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
-        )
-        print(f"\nRecycling Cost of Steel Rebar: ", steel_rebar_recycle_cost)
-
-        #-------Structural-Steel-Cost-----------------------------------
-        struct_steel_recycle_cost = component.calculate_cost(
-            total_material_cost=struct_steel_cost,
-            material_scrap_rate=self.demolition_and_recycling_data.get(KEY_STRUCT_STEEL_SCRAP_RATE),
-            material_recyclability=self.demolition_and_recycling_data.get(KEY_STRUCT_STEEL_RECYLABILITY),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE),
-            analysis_period=self.financial_data.get(KEY_ANALYSIS_PERIOD),
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
-        )
-        print(f"\nRecycling Cost of Structural Steel: ", struct_steel_recycle_cost)
-
-        #-------PreStressed-Tendons-Cost-----------------------------------
-        pre_stressed_tendons_recycle_cost = component.calculate_cost(
-            total_material_cost=pre_stressed_tendons_cost,
-            material_scrap_rate=self.demolition_and_recycling_data.get(KEY_PS_TENDONS_SCRAP_RATE),
-            material_recyclability=self.demolition_and_recycling_data.get(KEY_PS_TENDONS_RECYLABILITY),
-            design_life=self.financial_data.get(KEY_DESIGN_LIFE),
-            analysis_period=self.financial_data.get(KEY_ANALYSIS_PERIOD),
-            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
-        )
-        print(f"\nRecycling Cost of Pre Stressed Tendon Cost: ", pre_stressed_tendons_recycle_cost)
-
-        total_recycling_cost = steel_rebar_recycle_cost + struct_steel_recycle_cost + pre_stressed_tendons_recycle_cost
-
-        self.results[COST_RECYCLING] = total_recycling_cost
+        total_recycling_cost = self._kernel_head(COST_RECYCLING)
         print(f"\n5.Total Recycling Cost: ", total_recycling_cost)
         return total_recycling_cost
 
 
     #==========End-Of-Life-Stage-Cost-End====================
 
+    #==========LCC-Kernel-Start==============================
+    def kernel_constants(self, heads: List[str] = None) -> Dict[str, float]:
+        """
+        Constants of this manager in core.lcc_kernel form. The rerouting
+        emission factor (a VOC model run) is only evaluated when one of the
+        kernel `heads` (default all) needs it.
+        """
+        constants = {
+            "working_days_in_month": self.WORKING_DAYS_IN_MONTH,
+            "duration_major_repairs": self.DURATION_MAJOR_REPAIRS,
+            "duration_replacement": self.DURATION_REPLACEMENT,
+            "duration_demolition": self.DURATION_DEMOLITION_DISPOSAL,
+        }
+        if heads is None or set(heads) & set(lcc_kernel.REROUTING_HEADS):
+            constants["co2_emission_per_km"] = self.rerouting_emission_factor()
+        return constants
+
+    def _recyclable_value(self) -> float:
+        """Scrap value of the recyclable steel, before discounting"""
+        demolition = self.demolition_and_recycling_data
+        recyclable_value = 0.0
+        for material, scrap_key, recyclability_key in [
+                ("Steel Rebar", KEY_STEEL_REBAR_SCRAP_RATE, KEY_STEEL_REBAR_RECYLABILITY),
+                ("Structural Steel", KEY_STRUCT_STEEL_SCRAP_RATE, KEY_STRUCT_STEEL_RECYLABILITY),
+                ("Tendons", KEY_PS_TENDONS_SCRAP_RATE, KEY_PS_TENDONS_RECYLABILITY)]:
+            recyclable_value += (self.get_total_cost(type_material=material)
+                                 * (demolition.get(scrap_key) or 0.0) * (demolition.get(recyclability_key) or 0.0))
+        return recyclable_value
+
+    def kernel_inputs(self, heads: List[str] = None) -> Dict[str, float]:
+        """
+        Plain snapshot of the inputs of core.lcc_kernel.evaluate.
+
+        The database is read once here; the returned dictionary can be passed
+        to worker processes or reused without touching SQLite again.
+
+        Args:
+            heads: Kernel head names (lcc_kernel.HEADS); only their inputs are
+                read. Default every input.
+
+        Raises:
+            ValueError: if a required UI input has not been entered
+        """
+        fin = self.financial_data
+        carbon = self.carbon_emission_cost_data
+        maint = self.maintainance_and_repair_data
+
+        # Read on demand, so a single head only touches its own inputs
+        readers = {
+            "inflation_rate": lambda: fin.get(KEY_INFLATION_RATE),
+            "discount_rate": lambda: fin.get(KEY_DISCOUNT_RATE_IA),
+            "interest_rate": lambda: fin.get(KEY_INTEREST_RATE),
+            "investment_ratio": lambda: fin.get(KEY_INVESTMENT_RATIO),
+            "design_life": lambda: fin.get(KEY_DESIGN_LIFE),
+            "construction_time": lambda: fin.get(KEY_CONSTR_TIME),
+            "analysis_period": lambda: fin.get(KEY_ANALYSIS_PERIOD),
+            "init_cost": lambda: self.get_total_cost(),
+            "superstructure_cost": lambda: self.get_total_cost(work_type=KEY_SUPERSTRUCTURE),
+            "recyclable_value": self._recyclable_value,
+            "carbon_quantity": lambda: sum(float(item[KEY_QUANTITY]) * float(item[KEY_CARBON_EMISSION_FACTOR])
+                                           for item in self.get_carbon_emission_data()),
+            "scc": lambda: carbon.get(KEY_SCC),
+            "scc_conversion": lambda: (carbon.get(KEY_USD_T_INR) if carbon.get(KEY_SOURCE) == SCC_K_Ricke_et_al
+                                       else 1.0),
+            "total_traffic": self._get_total_traffic,
+            "rerouting_distance": lambda: self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE),
+            "vot": lambda: self.get_result(COST_VOT),
+            "accident_cost": lambda: self.get_result(COST_ACCIDENT),
+            "routine_insp_cost": lambda: maint.get(KEY_ROUTINE_INSP_COST),
+            "routine_insp_freq": lambda: maint.get(KEY_ROUTINE_INSP_FREQ),
+            "periodic_maint_cost": lambda: maint.get(KEY_PERIODIC_MAINT_COST),
+            "periodic_maint_freq": lambda: maint.get(KEY_PERIODIC_MAINT_FREQ),
+            "major_insp_cost": lambda: maint.get(KEY_MAJOR_INSP_COST),
+            "major_insp_freq": lambda: maint.get(KEY_MAJOR_INSP_FREQ),
+            "major_repair_cost": lambda: maint.get(KEY_MAJOR_REPAIR_COST),
+            "major_repair_freq": lambda: maint.get(KEY_MAJOR_REPAIR_FREQ),
+            "replacement_freq": lambda: maint.get(KEY_BEARING_EXP_JOINT_REPAIR_FREQ),
+            "demolition_cost": lambda: self.demolition_and_recycling_data.get(KEY_DEMOLITION_DISPOSAL_COST),
+            "traffic_factor_construction": self._construction_traffic_factor,
+            "traffic_factor_major_repair": lambda: self._event_traffic_factor(maint.get(KEY_MAJOR_REPAIR_FREQ)),
+            "traffic_factor_replacement": lambda: self._event_traffic_factor(
+                maint.get(KEY_BEARING_EXP_JOINT_REPAIR_FREQ)),
+        }
+        inputs = {key: readers[key]() for key in lcc_kernel.head_inputs(heads)}
+        missing = lcc_kernel.missing_inputs(inputs, heads)
+        if missing:
+            raise ValueError(f"Missing input(s) for life cycle cost calculation: {missing}")
+        return inputs
+
+    def _kernel_head(self, head: str) -> float:
+        """Evaluate one cost head with the stateless kernel and store it in self.results"""
+        name = KERNEL_HEAD_NAMES[head]
+        value = float(lcc_kernel.evaluate(self.kernel_inputs([name]), self.kernel_constants([name]),
+                                          heads=[name])[name])
+        self.results[head] = value
+        return value
+
+    def calculate_all(self) -> Dict[str, float]:
+        """
+        Evaluate every cost head with the stateless kernel and store them in
+        self.results (including COST_TOTAL_LCC). No per-head logging.
+        """
+        heads = lcc_kernel.evaluate(self.kernel_inputs(), self.kernel_constants())
+        results = {KERNEL_HEAD_KEYS[name]: float(value) for name, value in heads.items()}
+        self.results.update(results)
+        self.graph.dirty -= set(results)
+        return results
+    #==========LCC-Kernel-End================================
+
+    #==========Cash-Flow-Timeline-Start======================
+    def cash_flow_timeline(self, single_cycle: bool = False) -> CashFlowTimeline:
+        """
+        Year-by-year cash flows of the initial, use and end-of-life stage heads.
+
+        Each head is its per-event amount placed on its event schedule, so the
+        column totals of the discounted matrix equal the scalar cost methods.
+
+        Args:
+            single_cycle: Build one life cycle (years 0..design life) with every
+                end-of-life head at the end of the design life, as the building
+                block of multi_cycle_timeline()
+
+        Returns:
+            Built CashFlowTimeline over years 0..max(design life, analysis period)
+        """
+        design_life = self.financial_data.get(KEY_DESIGN_LIFE)
+        analysis_period = self.financial_data.get(KEY_ANALYSIS_PERIOD)
+        if single_cycle:
+            analysis_period = design_life
+        maint = self.maintainance_and_repair_data
+        demolition = self.demolition_and_recycling_data
+
+        init_cost = self.get_result(COST_TOTAL_INIT_CONST)
+        carbon_cost = self.get_result(COST_TOTAL_INIT_CARBON_EMISSION)
+        superstructure_cost = self.get_result(COST_TOTAL_SUPERSTRUCTURE)
+        time_cost = self.get_result(COST_TIME)
+        if init_cost is None or carbon_cost is None:
+            raise ValueError("Initial construction and carbon emission costs are required for the cash flow timeline")
+        missing = [key for source, keys in [
+                       (self.financial_data, (KEY_DESIGN_LIFE, KEY_ANALYSIS_PERIOD, KEY_INFLATION_RATE,
+                                              KEY_DISCOUNT_RATE_IA, KEY_CONSTR_TIME)),
+                       (maint, (KEY_ROUTINE_INSP_COST, KEY_ROUTINE_INSP_FREQ, KEY_PERIODIC_MAINT_COST,
+                                KEY_PERIODIC_MAINT_FREQ, KEY_MAJOR_INSP_COST, KEY_MAJOR_INSP_FREQ,
+                                KEY_MAJOR_REPAIR_COST, KEY_MAJOR_REPAIR_FREQ, KEY_BEARING_EXP_JOINT_REPAIR_FREQ)),
+                       (demolition, (KEY_DEMOLITION_DISPOSAL_COST,)),
+                       (self.carbon_emission_cost_data, (KEY_SCC,)),
+                       (self.traffic_data, (KEY_ADDIT_REROUTING_DISTANCE,))]
+                   for key in keys if source.get(key) is None]
+        missing += [head for head, value in [(COST_TOTAL_SUPERSTRUCTURE, superstructure_cost), (COST_TIME, time_cost)]
+                    if value is None]
+        if missing:
+            raise ValueError(f"Missing input(s) for the cash flow timeline: {missing}")
+
+        SCC = self.carbon_emission_cost_data.get(KEY_SCC)
+        # Rerouting carbon cost per month of closure, per vehicle and for the daily traffic
+        rerouting_unit = (self.WORKING_DAYS_IN_MONTH * SCC * self.rerouting_emission_factor()
+                          * self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE))
+        rerouting = self._get_total_traffic() * rerouting_unit
+        growth = growth_factors(self.traffic_projection())
+        recyclable = self._recyclable_value()
+
+        timeline = CashFlowTimeline(max(design_life, analysis_period),
+                                    inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
+                                    discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA))
+        # Initial stage
+        timeline.add_one_time(COST_TOTAL_INIT_CONST, init_cost, year=0)
+        timeline.add_one_time(COST_TOTAL_INIT_CARBON_EMISSION, carbon_cost, year=0)
+        timeline.add_one_time(COST_TIME, time_cost, year=0)
+        timeline.add_one_time(COST_CARBON_EMISSION_REROUTING_INIT, rerouting * self._construction_traffic_factor()
+                              * self.financial_data.get(KEY_CONSTR_TIME) * 12, year=0)
+        # Use stage
+        timeline.add_recurring(COST_TOTAL_ROUTINE_INSPECTION, init_cost * maint.get(KEY_ROUTINE_INSP_COST),
+                               maint.get(KEY_ROUTINE_INSP_FREQ), design_life)
+        timeline.add_recurring(COST_PERIODIC_MAINTAINANCE, init_cost * maint.get(KEY_PERIODIC_MAINT_COST),
+                               maint.get(KEY_PERIODIC_MAINT_FREQ), design_life)
+        timeline.add_recurring(COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION, carbon_cost * maint.get(KEY_PERIODIC_MAINT_COST),
+                               maint.get(KEY_PERIODIC_MAINT_FREQ), design_life)
+        timeline.add_recurring(COST_MAJOR_INSPECTION, init_cost * maint.get(KEY_MAJOR_INSP_COST),
+                               maint.get(KEY_MAJOR_INSP_FREQ), design_life)
+        timeline.add_recurring(COST_MAJOR_REPAIR, init_cost * maint.get(KEY_MAJOR_REPAIR_COST),
+                               maint.get(KEY_MAJOR_REPAIR_FREQ), design_life)
+        timeline.add_recurring(COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION, carbon_cost * maint.get(KEY_MAJOR_REPAIR_COST),
+                               maint.get(KEY_MAJOR_REPAIR_FREQ), design_life)
+        # Rerouting heads are charged with the projected traffic of their event year
+        years = len(timeline.years)
+        timeline.add_schedule(COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR, rerouting * self.DURATION_MAJOR_REPAIRS,
+                              event_schedule(maint.get(KEY_MAJOR_REPAIR_FREQ), design_life, years) * growth[:years])
+        timeline.add_recurring(COST_BEARING_EXP_JOINT_REPLACEMENT, superstructure_cost * maint.get(KEY_MAJOR_INSP_COST),
+                               maint.get(KEY_MAJOR_REPAIR_FREQ), design_life)
+        timeline.add_schedule(COST_CARBON_EMISSION_RR_DURING_REPLACEMENT, rerouting * self.DURATION_REPLACEMENT,
+                              event_schedule(maint.get(KEY_BEARING_EXP_JOINT_REPAIR_FREQ), design_life, years)
+                              * growth[:years])
+        # End of life
+        timeline.add_one_time(COST_DEMOLITION_DISPOSAL, init_cost * demolition.get(KEY_DEMOLITION_DISPOSAL_COST),
+                              year=analysis_period)
+        timeline.add_one_time(COST_DEMOLITION_DISPOSAL_CARBON, carbon_cost * demolition.get(KEY_DEMOLITION_DISPOSAL_COST),
+                              year=analysis_period)
+        demolition_rerouting = init_cost * rerouting_unit * self.DURATION_DEMOLITION_DISPOSAL
+        if single_cycle:
+            timeline.add_one_time(COST_DEMOLITION_DISPOSAL_CARBON_REROUTING, demolition_rerouting, year=design_life)
+            timeline.add_one_time(COST_RECYCLING, recyclable, year=design_life, credit=True)
+        else:
+            timeline.add_recurring(COST_DEMOLITION_DISPOSAL_CARBON_REROUTING, demolition_rerouting,
+                                   analysis_period, design_life)
+            timeline.add_recurring(COST_RECYCLING, recyclable, analysis_period, design_life, credit=True)
+        return timeline.build()
+
+    def multi_cycle_timeline(self) -> CashFlowTimeline:
+        """
+        Cash flows over the analysis period when it spans several design lives.
+
+        One life cycle (construction, use stage, demolition at the end of the
+        design life) is built once and replayed as shifted copies starting every
+        design life. A cycle cut off by the end of the analysis period gets a
+        straight-line residual value of its construction and carbon cost.
+        """
+        cycle = self.cash_flow_timeline(single_cycle=True)
+        return repeat_cycles(cycle, self.financial_data.get(KEY_ANALYSIS_PERIOD),
+                             residual_heads=[COST_TOTAL_INIT_CONST, COST_TOTAL_INIT_CARBON_EMISSION])
+    #==========Cash-Flow-Timeline-End========================
+
     #==========IRC-Road_User-Cost-Start======================
     
     #==========2. Accident-Related-Cost-Start==========
@@ -939,11 +1225,10 @@ class DatabaseManager:
     #==========2.1 Human-Injury-Cost-Start==========
     
     def _no_of_accidents(self) -> float: # Per Day
-        crash_rate = self.traffic_data.get(KEY_CRASH_RATE) 
-        adt = self._get_total_traffic()
-        multiplier = self.WORK_ZONE_MULTIPLIER
-        rerouting_dist = self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
-        return crash_rate * adt * multiplier * rerouting_dist * (10**-6)
+        return float(accident_cost.accidents(self._get_total_traffic() * self._construction_traffic_factor(),
+                                             self.traffic_data.get(KEY_CRASH_RATE),
+                                             self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE),
+                                             work_zone_multiplier=self.WORK_ZONE_MULTIPLIER))
     
     def _accident_in_constr_time(self) -> float:
         no_of_accidents = self._no_of_accidents()
@@ -951,78 +1236,81 @@ class DatabaseManager:
         days = self.WORKING_DAYS_IN_MONTH * month
         return no_of_accidents * days
 
-    def _wpi_adj_economic_cost_of_accident_category(self, accident_category:str) -> float:
-        wpi = self.irc_sp_30._get_wpi(table=TABLE_WPI_MEDICAL,
-                                       column=accident_category,
-                                       current_year=2024, # Hard Coded
-                                       base_year=BASE_YEAR)
-        economic_cost_of_accident = self.irc_sp_30._get_accident_cost(accident_category)
-        return economic_cost_of_accident * wpi
-
-    def _count_accident_type(self, accident_category:str) -> float:
-        accident_dist = self.accident_distribution.get(accident_category)
-        return self._accident_in_constr_time() * accident_dist
-
-    def _injury_cost(self, accident_category:str) -> float:
-        cost = self._wpi_adj_economic_cost_of_accident_category(accident_category)
-        return cost * self._count_accident_type(accident_category)
-    
+    def _injury_weights(self, years=None) -> np.ndarray:
+        """
+        Cost per accident of each injury category: WPI adjusted economic cost x accident distribution.
+        An array of years gives one row per year (default: self.wpi_year).
+        """
+        years = self.wpi_year if years is None else years
+        costs = (self.irc_sp_30.get_accident_costs(ACCIDENT_CATEGORIES)
+                 * self.irc_sp_30.get_wpi(TABLE_WPI_MEDICAL, ACCIDENT_CATEGORIES, current_year=years))
+        return accident_cost.category_weights(
+            costs, [self.accident_distribution.get(category) for category in ACCIDENT_CATEGORIES])
+
     def total_human_injury_cost(self) -> float:
-        cost = 0.0
-        for injury in [KEY_MINOR_INJURY, KEY_MAJOR_INJURY, KEY_FATAL]:
-            cost += self._injury_cost(injury)
-        return cost
+        count = self._accident_in_constr_time()
+        return float(accident_cost.category_costs(count, self._injury_weights()).sum())
     #==========2.1 Human-Injury-Cost-End==========
 
     #==========2.2 Vehicle-Damage-Cost-Start==========
-    def _wpi_adj_economic_cost_of_quantum_damage(self, vehicle_category:str) -> float:
-        wpi = self.irc_sp_30._get_wpi(table=TABLE_VOT,
-                                       column=vehicle_category,
-                                       current_year=2024, # Hard Coded
-                                       base_year=BASE_YEAR)
-        economic_cost_of_quantum_damage = self.irc_sp_30._get_vehicle_damage_cost(vehicle_category)
-        return economic_cost_of_quantum_damage * wpi
-    
-    def _count_vehicle_damage(self, vehicle_category:str) -> float:
-        vehicle_dist = self.vehicle_distribution.get(vehicle_category)
-        return self._accident_in_constr_time() * vehicle_dist
-
-    def _vehicle_damage_cost(self, vehicle_category:str):
-        cost = self._wpi_adj_economic_cost_of_quantum_damage(vehicle_category)
-        return cost * self._count_vehicle_damage(vehicle_category)
+    def _damage_weights(self, years=None) -> np.ndarray:
+        """
+        Cost per accident of each vehicle category: WPI adjusted cost of damage x vehicle distribution.
+        An array of years gives one row per year (default: self.wpi_year).
+        """
+        years = self.wpi_year if years is None else years
+        costs = (self.irc_sp_30.get_vehicle_damage_costs(DAMAGE_CATEGORIES)
+                 * self.irc_sp_30.get_wpi(TABLE_VOT, DAMAGE_CATEGORIES, current_year=years))
+        return accident_cost.category_weights(
+            costs, [self.vehicle_distribution.get(vehicle) for vehicle in DAMAGE_CATEGORIES])
 
     def total_vehicle_damage_cost(self) -> float:
-        cost = 0.0
-        for vehicle in [KEY_TWO_WHEELER,
-                        KEY_SMALL_CARS,
-                        KEY_BIG_CARS,
-                        KEY_ORDINARY_BUS,
-                        KEY_DELUXE_BUS,
-                        KEY_LCV,
-                        KEY_HCV,
-                        KEY_MCV]:
-            cost += self._vehicle_damage_cost(vehicle)
-        return cost
+        count = self._accident_in_constr_time()
+        return float(accident_cost.category_costs(count, self._damage_weights()).sum())
     #==========2.2 Vehicle-Damage-Cost-End==========
 
     def accident_related_cost(self) -> float:
-        return self.total_human_injury_cost() + self.total_vehicle_damage_cost()
+        costs = accident_cost.accident_costs(self._accident_in_constr_time(),
+                                             self._injury_weights(), self._damage_weights())
+        return float(costs["total"])
+
+    def accident_costs_per_year(self, escalate: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Accident costs per year of the traffic projection if the traffic were
+        rerouted for every working day of that year.
+
+        Args:
+            escalate: Price year t of the projection at the (projected) WPI of
+                wpi_year + t instead of wpi_year
+
+        Returns:
+            accident_cost.accident_costs() of the yearly accident counts:
+            arrays (years, categories) in the order of ACCIDENT_CATEGORIES and
+            DAMAGE_CATEGORIES, and yearly totals
+        """
+        count = accident_cost.accidents(self.traffic_projection().sum(axis=-1),
+                                        self.traffic_data.get(KEY_CRASH_RATE),
+                                        self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE),
+                                        days=self.WORKING_DAYS_IN_MONTH * 12,
+                                        work_zone_multiplier=self.WORK_ZONE_MULTIPLIER)
+        years = self.wpi_year + np.arange(len(count)) if escalate else None
+        return accident_cost.accident_costs(count, self._injury_weights(years), self._damage_weights(years))
     #==========2. Accident-Related-Cost-End==========
 
     #==========3. VOT-Start==========================
     def _wpi_adj_vot(self, vehicle_type:str, type_of_road:str) -> float:
         wpi = self.irc_sp_30._get_wpi(table=TABLE_VOT,
                             column=vehicle_type,
-                            current_year=2024, # Hard Coded
-                            base_year=BASE_YEAR)
+                            current_year=self.wpi_year)
         time_value = self.irc_sp_30._get_vot(column=type_of_road,
                                              vehicle_type=vehicle_type)
         return time_value * wpi
     
-    def _vot_per_day(self, vehicle_type: str, type_of_road: str) -> float:
+    def _vot_per_day(self, vehicle_type: str, type_of_road: str, vehicle_per_day: float = None) -> float:
         time_value = self._wpi_adj_vot(vehicle_type=vehicle_type,
                                        type_of_road=type_of_road)
-        vehicle_per_day = self.daily_average_traffic_data.get(vehicle_type)
+        if vehicle_per_day is None:
+            vehicle_per_day = self.daily_average_traffic_data.get(vehicle_type)
         addit_travel_time = self.traffic_data.get(KEY_ADDIT_TRAVEL_TIME)
         occupancy = self.irc_sp_30._get_occupancy(vehicle_type=vehicle_type)
         return time_value * vehicle_per_day * addit_travel_time * occupancy
@@ -1032,44 +1320,161 @@ class DatabaseManager:
         days = self.WORKING_DAYS_IN_MONTH * month
         road_type = self.traffic_data.get(KEY_ALTER_ROAD_CARRIAGEWAY)
 
-        total_vot = 0.0
-        for vehicle_type in self.daily_average_traffic_data.keys():
-            total_vot += self._vot_per_day(vehicle_type=vehicle_type,
-                                       type_of_road=road_type)
+        # All vehicle types in one batched table lookup (same terms as _vot_per_day)
+        traffic = self._construction_traffic()
+        vehicle_types = list(traffic)
+        time_value = (self.irc_sp_30.get_vot(vehicle_types, road_type)
+                      * self.irc_sp_30.get_wpi(TABLE_VOT, vehicle_types, current_year=self.wpi_year))
+        occupancy = self.irc_sp_30.get_occupancy(vehicle_types)
+        vehicle_per_day = np.array([traffic[vehicle_type] for vehicle_type in vehicle_types], dtype=float)
+        total_vot = float((time_value * vehicle_per_day * occupancy).sum()) * self.traffic_data.get(KEY_ADDIT_TRAVEL_TIME)
 
         return total_vot * days
 
     #==========3. VOT-End============================
 
-    def total_road_user_cost(self) -> float:
-        vot = self.vot_per_year()
-        accident_cost = self.accident_related_cost()
-
-
-        ui_inputs = {
-            "vehicle_info": self.daily_average_traffic_data,
+    # Helper function to get the daily traffic per VOC vehicle type
+    def _voc_vehicle_info(self, traffic: Dict = None) -> Dict[str, float]:
+        """Traffic per VOC vehicle type; `traffic` per vehicle class (numbers or yearly arrays), default the ADT"""
+        if traffic is None:
+            traffic = self.daily_average_traffic_data
+        vehicle_info = {voc_type: 0 for voc_type in VOC_VEHICLE_TYPE.values()}
+        for vehicle_type, count in traffic.items():
+            voc_type = VOC_VEHICLE_TYPE.get(vehicle_type)
+            if voc_type is not None:
+                vehicle_info[voc_type] = vehicle_info[voc_type] + count
+        return vehicle_info
+
+    def _voc_road_conditions(self) -> Dict:
+        """Alternate road the traffic is rerouted over, in calc_voc input form"""
+        return {
             # "carriageway_width": 10, ### ONLY REQUIRED WHEN "lane_type" = "EW"
             "rg_roughness_factor": 2000,
             "fl_fall_factor": 0,
             "rs_rise_factor": 0,
-            "lane_type": "2L",
+            "lane_type": ROAD_LANE_TYPE.get(self.traffic_data.get(KEY_ALTER_ROAD_CARRIAGEWAY), "2L"),
             "power_weight_ratio_pwr": {
                 "mcv": 8,
                 "hcv": 7.22
             }
         }
 
-        
+    def rerouting_emission_factor(self, traffic_multiplier=1.0):
+        """
+        kg CO2e per vehicle-km of the rerouted traffic.
+
+        Fuel burnt per vehicle class on the alternate road (VOC models) times the
+        fuel emission factors, raised by the congestion the diverted traffic causes
+        there and averaged over the traffic mix. Falls back to CO2_EMISSION_PER_KM
+        when no daily traffic has been entered or the VOC models cannot be
+        evaluated for the entered road.
+
+        The factor is memoized on the daily traffic, the alternate road and the
+        multipliers, so the rerouting heads of a refresh share one VOC run and
+        edits of other inputs do not rerun it.
+
+        Args:
+            traffic_multiplier: Scales the traffic of every class; an array gives
+                one factor per multiplier in a single pass
+        """
+        vehicle_info = self._voc_vehicle_info()
+        multiplier = np.asarray(traffic_multiplier, dtype=float)
+        key = (tuple((vt, float(count)) for vt, count in vehicle_info.items()),
+               self.traffic_data.get(KEY_ALTER_ROAD_CARRIAGEWAY), multiplier.shape, multiplier.tobytes())
+        cache = self._query_cache.setdefault("rerouting_emission_factor", {})
+        if key not in cache:
+            if len(cache) >= self.EMISSION_FACTOR_CACHE_SIZE:
+                cache.clear()
+            cache[key] = self._rerouting_emission_factor(vehicle_info, multiplier)
+        return np.copy(cache[key])[()]
+
+    def _rerouting_emission_factor(self, vehicle_info: Dict[str, float], multiplier: np.ndarray):
+        fallback = np.full(multiplier.shape, self.CO2_EMISSION_PER_KM)[()]
+        if sum(vehicle_info.values()) <= 0:
+            return fallback
+        try:
+            # The VOC models are only loaded once rerouting is costed
+            from osbridgelcca.desktop_app.widgets.utils.core.voc.emissions import rerouting_emissions
+            emissions = rerouting_emissions(
+                self._voc_road_conditions(),
+                {vt: count * multiplier for vt, count in vehicle_info.items()},
+                capacity=ROAD_CAPACITY_PCU_PER_DAY.get(self.traffic_data.get(KEY_ALTER_ROAD_CARRIAGEWAY))
+            )
+        except (ImportError, ValueError) as e:
+            print(f"WARNING: Rerouting emissions from the VOC models failed, using CO2_EMISSION_PER_KM: {e}")
+            return fallback
+        return emissions["per_vehicle_km"]
+
+    def rerouting_voc_cost(self) -> float:
+        """
+        Economic VOC of the rerouted traffic over the construction period.
+
+        The projected traffic of every construction year is spread over the
+        hours of the day, and the congestion factors of the alternate road are
+        applied hour by hour (see calc_annual_voc). A fractional last year
+        counts with its share; only working days are charged.
+        """
+        # The VOC models are only loaded once rerouting is costed
+        from osbridgelcca.desktop_app.widgets.utils.core.main import calc_annual_voc, voc_grid
+        from osbridgelcca.desktop_app.widgets.utils.core.voc.congestion.core import DAYS_IN_YEAR
+
+        constr_time = self.financial_data.get(KEY_CONSTR_TIME)
+        if not constr_time or constr_time <= 0:
+            return 0.0
+        years = int(np.ceil(constr_time))
+        projection = self.traffic_projection()[:years]
+        traffic = {vehicle: projection[:, v] for v, vehicle in enumerate(self.daily_average_traffic_data)}
+        ui_inputs = {
+            "vehicle_info": self._voc_vehicle_info(traffic),
+            **self._voc_road_conditions()
+        }
 
-        voc = calc_voc(
+        # Memoized by the fingerprint of the inputs, so unrelated edits do not rerun the VOC models;
+        # the per-km VOC of the uncongested road comes from the shared lookup grid of the WPI year
+        all_wpi = self.irc_sp_30.getWPI(self.wpi_year)
+        voc = calc_annual_voc(
             inputs=ui_inputs,
-            all_wpi=self.irc_sp_30.getWPI(),
-            vehicle_cost=23
+            all_wpi=all_wpi,
+            years=years,
+            capacity=ROAD_CAPACITY_PCU_PER_DAY.get(self.traffic_data.get(KEY_ALTER_ROAD_CARRIAGEWAY)),
+            grid=voc_grid(all_wpi, ui_inputs["power_weight_ratio_pwr"])
         )
 
+        # Rs/km/year -> working days of each year, the last year by its share
+        share = np.ones(years)
+        share[-1] = constr_time - (years - 1)
+        working_days = self.WORKING_DAYS_IN_MONTH * 12 / DAYS_IN_YEAR
+        annual = np.asarray(voc["total"]["ET"], dtype=float)
+        return float((annual * share).sum()) * working_days * self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
 
+    def road_user_cost_stages(self) -> Iterator[Tuple[str, float]]:
+        """
+        Compute the road user cost heads one at a time as (head, value).
+
+        Reads the inputs only: neither self.results nor the dependency graph
+        is touched, so a worker thread can run it while the UI keeps editing
+        (see apply_road_user_results).
+        """
+        yield COST_VOT, self.vot_per_year()
+        yield COST_ACCIDENT, self.accident_related_cost()
+        yield COST_REROUTING_VOC, self.rerouting_voc_cost()
+
+    def apply_road_user_results(self, results: Dict[str, float]):
+        """Store road user cost heads computed by road_user_cost_stages() and mark them clean"""
+        self.results.update(results)
+        self.graph.dirty -= set(results)
+
+    def total_road_user_cost(self) -> float:
+        vot = self.get_result(COST_VOT)
+        accident_cost = self.get_result(COST_ACCIDENT)
+        voc_cost = self.rerouting_voc_cost()
+
+        cost = vot + accident_cost + voc_cost
+        self.results[COST_REROUTING_VOC] = voc_cost
+        self.results[COST_TOTAL_ROAD_USER] = cost
+        print("\nTotal Road User Cost:", cost)
+        return cost
 
-    
 
     #==========IRC-Road_User-Cost-End====================
 
@@ -1089,36 +1494,19 @@ class DatabaseManager:
         return repair_component.calculate_cost()
     
     # 12. Reconstruction Cost Calculation 
-    def reconstruction_cost(self, initial_construction_cost: float,
-                            demolition_cost: float,
-                            carbon_emission_cost: float,
-                            time_cost: float,
-                            roaduser_cost: float,
-                            rerouting_carbon_cost: float) -> float:
-
-        reconstruction_cost = initial_construction_cost
-        demolition_cost = demolition_cost
-        reconstruction_carbon_cost = carbon_emission_cost
-        reconstruction_time_cost = time_cost
-        reconstruction_roaduser_cost = roaduser_cost
-        reconstruction_rerouting_carbon_cost = rerouting_carbon_cost
-
-        reconstruction_result = 0
-
-        if self.analysis_period > self.design_life:
-            reconstruction_component = ReconstructionCost(
-                demolition_cost=demolition_cost,
-                reconstruction_cost=reconstruction_cost,
-                reconstruction_carbon_cost=reconstruction_carbon_cost,
-                reconstruction_time_cost=reconstruction_time_cost,
-                reconstruction_roaduser_cost=reconstruction_roaduser_cost,
-                reconstruction_rerouting_carbon_cost=reconstruction_rerouting_carbon_cost,
-                design_life=self.design_life,
-                discount_rate=self.discount_rate
-            )
-            reconstruction_result = reconstruction_component.calculate_cost()
-        else:
-            reconstruction_result = 0
+    def reconstruction_cost(self) -> float:
+        """
+        Present worth of every life cycle after the first one (net of the
+        residual value of a partial last cycle). Zero when the analysis period
+        does not exceed the design life.
+        """
+        reconstruction_result = 0.0
+
+        if self.financial_data.get(KEY_ANALYSIS_PERIOD) > self.financial_data.get(KEY_DESIGN_LIFE):
+            first_cycle = self.cash_flow_timeline(single_cycle=True)
+            reconstruction_result = self.multi_cycle_timeline().total() - first_cycle.total()
+
+        self.results[COST_RECONSTRUCTION] = reconstruction_result
         print("\nReconstruction Cost:", reconstruction_result)  # INR
         return reconstruction_result
     
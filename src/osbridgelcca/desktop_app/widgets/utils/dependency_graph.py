@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+# An input is either the name of another cost head, or a (source, key) pair
+# where source is a DatabaseManager input dictionary / database table and key
+# is the dictionary key (None means the whole source, e.g. a table).
+SourceKey = Tuple[str, Optional[str]]
+Input = Union[str, SourceKey]
+
+
+@dataclass
+class CostNode:
+    """One cost head and the inputs it is computed from."""
+    name: str
+    compute: Callable[[], float]
+    inputs: Tuple[Input, ...] = ()
+
+    @property
+    def upstream(self) -> List[str]:
+        return [item for item in self.inputs if isinstance(item, str)]
+
+    @property
+    def sources(self) -> List[SourceKey]:
+        return [item for item in self.inputs if isinstance(item, tuple)]
+
+
+class DependencyGraph:
+    """
+    Registry of cost nodes with dirty tracking.
+
+    Nodes start dirty. invalidate() marks every node that reads the changed
+    source key dirty together with all of its downstream nodes; pending()
+    lists what has to be recomputed, in dependency order. Clean nodes keep
+    their memoized result.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, CostNode] = {}
+        self.dirty: Set[str] = set()
+        self._order: List[str] = []
+
+    def register(self, name: str, compute: Callable[[], float], inputs: Iterable[Input] = ()):
+        self.nodes[name] = CostNode(name, compute, tuple(inputs))
+        self.dirty.add(name)
+        self._order = []
+
+    def _topological_order(self) -> List[str]:
+        if self._order:
+            return self._order
+
+        order, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cyclic dependency at cost head '{name}'")
+            visiting.add(name)
+            for parent in self.nodes[name].upstream:
+                if parent not in self.nodes:
+                    raise ValueError(f"Cost head '{name}' depends on unregistered head '{parent}'")
+                visit(parent)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name)
+        self._order = order
+        return order
+
+    def _downstream(self, names: Iterable[str]) -> Set[str]:
+        affected = set(names)
+        for name in self._topological_order():
+            if any(parent in affected for parent in self.nodes[name].upstream):
+                affected.add(name)
+        return affected
+
+    def invalidate(self, source: str, keys: Optional[Iterable[str]] = None) -> Set[str]:
+        """
+        Mark nodes reading `source` dirty.
+
+        Args:
+            source: Input dictionary or table name
+            keys: Changed keys. None invalidates every reader of the source.
+
+        Returns:
+            Set of cost heads that became dirty
+        """
+        keys = None if keys is None else set(keys)
+        hit = set()
+        for node in self.nodes.values():
+            for node_source, node_key in node.sources:
+                if node_source != source:
+                    continue
+                if keys is None or node_key is None or node_key in keys:
+                    hit.add(node.name)
+                    break
+        affected = self._downstream(hit)
+        self.dirty |= affected
+        return affected
+
+    def invalidate_heads(self, names: Iterable[str]) -> Set[str]:
+        affected = self._downstream(names)
+        self.dirty |= affected
+        return affected
+
+    def pending(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """Dirty nodes (limited to `names` and their ancestors) in evaluation order."""
+        order = self._topological_order()
+        if names is None:
+            return [name for name in order if name in self.dirty]
+
+        needed = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in needed:
+                continue
+            needed.add(name)
+            stack.extend(self.nodes[name].upstream)
+        return [name for name in order if name in needed and name in self.dirty]
+
+
+class TrackedInput:
+    """
+    Attribute holding an input dictionary of the owner.
+
+    Assigning a new dictionary diffs it against the previous one and calls
+    owner._on_input_changed(name, changed_keys), so only the cost heads that
+    read a changed key get invalidated. Editing the dictionary in place is not
+    seen; call owner.invalidate_input(name, keys) after doing so.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.storage = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.storage, None)
+
+    def __set__(self, obj, value):
+        old = getattr(obj, self.storage, None) or {}
+        value = value if value is not None else {}
+        setattr(obj, self.storage, value)
+        changed = {key for key in set(old) | set(value) if old.get(key) != value.get(key)}
+        if changed:
+            obj._on_input_changed(self.name, changed)
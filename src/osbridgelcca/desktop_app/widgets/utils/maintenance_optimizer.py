@@ -0,0 +1,210 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from osbridgelcca.core.present_worth import present_worth_factor
+from osbridgelcca.desktop_app.widgets.utils.data import *
+
+# Intervals searched by the optimizer, in the order of the grid axes
+INTERVAL_KEYS = [KEY_PERIODIC_MAINT_FREQ, KEY_MAJOR_INSP_FREQ, KEY_MAJOR_REPAIR_FREQ, KEY_BEARING_EXP_JOINT_REPAIR_FREQ]
+
+# Cost heads whose value depends on the intervals above
+MAINTENANCE_HEADS = [COST_PERIODIC_MAINTAINANCE, COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION, COST_MAJOR_INSPECTION,
+                     COST_MAJOR_REPAIR, COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION,
+                     COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR, COST_BEARING_EXP_JOINT_REPLACEMENT,
+                     COST_CARBON_EMISSION_RR_DURING_REPLACEMENT]
+
+# Grids larger than this are searched with the separable (pruned) method
+MAX_FULL_GRID = 2_000_000
+
+# Default growth of the per-event cost of periodic maintenance and major repair
+# with the interval: (interval / current interval) ** 2, i.e. deferring the work
+# lets the defects it repairs grow with the square of the time between visits
+DEFAULT_DETERIORATION_EXPONENT = 2.0
+
+
+@dataclass
+class MaintenanceSchedule:
+    """Result of a maintenance interval search."""
+    intervals: Dict[str, int]
+    total_lcc: float
+    maintenance_cost: float
+    baseline_intervals: Dict[str, int]
+    baseline_lcc: float
+    evaluated: int
+    costs: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def savings(self) -> float:
+        return self.baseline_lcc - self.total_lcc
+
+
+class MaintenanceOptimizer:
+    """
+    Search maintenance intervals for the lowest life cycle cost.
+
+    The interval-dependent heads follow the DatabaseManager formulas. On top of
+    them:
+      - every closure (major repair, bearing/expansion joint replacement) also
+        costs the road users their VOT and accident cost for its duration;
+        closures are charged with the projected traffic of their year, as the
+        DatabaseManager rerouting heads are;
+      - when a major repair and a replacement fall in the same year they share
+        one closure, so the replacement closure is not paid again. This is the
+        only term coupling two intervals;
+      - the per-event cost of periodic maintenance and major repair grows as
+        (interval / current interval) ** deterioration_exponent (default
+        DEFAULT_DETERIORATION_EXPONENT). The current intervals keep their
+        DatabaseManager cost. With an exponent of 1 or less, longer intervals
+        are always cheaper and the search simply returns the longest candidates.
+
+    Periodic maintenance and major inspection are independent of the others,
+    so for large candidate spaces they are minimized on their own and only the
+    (major repair, replacement) pair is searched jointly. The result is the
+    same as the full grid.
+    """
+
+    def __init__(self, database_manager, candidates: Optional[Dict[str, Sequence[int]]] = None,
+                 deterioration_exponent: float = DEFAULT_DETERIORATION_EXPONENT, include_road_user: bool = True):
+        """
+        Args:
+            database_manager: DatabaseManager with financial, maintenance, traffic and carbon data
+            candidates: Interval key -> candidate intervals in years. Defaults to
+                1 .. design life - 1 for every interval.
+            deterioration_exponent: Growth of the per-event cost with the interval (>= 0)
+            include_road_user: Charge VOT and accident cost during closures
+        """
+        dm = database_manager
+        maint = dm.maintainance_and_repair_data
+        missing = [key for key in INTERVAL_KEYS + [KEY_PERIODIC_MAINT_COST, KEY_MAJOR_INSP_COST, KEY_MAJOR_REPAIR_COST]
+                   if maint.get(key) is None]
+        if missing:
+            raise ValueError(f"Missing maintenance input(s): {missing}")
+        if deterioration_exponent < 0:
+            raise ValueError(f"Deterioration exponent must be non-negative. Provided: {deterioration_exponent}")
+
+        self.inflation_rate = dm.financial_data.get(KEY_INFLATION_RATE)
+        self.discount_rate = dm.financial_data.get(KEY_DISCOUNT_RATE_IA)
+        self.design_life = dm.financial_data.get(KEY_DESIGN_LIFE)
+        self.deterioration_exponent = deterioration_exponent
+        self.baseline_intervals = {key: int(maint[key]) for key in INTERVAL_KEYS}
+
+        default = np.arange(1, max(int(self.design_life), 2))
+        candidates = candidates or {}
+        self.candidates = {key: np.asarray(candidates.get(key, default), dtype=int) for key in INTERVAL_KEYS}
+        if any(len(values) == 0 or (values <= 0).any() for values in self.candidates.values()):
+            raise ValueError("Candidate intervals must be non-empty and positive")
+
+        timeline = dm.cash_flow_timeline()
+        init_cost = dm.get_result(COST_TOTAL_INIT_CONST)
+        carbon_cost = dm.get_result(COST_TOTAL_INIT_CARBON_EMISSION)
+        superstructure_cost = dm.get_result(COST_TOTAL_SUPERSTRUCTURE)
+
+        # Rerouting carbon cost per month of closure for the base year daily traffic
+        rerouting = (dm._get_total_traffic() * dm.WORKING_DAYS_IN_MONTH * dm.carbon_emission_cost_data.get(KEY_SCC)
+                     * dm.rerouting_emission_factor() * dm.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE))
+        if include_road_user:
+            # VOT and accident costs are per construction period, at the construction period
+            # traffic; spread them per month and bring them back to the base year traffic
+            months = dm.financial_data.get(KEY_CONSTR_TIME) * 12
+            road_user = (((dm.get_result(COST_VOT) or 0.0) + (dm.get_result(COST_ACCIDENT) or 0.0))
+                         / (months * dm._construction_traffic_factor()))
+        else:
+            road_user = 0.0
+        # Traffic of the closures recurring every f years relative to the base year, at index f
+        # (DatabaseManager._event_traffic_factor); the last entry serves every f >= design life
+        self.closure_traffic = np.array([1.0] + [dm._event_traffic_factor(f) for f in range(1, int(self.design_life))]
+                                        + [1.0])
+
+        # Per-event amounts (today's money)
+        self.periodic_event = (init_cost + carbon_cost) * maint[KEY_PERIODIC_MAINT_COST]
+        self.inspection_event = init_cost * maint[KEY_MAJOR_INSP_COST]
+        self.repair_event = ((init_cost + carbon_cost) * maint[KEY_MAJOR_REPAIR_COST]
+                             + superstructure_cost * maint[KEY_MAJOR_INSP_COST])
+        self.repair_closure = (rerouting + road_user) * dm.DURATION_MAJOR_REPAIRS   # base year traffic
+        self.replacement_closure = (rerouting + road_user) * dm.DURATION_REPLACEMENT
+
+        # Everything that does not depend on the intervals
+        totals = timeline.totals()
+        self.fixed_cost = timeline.total() - sum(totals[head] for head in MAINTENANCE_HEADS)
+
+    def _pwf(self, intervals):
+        return present_worth_factor(self.inflation_rate, self.discount_rate, intervals, self.design_life)
+
+    def _closure_pwf(self, intervals):
+        """Present worth factor of closures every `intervals` years, charged with the traffic of their year"""
+        intervals = np.asarray(intervals)
+        return self._pwf(intervals) * self.closure_traffic[np.minimum(intervals, len(self.closure_traffic) - 1)]
+
+    def _growth(self, intervals, key):
+        if not self.deterioration_exponent:
+            return np.ones(np.shape(intervals))
+        return (np.asarray(intervals, dtype=float) / max(self.baseline_intervals[key], 1)) ** self.deterioration_exponent
+
+    def _periodic(self, fp):
+        return self.periodic_event * self._growth(fp, KEY_PERIODIC_MAINT_FREQ) * self._pwf(fp)
+
+    def _inspection(self, fi):
+        return self.inspection_event * self._pwf(fi)
+
+    def _repair_and_replacement(self, fr, fb):
+        """Cost of the coupled (major repair, replacement) pair; broadcasts fr against fb."""
+        fr, fb = np.broadcast_arrays(np.asarray(fr), np.asarray(fb))
+        shared = np.lcm(fr, fb)
+        return (self.repair_event * self._growth(fr, KEY_MAJOR_REPAIR_FREQ) * self._pwf(fr)
+                + self.repair_closure * self._closure_pwf(fr)
+                + self.replacement_closure * (self._closure_pwf(fb) - self._closure_pwf(shared)))
+
+    def evaluate(self, intervals: Dict[str, int]) -> float:
+        """Maintenance cost (present worth) of one schedule."""
+        fp, fi, fr, fb = (intervals[key] for key in INTERVAL_KEYS)
+        return float(self._periodic(fp) + self._inspection(fi) + self._repair_and_replacement(fr, fb))
+
+    def optimize(self, full_grid: Optional[bool] = None) -> MaintenanceSchedule:
+        """
+        Find the schedule with the lowest life cycle cost.
+
+        Args:
+            full_grid: Evaluate the whole joint grid. None decides by grid size
+                (MAX_FULL_GRID); the pruned search gives the same optimum.
+
+        Returns:
+            MaintenanceSchedule with the best intervals and the baseline for comparison
+        """
+        fp, fi, fr, fb = (self.candidates[key] for key in INTERVAL_KEYS)
+        size = len(fp) * len(fi) * len(fr) * len(fb)
+        if full_grid is None:
+            full_grid = size <= MAX_FULL_GRID
+
+        pair = self._repair_and_replacement(fr[:, None], fb[None, :])
+        if full_grid:
+            grid = (self._periodic(fp)[:, None, None, None] + self._inspection(fi)[None, :, None, None]
+                    + pair[None, None, :, :])
+            best = np.unravel_index(np.argmin(grid), grid.shape)
+            cost = float(grid[best])
+            evaluated = size
+        else:
+            periodic, inspection = self._periodic(fp), self._inspection(fi)
+            best_pair = np.unravel_index(np.argmin(pair), pair.shape)
+            best = (int(np.argmin(periodic)), int(np.argmin(inspection))) + tuple(best_pair)
+            cost = float(periodic[best[0]] + inspection[best[1]] + pair[best_pair])
+            evaluated = len(fp) + len(fi) + pair.size
+
+        intervals = {key: int(self.candidates[key][index]) for key, index in zip(INTERVAL_KEYS, best)}
+        baseline = self.evaluate(self.baseline_intervals)
+        return MaintenanceSchedule(
+            intervals=intervals,
+            total_lcc=self.fixed_cost + cost,
+            maintenance_cost=cost,
+            baseline_intervals=dict(self.baseline_intervals),
+            baseline_lcc=self.fixed_cost + baseline,
+            evaluated=evaluated,
+            # Present worth per interval; the major repair entry includes the replacement closures
+            costs={
+                KEY_PERIODIC_MAINT_FREQ: float(self._periodic(intervals[KEY_PERIODIC_MAINT_FREQ])),
+                KEY_MAJOR_INSP_FREQ: float(self._inspection(intervals[KEY_MAJOR_INSP_FREQ])),
+                KEY_MAJOR_REPAIR_FREQ: float(self._repair_and_replacement(intervals[KEY_MAJOR_REPAIR_FREQ],
+                                                                          intervals[KEY_BEARING_EXP_JOINT_REPAIR_FREQ])),
+            },
+        )
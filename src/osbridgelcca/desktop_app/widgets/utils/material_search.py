@@ -0,0 +1,206 @@
+"""
+Material search over a Schedule of Rates (SOR).
+
+Kept free of Qt so the search can be used and tested without the desktop
+application; sor_backend re-exports these names for the UI.
+"""
+import bisect
+import re
+from collections import OrderedDict
+
+import numpy as np
+
+# Characters dropped by normalize_text: all but alphanumerics, whitespace and dots (for decimals)
+SPECIAL_CHARS = re.compile(r'[^a-z0-9\s.]')
+
+
+def normalize_text(text):
+    """
+    Rule 1: Input Normalization
+    - Converts to lowercase.
+    - Removes special characters ((), -, /) using Regex.
+    - Collapses multiple spaces.
+    - Trims leading/trailing whitespace.
+    """
+    if not isinstance(text, str):
+        return ""
+
+    # 1. Lowercase
+    text = text.lower()
+
+    # 2. Remove special chars: Keep only alphanumeric, spaces, and dots (for decimals)
+    text = SPECIAL_CHARS.sub(' ', text)
+
+    # 3. Collapse multiple spaces into one and trim
+    return " ".join(text.split())
+
+
+class MaterialSearchIndex:
+    """
+    Search index over the materials of one SOR, built once when the SOR is loaded.
+
+    - names: normalized name of every material, in SOR order (category, then material)
+    - tokens: word -> position in the posting lists; postings hold the materials
+      whose name contains the word (CSR layout: offsets into one id array)
+    - suffixes: sorted suffixes of all words. A search token is a substring of a
+      name exactly when it is a prefix of one of these suffixes, so partial tokens
+      are one bisect range away from their words
+    - category masks: one boolean array over the materials per category type
+
+    A keystroke query is a few bisects, one vectorized gather per search token
+    and a boolean AND with the category mask. Tokens matching a large share of
+    the words (e.g. a single letter) are resolved with one pass over all
+    postings instead.
+    """
+    # Search token -> material mask memo (cleared with the index)
+    CACHE_SIZE = 256
+
+    def __init__(self, categories):
+        self.materials = []
+        self.names = []
+        self.category_types = []    # lower-cased 'type' of each category, in SOR order
+        category_of = []
+        for category_item in categories:
+            if not isinstance(category_item, dict): continue
+            self.category_types.append((category_item.get("type") or "").lower())
+            for material in category_item.get("data", []):
+                if not isinstance(material, dict): continue
+                self.materials.append(material)
+                self.names.append(normalize_text(material.get("name", "")))
+                category_of.append(len(self.category_types) - 1)
+        count = len(self.materials)
+        category_of = np.asarray(category_of, dtype=np.intp)
+        self.category_masks = [category_of == c for c in range(len(self.category_types))]
+
+        # First material of every normalized name (getDetailByName)
+        self.by_name = {}
+        for name, material in zip(self.names, self.materials):
+            self.by_name.setdefault(name, material)
+
+        # Posting list of every word
+        postings = {}
+        for i, name in enumerate(self.names):
+            for word in set(name.split(" ")):
+                if word:
+                    postings.setdefault(word, []).append(i)
+        self.tokens = {word: t for t, word in enumerate(postings)}
+        lengths = np.array([len(ids) for ids in postings.values()], dtype=np.intp)
+        self.offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.intp)
+        self.posting_ids = np.fromiter((i for ids in postings.values() for i in ids), dtype=np.intp,
+                                       count=int(self.offsets[-1]))
+        self.posting_tokens = np.repeat(np.arange(len(lengths)), lengths)
+
+        # Sorted suffix array over the vocabulary
+        suffixes = [word[k:] for word in self.tokens for k in range(len(word))]
+        suffix_tokens = np.repeat(np.arange(len(self.tokens)), [len(word) for word in self.tokens])
+        order = sorted(range(len(suffixes)), key=suffixes.__getitem__)
+        self.suffixes = [suffixes[k] for k in order]
+        self.suffix_tokens = suffix_tokens[np.asarray(order, dtype=np.intp)]
+
+        self.size = count
+        self._all = np.ones(count, dtype=bool)
+        self._token_masks = OrderedDict()
+
+    def _words_containing(self, token):
+        """Ids of the words of which `token` is a substring (with repeats)."""
+        lo = bisect.bisect_left(self.suffixes, token)
+        hi = bisect.bisect_left(self.suffixes, token + "\U0010ffff", lo)
+        return self.suffix_tokens[lo:hi]
+
+    def token_mask(self, token):
+        """Boolean array of the materials whose normalized name contains `token`."""
+        mask = self._token_masks.get(token)
+        if mask is not None:
+            self._token_masks.move_to_end(token)
+            return mask
+        words = self._words_containing(token)
+        mask = np.zeros(self.size, dtype=bool)
+        if len(words) * 8 > len(self.tokens):
+            # Broad token: flag the words, then one pass over every posting
+            hit = np.zeros(len(self.tokens), dtype=bool)
+            hit[words] = True
+            mask[self.posting_ids[hit[self.posting_tokens]]] = True
+        else:
+            words = np.unique(words)
+            starts, ends = self.offsets[words], self.offsets[words + 1]
+            lengths = ends - starts
+            # Concatenate the posting lists of all matching words in one gather
+            positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            mask[self.posting_ids[positions]] = True
+        mask.setflags(write=False)
+        self._token_masks[token] = mask
+        if len(self._token_masks) > self.CACHE_SIZE:
+            self._token_masks.popitem(last=False)
+        return mask
+
+    def category_mask(self, selected_categories):
+        """Materials of the categories whose type contains one of the selected names (all if none)."""
+        if not selected_categories:
+            return self._all
+        selected = [sel.lower() for sel in selected_categories]
+        mask = np.zeros(self.size, dtype=bool)
+        for category_type, category_mask in zip(self.category_types, self.category_masks):
+            if any(sel in category_type for sel in selected):
+                mask |= category_mask
+        return mask
+
+    def search(self, selected_categories, search_tokens):
+        """Positions (in SOR order) of the materials matching every token in the selected categories."""
+        mask = self.category_mask(selected_categories)
+        for token in sorted(search_tokens, key=len, reverse=True):
+            mask = mask & self.token_mask(token)
+            if not mask.any():
+                break
+        return np.flatnonzero(mask)
+
+
+class AdvancedMaterialSearch:
+    def __init__(self, json_source):
+        # 1. ROBUST INIT: Handle potential double-nested lists from JSON loads
+        if isinstance(json_source, list) and len(json_source) > 0 and isinstance(json_source[0], list):
+            self.json_data = json_source[0]
+        else:
+            self.json_data = json_source
+            
+        self.all_categories = []
+        self.index = MaterialSearchIndex(self.json_data)
+
+    def _normalize_text(self, text):
+        """Rule 1: Input Normalization (see normalize_text)."""
+        return normalize_text(text)
+
+    def getAllCategories(self):
+        """Helper to retrieve available 'type' categories."""
+        self.all_categories = []
+        for item in self.json_data:
+            if isinstance(item, dict):
+                cat = item.get("type")
+                if cat and cat not in self.all_categories:
+                    self.all_categories.append(cat)
+        return self.all_categories
+
+    def performSearch(self, selected_categories, user_input):
+        """
+        Implements Rules 2 & 3: Tokenized Matching & Type-based Filtering.
+
+        Every search token must occur in the normalized material name; the
+        selected categories match any type containing one of them. Served by
+        the search index, results are in SOR order.
+        """
+        normalized_input = self._normalize_text(user_input)
+        search_tokens = [t for t in normalized_input.split(" ") if t]
+
+        if not search_tokens:
+            return [] 
+
+        materials = self.index.materials
+        return [materials[i] for i in self.index.search(selected_categories, search_tokens).tolist()]
+
+    # NEW FUNCTION: Get Detail By Name
+    def getDetailByName(self, material_name):
+        """
+        Searches for an exact material by name (normalized).
+        Returns the full dictionary if found, otherwise None.
+        """
+        # Normalize the input name so exact punctuation/case doesn't matter
+        return self.index.by_name.get(self._normalize_text(material_name))
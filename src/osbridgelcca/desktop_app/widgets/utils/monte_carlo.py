@@ -0,0 +1,199 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from osbridgelcca.core import lcc_kernel
+from osbridgelcca.desktop_app.widgets.utils.data import *
+
+# Parameters that can be given a distribution. Rates, quantities and traffic
+# are sampled as multipliers on the values entered in the UI, the others
+# replace the UI value directly.
+PARAM_DISCOUNT_RATE = "discount_rate"
+PARAM_INFLATION_RATE = "inflation_rate"
+PARAM_SCC = "scc"
+PARAM_RATE = "rate"
+PARAM_QUANTITY = "quantity"
+PARAM_TRAFFIC = "traffic"
+UNCERTAIN_PARAMETERS = [PARAM_DISCOUNT_RATE, PARAM_INFLATION_RATE, PARAM_SCC,
+                        PARAM_RATE, PARAM_QUANTITY, PARAM_TRAFFIC]
+
+# Traffic multipliers at which the rerouting emission factor is tabulated when
+# traffic is uncertain; draws in between are interpolated, draws outside clamp
+TRAFFIC_MULTIPLIER_GRID = np.linspace(0.05, 4.0, 80)
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """
+    Probability distribution of one uncertain input.
+
+    kind is one of 'fixed', 'uniform', 'normal', 'lognormal' or 'triangular'
+    and params are passed to the matching numpy Generator method:
+        fixed      (value,)
+        uniform    (low, high)
+        normal     (mean, std)
+        lognormal  (mean, sigma) of the underlying normal
+        triangular (left, mode, right)
+    """
+    kind: str
+    params: Tuple[float, ...]
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.kind == "fixed":
+            return np.full(size, float(self.params[0]))
+        if self.kind == "uniform":
+            return rng.uniform(*self.params, size=size)
+        if self.kind == "normal":
+            return rng.normal(*self.params, size=size)
+        if self.kind == "lognormal":
+            return rng.lognormal(*self.params, size=size)
+        if self.kind == "triangular":
+            return rng.triangular(*self.params, size=size)
+        raise ValueError(f"Unknown distribution kind: '{self.kind}'")
+
+
+@dataclass
+class MonteCarloResult:
+    """Sampled cost heads of a Monte Carlo run."""
+    samples: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def n_samples(self) -> int:
+        return len(next(iter(self.samples.values()))) if self.samples else 0
+
+    def percentiles(self, q: Sequence[float] = (5, 50, 95)) -> Dict[str, Dict[str, float]]:
+        """
+        Percentiles of every cost head.
+
+        Returns:
+            {head: {"P5": ..., "P50": ..., "P95": ...}}
+        """
+        output = {}
+        for head, values in self.samples.items():
+            points = np.percentile(values, q)
+            output[head] = {f"P{p:g}": float(v) for p, v in zip(q, points)}
+        return output
+
+
+def _evaluate_batch(base: Dict, draws: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Evaluate the cost chain for a batch of parameter draws.
+
+    Args:
+        base: Kernel inputs and constants (see MonteCarloLCC.__init__)
+        draws: Sampled parameter arrays, one entry per UNCERTAIN_PARAMETERS name
+
+    Returns:
+        Dictionary of cost head -> ndarray with one value per draw
+    """
+    inputs = dict(base["inputs"])
+    constants = dict(base["constants"])
+    cost_factor = draws[PARAM_RATE] * draws[PARAM_QUANTITY]
+    inputs["inflation_rate"] = draws[PARAM_INFLATION_RATE]
+    inputs["discount_rate"] = draws[PARAM_DISCOUNT_RATE]
+    inputs["scc"] = draws[PARAM_SCC]
+    for key in ("init_cost", "superstructure_cost", "recyclable_value"):
+        inputs[key] = inputs[key] * cost_factor
+    inputs["carbon_quantity"] = inputs["carbon_quantity"] * draws[PARAM_QUANTITY]
+    for key in ("total_traffic", "vot", "accident_cost"):
+        inputs[key] = inputs[key] * draws[PARAM_TRAFFIC]
+    if "co2_curve" in base:
+        # More rerouted traffic means more congestion and fuel per vehicle-km
+        constants["co2_emission_per_km"] = np.interp(draws[PARAM_TRAFFIC], *base["co2_curve"])
+
+    heads = lcc_kernel.evaluate(inputs, constants)
+    return {KERNEL_HEAD_KEYS[name]: np.broadcast_to(values, cost_factor.shape).copy()
+            for name, values in heads.items()}
+
+
+def _run_batch(args) -> Dict[str, np.ndarray]:
+    """Worker entry point: sample one batch and evaluate it."""
+    base, distributions, size, seed = args
+    rng = np.random.default_rng(seed)
+    draws = {name: distributions[name].sample(rng, size) for name in UNCERTAIN_PARAMETERS}
+    return _evaluate_batch(base, draws)
+
+
+class MonteCarloLCC:
+    """
+    Probabilistic life cycle cost analysis on top of the DatabaseManager inputs.
+
+    The deterministic inputs (BOQ totals, financial, traffic, maintenance and
+    demolition data) are captured once from the DatabaseManager. Each draw then
+    replaces the uncertain parameters and the whole cost chain is evaluated as
+    array arithmetic, batch by batch, optionally across a process pool.
+
+    Example:
+        mc = MonteCarloLCC(database_manager, {
+            "discount_rate": Distribution("triangular", (0.05, 0.067, 0.08)),
+            "rate": Distribution("normal", (1.0, 0.1)),
+        })
+        result = mc.run(n_samples=100_000)
+        result.percentiles()[COST_TOTAL_LCC]
+    """
+
+    def __init__(self, database_manager, distributions: Optional[Dict[str, Distribution]] = None):
+        """
+        Args:
+            database_manager: DatabaseManager holding the project inputs
+            distributions: Parameter name -> Distribution. Parameters left out
+                stay at their UI value (multiplier 1.0 for rate/quantity/traffic).
+        """
+        distributions = dict(distributions or {})
+        unknown = [name for name in distributions if name not in UNCERTAIN_PARAMETERS]
+        if unknown:
+            raise ValueError(f"Unknown uncertain parameter(s): {unknown}. "
+                             f"Valid options: {UNCERTAIN_PARAMETERS}")
+
+        # Plain inputs only, so batches can be shipped to worker processes
+        inputs = database_manager.kernel_inputs()
+        self.base = {"inputs": inputs, "constants": database_manager.kernel_constants()}
+        defaults = {
+            PARAM_DISCOUNT_RATE: Distribution("fixed", (inputs["discount_rate"],)),
+            PARAM_INFLATION_RATE: Distribution("fixed", (inputs["inflation_rate"],)),
+            PARAM_SCC: Distribution("fixed", (inputs["scc"],)),
+            PARAM_RATE: Distribution("fixed", (1.0,)),
+            PARAM_QUANTITY: Distribution("fixed", (1.0,)),
+            PARAM_TRAFFIC: Distribution("fixed", (1.0,)),
+        }
+        self.distributions = {**defaults, **distributions}
+        traffic = self.distributions[PARAM_TRAFFIC]
+        if traffic != Distribution("fixed", (1.0,)):
+            self.base["co2_curve"] = (TRAFFIC_MULTIPLIER_GRID,
+                                      database_manager.rerouting_emission_factor(TRAFFIC_MULTIPLIER_GRID))
+
+    def run(self, n_samples: int = 100_000, batch_size: int = 10_000,
+            workers: Optional[int] = None, seed: Optional[int] = None) -> MonteCarloResult:
+        """
+        Sample and evaluate the cost chain.
+
+        Args:
+            n_samples: Total number of draws
+            batch_size: Draws evaluated together in one vectorized batch
+            workers: Worker processes. None uses os.cpu_count(); 1 runs in-process.
+            seed: Seed for reproducible runs. Results do not depend on `workers`.
+
+        Returns:
+            MonteCarloResult with the full distribution of every cost head
+        """
+        if n_samples <= 0 or batch_size <= 0:
+            raise ValueError("n_samples and batch_size must be positive")
+
+        sizes = [batch_size] * (n_samples // batch_size)
+        if n_samples % batch_size:
+            sizes.append(n_samples % batch_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        tasks = [(self.base, self.distributions, size, s) for size, s in zip(sizes, seeds)]
+
+        workers = min(workers or os.cpu_count() or 1, len(tasks))
+        if workers == 1:
+            batches = [_run_batch(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                batches = list(executor.map(_run_batch, tasks))
+
+        return MonteCarloResult({head: np.concatenate([batch[head] for batch in batches])
+                                 for head in batches[0]})
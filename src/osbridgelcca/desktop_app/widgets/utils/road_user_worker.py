@@ -0,0 +1,155 @@
+"""
+Background computation of the road user costs.
+
+The value of time, accident and rerouting VOC heads are the slow part of a
+refresh (IRC SP 30 table lookups and the VOC models). RoadUserCostRunner
+computes them on a QThreadPool so the UI stays responsive, reports progress
+per head and delivers the results on the UI thread.
+
+If a head fails, the heads computed before it are still delivered (and
+stored) before the error is reported.
+
+Every run carries a generation number. Editing an input the road user costs
+depend on, or calling start()/cancel(), bumps the generation: the running
+task stops after its current head and its results are discarded, so stale
+values never reach DatabaseManager.results.
+
+Example:
+    runner = RoadUserCostRunner(database_manager)
+    runner.progress.connect(lambda percent, head: bar.setValue(percent))
+    runner.resultReady.connect(results_widget.update_road_user_costs)
+    runner.errorOccurred.connect(status_label.setText)
+    runner.start()
+    ...
+    runner.shutdown()   # when the window closes
+"""
+from typing import Callable, Dict, Set
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
+
+from osbridgelcca.desktop_app.widgets.utils.data import *
+
+# Heads produced by DatabaseManager.road_user_cost_stages()
+ROAD_USER_HEADS = (COST_VOT, COST_ACCIDENT, COST_REROUTING_VOC)
+
+
+class RoadUserCostSignals(QObject):
+    """
+    Signals of one RoadUserCostTask, all tagged with the task's generation.
+
+    failed carries the heads finished before the error.
+    """
+    progress = Signal(int, int, str)
+    finished = Signal(int, dict)
+    failed = Signal(int, dict, str)
+    cancelled = Signal(int)
+
+
+class RoadUserCostTask(QRunnable):
+    """Runs DatabaseManager.road_user_cost_stages() on a pool thread."""
+
+    def __init__(self, database_manager, generation: int, is_current: Callable[[int], bool]):
+        super().__init__()
+        self.database_manager = database_manager
+        self.generation = generation
+        self.is_current = is_current
+        self.signals = RoadUserCostSignals()
+
+    @Slot()
+    def run(self):
+        results = {}
+        try:
+            for done, (head, value) in enumerate(self.database_manager.road_user_cost_stages(), start=1):
+                # Inputs changed while this head was computed: drop the run
+                if not self.is_current(self.generation):
+                    self.signals.cancelled.emit(self.generation)
+                    return
+                results[head] = value
+                self.signals.progress.emit(self.generation, done * 100 // len(ROAD_USER_HEADS), head)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, results, str(e))
+            return
+        results[COST_TOTAL_ROAD_USER] = sum(results.values())
+        self.signals.finished.emit(self.generation, results)
+
+
+class RoadUserCostRunner(QObject):
+    """
+    Keeps the road user costs of a DatabaseManager up to date off the UI thread.
+
+    The heads are registered as background heads, so DatabaseManager.refresh()
+    leaves them to this runner. A change to one of their inputs restarts the
+    computation; requests arriving in the same event loop iteration are
+    coalesced into one run.
+    """
+    progress = Signal(int, str)
+    resultReady = Signal(dict)
+    errorOccurred = Signal(str)
+
+    def __init__(self, database_manager, pool: QThreadPool = None, parent: QObject = None):
+        super().__init__(parent)
+        self.database_manager = database_manager
+        self.pool = pool or QThreadPool.globalInstance()
+        self._generation = 0
+        self._scheduled = False
+        self.running = False
+
+        database_manager.background_heads |= {COST_VOT, COST_ACCIDENT}
+        database_manager.add_input_listener(self._on_inputs_changed)
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def _on_inputs_changed(self, affected: Set[str]):
+        if affected & set(ROAD_USER_HEADS):
+            self.start()
+
+    def start(self):
+        """Cancel any run in progress and schedule a new one."""
+        self._generation += 1
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._launch)
+
+    def cancel(self):
+        """Discard the run in progress (if any) without starting another."""
+        self._generation += 1
+        self._scheduled = False
+        self.running = False
+
+    def _launch(self):
+        if not self._scheduled:
+            return
+        self._scheduled = False
+        self.running = True
+        task = RoadUserCostTask(self.database_manager, self._generation, self._is_current)
+        task.signals.progress.connect(self._on_progress)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        self.pool.start(task)
+
+    def _on_progress(self, generation: int, percent: int, head: str):
+        if self._is_current(generation):
+            self.progress.emit(percent, head)
+
+    def _on_finished(self, generation: int, results: Dict[str, float]):
+        if not self._is_current(generation):
+            return
+        self.running = False
+        self.database_manager.apply_road_user_results(results)
+        self.resultReady.emit(results)
+
+    def _on_failed(self, generation: int, results: Dict[str, float], message: str):
+        if not self._is_current(generation):
+            return
+        self.running = False
+        if results:
+            self.database_manager.apply_road_user_results(results)
+            self.resultReady.emit(results)
+        self.errorOccurred.emit(message)
+
+    def shutdown(self, timeout_ms: int = 2000):
+        """Stop listening for input changes and wait for a running task to end."""
+        self.cancel()
+        self.database_manager.remove_input_listener(self._on_inputs_changed)
+        self.pool.waitForDone(timeout_ms)
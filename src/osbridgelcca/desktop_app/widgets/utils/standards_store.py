@@ -0,0 +1,288 @@
+"""
+Versioned store of the standards tables (IRC SP-30 editions and WPI series).
+
+The tables live in data/databases/standards.sql (shipped as package data),
+compiled on first use into a read-only SQLite file in the user cache
+directory (see user_cache_dir). The file is memory-mapped (PRAGMA
+mmap_size), so only the pages of the tables actually queried are read. Every table of an edition is
+loaded on request into a CompiledTable and kept for the life of the store;
+WPI series can be queried for a range of years and columns without loading
+the whole table. Several editions, and projects with different WPI years,
+can be evaluated side by side from one store.
+
+Example:
+    store = default_store()
+    store.editions()                                    # ['IRC SP-30:2019']
+    store.table("IRC SP-30:2019", "vot_of_passengers").get(KEY_SMALL_CARS, KEY_TWO_LANE_ROAD)
+    years, values = store.wpi_series("IRC SP-30:2019", "wpi_vot", [KEY_LCV], 2020, 2024)
+"""
+import functools
+import hashlib
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+DEFAULT_EDITION = "IRC SP-30:2019"
+STANDARDS_SQL = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))), "data", "databases", "standards.sql")
+# Upper bound of the memory-mapped part of the store (bytes)
+MMAP_SIZE = 64 * 1024 * 1024
+# Environment variable overriding the cache directory
+CACHE_DIR_ENV = "OSBRIDGELCCA_CACHE_DIR"
+
+Keys = Union[str, int, Iterable]
+
+
+class CompiledTable:
+    """
+    Immutable lookup table compiled from one standards table.
+
+    row_index and column_index map a key (vehicle type, road type, year, ...)
+    to its position in `values` (rows x columns, read-only).
+    """
+    __slots__ = ("name", "index_name", "rows", "columns", "values", "row_index", "column_index")
+
+    def __init__(self, name: str, index_name: str, rows: Iterable, columns: Iterable[str], values):
+        self.name = name
+        self.index_name = index_name
+        self.rows = tuple(rows)
+        self.columns = tuple(columns)
+        self.values = np.array(values, dtype=float).reshape(len(self.rows), len(self.columns))
+        self.values.setflags(write=False)
+        self.row_index = MappingProxyType({row: i for i, row in enumerate(self.rows)})
+        self.column_index = MappingProxyType({column: i for i, column in enumerate(self.columns)})
+
+    @staticmethod
+    def _codes(index: Mapping, keys: Keys):
+        """Position of one key (int) or of every key in a sequence (array); KeyError if absent."""
+        if isinstance(keys, (str, int, np.integer)):
+            return index[keys]
+        return np.array([index[key] for key in keys], dtype=np.intp)
+
+    def get(self, row, column) -> float:
+        """Single value; KeyError for an unknown row or column."""
+        return float(self.values[self.row_index[row], self.column_index[column]])
+
+    def lookup(self, rows: Keys, columns: Keys) -> np.ndarray:
+        """Values for rows x columns; sequences of keys broadcast against each other."""
+        return self.values[self._codes(self.row_index, rows), self._codes(self.column_index, columns)]
+
+    def to_frame(self):
+        """pandas DataFrame of the table, as the standard prints it."""
+        import pandas as pd
+        return pd.DataFrame(self.values, index=pd.Index(self.rows, name=self.index_name), columns=list(self.columns))
+
+
+def build_store(sql_path: str = STANDARDS_SQL, db_path: Optional[str] = None) -> str:
+    """
+    Compile the standards SQL script into a SQLite file.
+
+    The file is written next to a temporary name and moved into place, so a
+    concurrent reader never sees a partial store.
+
+    Returns:
+        Path of the SQLite file
+    """
+    if db_path is None:
+        db_path = os.path.splitext(sql_path)[0] + ".db"
+    with open(sql_path, encoding="utf-8") as file:
+        script = file.read()
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(db_path)), suffix=".tmp")
+    os.close(handle)
+    try:
+        conn = sqlite3.connect(temp_path)
+        try:
+            conn.executescript(script)
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(temp_path, db_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return db_path
+
+
+def user_cache_dir() -> str:
+    """
+    Per-user folder for compiled stores and precomputed grids, created on
+    first use: $OSBRIDGELCCA_CACHE_DIR if set, else the platform cache folder
+    (%LOCALAPPDATA%, ~/Library/Caches or $XDG_CACHE_HOME / ~/.cache) and
+    the system temporary folder if that is not writable.
+    """
+    path = os.environ.get(CACHE_DIR_ENV)
+    if not path:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+        elif sys.platform == "darwin":
+            base = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+        path = os.path.join(base, "osbridgelcca")
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        path = os.path.join(tempfile.gettempdir(), "osbridgelcca")
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _compiled_path(sql_path: str) -> str:
+    """
+    SQLite file of a script in the user cache directory, named by the hash of
+    the script so an edited or upgraded script gets its own, fresh store.
+    """
+    with open(sql_path, "rb") as file:
+        digest = hashlib.sha256(file.read()).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(sql_path))[0]
+    db_path = os.path.join(user_cache_dir(), f"{name}-{digest}.db")
+    if not os.path.exists(db_path):
+        build_store(sql_path, db_path)
+    return db_path
+
+
+class StandardsStore:
+    """
+    Read-only access to a compiled standards store.
+
+    Queries are serialised by a lock, so one store can be shared by the UI
+    and background workers.
+    """
+
+    def __init__(self, path: Optional[str] = None, mmap_size: int = MMAP_SIZE):
+        """
+        Args:
+            path: SQLite file (see build_store) or .sql script; None uses STANDARDS_SQL
+            mmap_size: Bytes of the file to memory-map
+        """
+        path = STANDARDS_SQL if path is None else path
+        if path.endswith(".sql"):
+            path = _compiled_path(path)
+        if not os.path.exists(path):
+            raise ValueError(f"Standards store not found: '{path}'")
+        self.path = path
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        self._lock = threading.Lock()
+        self._tables: Dict[Tuple[str, str], CompiledTable] = {}
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self):
+        self._conn.close()
+
+    def editions(self) -> List[str]:
+        """Names of the editions in the store."""
+        return [edition for edition, in self._query("SELECT edition FROM editions ORDER BY edition")]
+
+    def edition_info(self, edition: str) -> Dict[str, Any]:
+        """Title and WPI base year of an edition."""
+        rows = self._query("SELECT title, base_year FROM editions WHERE edition = ?", (edition,))
+        if not rows:
+            raise ValueError(f"Unknown standards edition: '{edition}'. Available: {self.editions()}")
+        title, base_year = rows[0]
+        return {"edition": edition, "title": title, "base_year": base_year}
+
+    def table_names(self, edition: str) -> List[str]:
+        return [name for name, in self._query(
+            "SELECT name FROM standard_tables WHERE edition = ? ORDER BY name", (edition,))]
+
+    def _index_name(self, edition: str, name: str) -> str:
+        rows = self._query("SELECT index_name FROM standard_tables WHERE edition = ? AND name = ?", (edition, name))
+        if not rows:
+            raise ValueError(f"Table '{name}' is not in edition '{edition}'. "
+                             f"Available: {self.table_names(edition)}")
+        return rows[0][0]
+
+    def table(self, edition: str, name: str) -> CompiledTable:
+        """A whole table of an edition, compiled on first request."""
+        key = (edition, name)
+        if key not in self._tables:
+            index_name = self._index_name(edition, name)
+            cells = self._query(
+                "SELECT row_pos, row_key, col_pos, col_key, value FROM standard_values "
+                "WHERE edition = ? AND name = ?", (edition, name))
+            self._tables[key] = self._compile(name, index_name, cells)
+        return self._tables[key]
+
+    @staticmethod
+    def _compile(name, index_name, cells) -> CompiledTable:
+        rows = dict(sorted({(row_pos, row_key) for row_pos, row_key, _, _, _ in cells}))
+        columns = dict(sorted({(col_pos, col_key) for _, _, col_pos, col_key, _ in cells}))
+        row_codes = {row_pos: r for r, row_pos in enumerate(rows)}
+        col_codes = {col_pos: c for c, col_pos in enumerate(columns)}
+        values = np.full((len(rows), len(columns)), np.nan)
+        for row_pos, _, col_pos, _, value in cells:
+            values[row_codes[row_pos], col_codes[col_pos]] = value
+        return CompiledTable(name, index_name, rows.values(), columns.values(), values)
+
+    def units(self, edition: str, name: str) -> Dict[Any, str]:
+        """Unit of each row of a table that records one."""
+        return dict(self._query(
+            "SELECT DISTINCT row_key, unit FROM standard_values "
+            "WHERE edition = ? AND name = ? AND unit IS NOT NULL", (edition, name)))
+
+    def wpi_years(self, edition: str, name: str) -> List[int]:
+        """Years of a WPI series."""
+        self._index_name(edition, name)
+        return [year for year, in self._query(
+            "SELECT DISTINCT row_key FROM standard_values WHERE edition = ? AND name = ? ORDER BY row_key",
+            (edition, name))]
+
+    def wpi_series(self, edition: str, name: str, columns: Optional[Iterable[str]] = None,
+                   start: Optional[int] = None, end: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Index values of a WPI series between two years (inclusive).
+
+        Only the requested slice is read from the store.
+
+        Args:
+            edition, name: Edition and year indexed table, e.g. TABLE_VOT
+            columns: Columns to read, default all (in table order)
+            start, end: First and last year, default the whole series
+
+        Returns:
+            (years, values) with values of shape (years, columns)
+        """
+        self._index_name(edition, name)
+        sql = "SELECT row_key, col_key, value FROM standard_values WHERE edition = ? AND name = ?"
+        params = [edition, name]
+        if start is not None:
+            sql += " AND row_key >= ?"
+            params.append(int(start))
+        if end is not None:
+            sql += " AND row_key <= ?"
+            params.append(int(end))
+        if columns is not None:
+            columns = list(columns)
+            sql += f" AND col_key IN ({', '.join('?' * len(columns))})"
+            params.extend(columns)
+        cells = self._query(sql + " ORDER BY row_key, col_pos", tuple(params))
+
+        years = sorted({year for year, _, _ in cells})
+        if columns is None:
+            columns = list(dict.fromkeys(column for _, column, _ in cells))
+        missing = [column for column in columns if column not in {column for _, column, _ in cells}]
+        if missing and years:
+            raise ValueError(f"Column(s) {missing} not found in '{name}'")
+        year_codes = {year: y for y, year in enumerate(years)}
+        col_codes = {column: c for c, column in enumerate(columns)}
+        values = np.full((len(years), len(columns)), np.nan)
+        for year, column, value in cells:
+            values[year_codes[year], col_codes[column]] = value
+        return np.array(years, dtype=int), values
+
+
+@functools.lru_cache(maxsize=None)
+def default_store() -> StandardsStore:
+    """Store compiled from STANDARDS_SQL, shared by the whole process."""
+    return StandardsStore()
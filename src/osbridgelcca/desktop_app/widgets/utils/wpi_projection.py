@@ -0,0 +1,93 @@
+"""
+Projection of the WPI series beyond the years of the standards tables.
+
+Every column of a year indexed table (fuel, tyres, spare parts, VOT,
+medical, ...) gets a log-linear trend, log(index) = a + b * year, fitted
+by least squares to all columns at once. Years in the table keep their
+published index. Later (earlier) years continue from the last (first)
+published value at the fitted growth rate, so the series has no jump at
+the edge of the table. Fits are cached per compiled table, i.e. once per
+edition and table of a standards store.
+
+Example:
+    trend = fit_trend(IRC_SP_30().tables[TABLE_VOT])
+    trend.growth_rate()                                   # annual growth per column
+    trend.project(np.arange(2024, 2075), [KEY_LCV, KEY_HCV])  # (51, 2)
+"""
+import functools
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from osbridgelcca.desktop_app.widgets.utils.standards_store import CompiledTable
+
+Years = Union[int, Iterable[int]]
+
+
+class WPITrend:
+    """Log-linear trend of every column of one WPI table."""
+    __slots__ = ("name", "years", "columns", "column_index", "values", "intercept", "slope")
+
+    def __init__(self, table: CompiledTable):
+        order = np.argsort(np.asarray(table.rows, dtype=float))
+        self.name = table.name
+        self.years = np.asarray(table.rows, dtype=int)[order]
+        self.columns = table.columns
+        self.column_index = table.column_index
+        self.values = np.asarray(table.values, dtype=float)[order]
+        if len(self.years) == 0:
+            raise ValueError(f"WPI table '{table.name}' has no years to fit")
+
+        # Least squares on all columns together; a column with a
+        # non-positive index cannot be log-fitted and is held flat
+        t = self.years - self.years[0]
+        design = np.stack([np.ones(len(t)), t], axis=1).astype(float)
+        positive = (self.values > 0).all(axis=0)
+        logs = np.log(np.where(self.values > 0, self.values, 1.0))
+        if len(t) > 1:
+            (intercept, slope), *_ = np.linalg.lstsq(design, logs, rcond=None)
+        else:
+            intercept, slope = logs[0], np.zeros(len(self.columns))
+        self.intercept = np.where(positive, intercept, np.nan)
+        self.slope = np.where(positive, slope, 0.0)
+
+    def growth_rate(self) -> np.ndarray:
+        """Fitted annual growth rate of each column."""
+        return np.expm1(self.slope)
+
+    def _column_codes(self, columns):
+        if columns is None:
+            return slice(None)
+        return CompiledTable._codes(self.column_index, columns)
+
+    def project(self, years: Years, columns: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        Index values for any years.
+
+        Args:
+            years: Year or array of years
+            columns: Column name or sequence of names, default all columns
+
+        Returns:
+            Array (years..., columns) (the columns axis is dropped for a
+            single column name); KeyError for an unknown column
+        """
+        codes = self._column_codes(columns)
+        years = np.asarray(years, dtype=int)
+        first, last = self.years[0], self.years[-1]
+
+        pos = np.clip(np.searchsorted(self.years, years), 0, len(self.years) - 1)
+        published = self.years[pos] == years
+        # Beyond the table continue from its first/last value, inside a gap use the fit
+        after = self.values[-1] * np.exp(self.slope * (years[..., None] - last))
+        before = self.values[0] * np.exp(self.slope * (years[..., None] - first))
+        fitted = np.exp(self.intercept + self.slope * (years[..., None] - first))
+        projected = np.where((years > last)[..., None], after, np.where((years < first)[..., None], before, fitted))
+        values = np.where(published[..., None], self.values[pos], projected)
+        return values[..., codes]
+
+
+@functools.lru_cache(maxsize=None)
+def fit_trend(table: CompiledTable) -> WPITrend:
+    """Trend of a compiled WPI table, fitted once per table."""
+    return WPITrend(table)
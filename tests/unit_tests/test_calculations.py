@@ -1,5 +1,13 @@
 import pytest
 from core.cost_component import *
+from core.present_worth import present_worth_factor
+from core.cash_flow import CashFlowTimeline, repeat_cycles
+from core.bridge_lcc import BridgeLCC
+from core import lcc_kernel
+from core.cost_registry import CostRegistry
+from core.cash_flow import event_schedule
+from core.traffic_projection import discounted_mean, growth_factors, period_mean, project_adt
+from core.accident_cost import accident_costs, accidents, category_weights
 
 # ✅ Test Initial Construction Cost
 @pytest.mark.unit
@@ -18,4 +26,168 @@ def test_initial_carbon_emission_cost():
 def test_road_user_cost():
     cost = RoadUserCost(vehicles_affected=1000, vehicle_operation_cost=10, construction_time=2)
     assert cost.calculate_cost() == 20000
-# Placeholder for test calculations
+
+# ✅ Test Closed-Form Present Worth Factor
+@pytest.mark.unit
+def test_present_worth_factor_matches_series():
+    ratio = (1 + 0.0515) / (1 + 0.067)
+    expected = sum(ratio ** period for period in range(5, 50, 5))
+    assert present_worth_factor(0.0515, 0.067, 5, 50) == pytest.approx(expected)
+    factors = present_worth_factor(0.0515, 0.067, [1, 5, 0], 50)
+    assert factors[1] == pytest.approx(expected)
+    assert factors[2] == 0.0
+
+# ✅ Test Cash Flow Timeline Reductions
+@pytest.mark.unit
+def test_cash_flow_timeline_totals():
+    timeline = CashFlowTimeline(50, inflation_rate=0.0515, discount_rate=0.067)
+    timeline.add_one_time("Initial", 1000, year=0)
+    timeline.add_recurring("Inspection", 10, frequency=5, horizon=50)
+    timeline.add_recurring("Recycling", 100, frequency=25, horizon=50, credit=True)
+    totals = timeline.build().totals()
+    assert totals["Initial"] == pytest.approx(1000)
+    assert totals["Inspection"] == pytest.approx(10 * present_worth_factor(0.0515, 0.067, 5, 50))
+    assert timeline.total() == pytest.approx(totals["Initial"] + totals["Inspection"] - totals["Recycling"])
+    assert timeline.peak_year(heads=["Inspection"]) == 45
+
+# ✅ Test Batch Scenario Evaluation
+@pytest.mark.unit
+def test_bridge_lcc_evaluate_batch_matches_single():
+    inputs = {"bill_of_quantity": {"steel": 100, "concrete": 50}, "maintenance_cost": 20,
+              "vehicle_operating_cost": 5, "discount_rate": 0.05}
+    expected = BridgeLCC("single", inputs).calculate_lcc()
+    grid = BridgeLCC.scenario_grid({"bill_of_quantity": [[100, 50], [200, 80]], "maintenance_cost": 20,
+                                    "vehicle_operating_cost": 5}, {"discount_rate": [0.05, 0.07, 0.09]})
+    results = BridgeLCC.evaluate_batch(grid)
+    assert len(results["total_lcc"]) == 6
+    assert results["total_lcc"][0] == pytest.approx(expected)
+    with pytest.raises(ValueError, match="maintenance_cost"):
+        BridgeLCC.evaluate_batch({**grid, "maintenance_cost": [20, 30]})
+    with pytest.raises(ValueError, match=r"bill_of_quantity\[concrete\]"):
+        BridgeLCC.evaluate_batch({**inputs, "bill_of_quantity": {"steel": [100, 200], "concrete": [50]}})
+
+# ✅ Test Scenario Grid with a 2D Financial Column
+@pytest.mark.unit
+def test_bridge_lcc_scenario_grid_2d_financial_column():
+    grid = BridgeLCC.scenario_grid({"maintenance_cost": [20, 30], "vehicle_operating_cost": 5},
+                                   {"discount_rate": [0.05, 0.07], "bill_of_quantity": [[100, 50], [200, 80]]})
+    assert grid["bill_of_quantity"].tolist() == [[100, 50], [200, 80], [100, 50], [200, 80]]
+    assert grid["maintenance_cost"].tolist() == [20, 20, 30, 30]
+    assert grid["discount_rate"].tolist() == [0.05, 0.07, 0.05, 0.07]
+    results = BridgeLCC.evaluate_batch(grid)
+    expected = BridgeLCC("single", {"bill_of_quantity": {"steel": 200, "concrete": 80}, "maintenance_cost": 30,
+                                    "vehicle_operating_cost": 5, "discount_rate": 0.07}).calculate_lcc()
+    assert results["total_lcc"][3] == pytest.approx(expected)
+
+# ✅ Test Batch Scenario Evaluation over the Design Life
+@pytest.mark.unit
+def test_bridge_lcc_evaluate_batch_design_life():
+    scenarios = {"bill_of_quantity": [[100, 50], [200, 80]], "maintenance_cost": 20, "vehicle_operating_cost": 5,
+                 "discount_rate": 0.05, "inflation_rate": 0.02, "design_life": [1, 30]}
+    results = BridgeLCC.evaluate_batch(scenarios)
+    # The material cost is paid in year 0, the annual costs in years 1..design life
+    assert results["material_cost"].tolist() == [150, 280]
+    assert results["total_lcc"][0] == pytest.approx(150 + 25 * 1.02 / 1.05)
+    assert results["total_lcc"][1] == pytest.approx(280 + sum(25 * (1.02 / 1.05) ** t for t in range(1, 31)))
+
+# ✅ Test Stateless LCC Kernel
+@pytest.mark.unit
+def test_lcc_kernel_batch_matches_single():
+    inputs = {key: 1.0 for key in lcc_kernel.INPUT_KEYS}
+    inputs.update({"inflation_rate": 0.0515, "discount_rate": 0.067, "design_life": 50, "analysis_period": 50,
+                   "init_cost": 1e6, "routine_insp_freq": 1, "periodic_maint_freq": 5, "major_insp_freq": 5,
+                   "major_repair_freq": 10, "replacement_freq": 25, "routine_insp_cost": 0.001})
+    single = lcc_kernel.evaluate(inputs)
+    assert single["routine_inspection"] == pytest.approx(1e6 * 0.001 * present_worth_factor(0.0515, 0.067, 1, 50))
+    batch = lcc_kernel.evaluate_many([inputs, {**inputs, "discount_rate": 0.08}])
+    assert batch["total_lcc"][0] == pytest.approx(single["total_lcc"])
+    assert batch["total_lcc"][1] < single["total_lcc"]
+    with pytest.raises(ValueError):
+        lcc_kernel.evaluate({})
+
+# ✅ Test LCC Kernel Evaluated per Head
+@pytest.mark.unit
+def test_lcc_kernel_heads_subset():
+    inputs = {key: 1.0 for key in lcc_kernel.INPUT_KEYS}
+    inputs.update({"inflation_rate": 0.0515, "discount_rate": 0.067, "design_life": 50, "analysis_period": 50,
+                   "init_cost": 1e6, "routine_insp_freq": 1, "periodic_maint_freq": 5, "major_insp_freq": 5,
+                   "major_repair_freq": 10, "replacement_freq": 25, "total_traffic": 700.0})
+    full = lcc_kernel.evaluate(inputs)
+    for head in lcc_kernel.HEADS:
+        subset = {key: inputs[key] for key in lcc_kernel.head_inputs([head]) if key in inputs}
+        assert lcc_kernel.evaluate(subset, heads=[head]) == {head: pytest.approx(full[head])}
+    # Only the inputs of the requested heads are required
+    assert lcc_kernel.missing_inputs({}, ["time_cost"]) == ["interest_rate", "investment_ratio", "construction_time",
+                                                            "init_cost"]
+    assert lcc_kernel.evaluate({"init_cost": 5.0}, heads=["initial_construction"]) == {"initial_construction": 5.0}
+    with pytest.raises(ValueError):
+        lcc_kernel.evaluate({"init_cost": 5.0}, heads=["time_cost"])
+    with pytest.raises(ValueError):
+        lcc_kernel.evaluate(inputs, heads=["salvage"])
+
+# ✅ Test Array-Backed Cost Registry
+@pytest.mark.unit
+def test_cost_registry_matches_components():
+    registry = CostRegistry.from_columns(quantity=[100, 20], rate=[500, 10])
+    registry.add(quantity=200, rate=2.5, category="Environmental")
+    assert registry.total(category="Economic") == InitialConstructionCost(quantity=100, rate=500).calculate_cost() + 200
+    assert registry.total() == pytest.approx(50700)
+    view = registry[0]
+    assert view.is_initial and not view.is_recurring
+    view.present_worth_factor = 0.5
+    assert registry.total(category="Economic") == pytest.approx(25200)
+
+# ✅ Test Multi-Cycle Reconstruction
+@pytest.mark.unit
+def test_repeat_cycles_with_residual_value():
+    cycle = CashFlowTimeline(50, inflation_rate=0.0, discount_rate=0.0)
+    cycle.add_one_time("Initial", 1000, year=0)
+    cycle.add_one_time("Demolition", 100, year=50)
+    timeline = repeat_cycles(cycle.build(), 120, residual_heads=["Initial"])
+    totals = timeline.totals()
+    assert totals["Initial"] == 3000
+    assert totals["Demolition"] == 200
+    assert totals["Residual Value"] == pytest.approx(1000 * (1 - 20 / 50))
+    assert timeline.total() == pytest.approx(3200 - 600)
+
+# ✅ Test Traffic Growth Projection
+@pytest.mark.unit
+def test_traffic_projection_growth_and_capacity():
+    adt = project_adt([100, 300], years=50, growth_rate=0.05)
+    assert adt[10, 1] == pytest.approx(300 * 1.05 ** 10)
+    capped = project_adt([100, 300], years=50, growth_rate=0.05, capacity=800, pcu=[2.0, 1.0])
+    pcu_total = 2.0 * capped[:, 0] + capped[:, 1]
+    assert pcu_total[5] == pytest.approx(500 * 1.05 ** 5)
+    assert pcu_total[-1] == pytest.approx(800)
+    assert capped[-1, 0] / capped[-1, 1] == pytest.approx(1 / 3)
+    growth = growth_factors(adt)
+    assert period_mean(growth, 2) == pytest.approx((1 + 1.05) / 2)
+    # Weighting the traffic of every event by its present worth matches the closed form with growth
+    schedule = event_schedule(10, 50, 51)
+    factor = discounted_mean(growth, schedule, 0.0515, 0.067)
+    expected = present_worth_factor(1.0515 * 1.05 - 1, 0.067, 10, 50) / present_worth_factor(0.0515, 0.067, 10, 50)
+    assert factor == pytest.approx(expected)
+    assert discounted_mean(growth_factors(project_adt([100, 300], 50)), schedule, 0.0515, 0.067) == 1.0
+
+# ✅ Test Vectorized Accident Costs
+@pytest.mark.unit
+def test_accident_costs_match_category_loop():
+    injury_costs, injury_shares = [46680.0, 432651.0, 1325049.0], [60.0, 20.0, 20.0]
+    damage_costs, damage_shares = [3396.0, 9563.0], [50.0, 50.0]
+    adt = [700.0, 735.0, 771.75]
+    count = accidents(adt, crash_rate=30.0, distance_km=6.0, days=312)
+    assert count[0] == pytest.approx(30.0 * 700.0 * 6.0 * 1e-6 * 312)
+    costs = accident_costs(count, category_weights(injury_costs, injury_shares),
+                           category_weights(damage_costs, damage_shares))
+    assert costs["human_injury"].shape == (3, 3)
+    for year, n in enumerate(count):
+        injury = sum(cost * n * share for cost, share in zip(injury_costs, injury_shares))
+        damage = sum(cost * n * share for cost, share in zip(damage_costs, damage_shares))
+        assert costs["total_human_injury"][year] == pytest.approx(injury)
+        assert costs["total"][year] == pytest.approx(injury + damage)
+    # Unit costs escalated year by year
+    escalated = category_weights([[cost * 1.05 ** year for cost in damage_costs] for year in range(3)], damage_shares)
+    yearly = accident_costs(count, category_weights(injury_costs, injury_shares), escalated)
+    assert yearly["total_vehicle_damage"][2] == pytest.approx(costs["total_vehicle_damage"][2] * 1.05 ** 2)
+    with pytest.raises(ValueError):
+        category_weights([1.0, 2.0], [1.0])
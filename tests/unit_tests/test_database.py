@@ -0,0 +1,380 @@
+import numpy as np
+import pytest
+from osbridgelcca.core import lcc_kernel
+from osbridgelcca.desktop_app.widgets.utils.data import *
+from osbridgelcca.desktop_app.widgets.utils.database import KERNEL_HEAD_NAMES, DatabaseManager
+from osbridgelcca.desktop_app.widgets.utils.maintenance_optimizer import (INTERVAL_KEYS, MAINTENANCE_HEADS,
+                                                                         MaintenanceOptimizer)
+from osbridgelcca.desktop_app.widgets.utils.monte_carlo import Distribution, MonteCarloLCC
+from osbridgelcca.desktop_app.widgets.utils.core.voc import emissions
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """DatabaseManager on a fresh database with the default traffic and rerouting inputs"""
+    return DatabaseManager(db_path=str(tmp_path / "structure_works.db"))
+
+
+@pytest.fixture
+def project(manager):
+    """manager with a bill of quantities, carbon, maintenance and end of life inputs"""
+    manager.input_data_row(KEY_FOUNDATION, [[
+        {KEY_COMPONENT: "Pile", KEY_TYPE: "Concrete", KEY_GRADE: "M25", KEY_QUANTITY: "100", KEY_UNIT_M3: "cum",
+         KEY_RATE: "5000"},
+        {KEY_COMPONENT: "Pile", KEY_TYPE: "Steel Rebar", KEY_GRADE: "Fe500", KEY_QUANTITY: "20", KEY_UNIT_M3: "t",
+         KEY_RATE: "60000"}]])
+    manager.input_data_row(KEY_SUPERSTRUCTURE, [[
+        {KEY_COMPONENT: "Deck", KEY_TYPE: "Structural Steel", KEY_GRADE: "E250", KEY_QUANTITY: "10", KEY_UNIT_M3: "t",
+         KEY_RATE: "80000"}]])
+    manager.insert_carbon_emission_data([{KEY_TYPE: "Concrete", KEY_QUANTITY: 100, KEY_CARBON_EMISSION_FACTOR: 0.3}])
+    manager.carbon_emission_cost_data = {KEY_SCC: 86.0, KEY_SOURCE: SCC_K_Ricke_et_al, KEY_USD_T_INR: 83.0}
+    manager.maintainance_and_repair_data = {
+        KEY_ROUTINE_INSP_COST: 0.001, KEY_ROUTINE_INSP_FREQ: 1, KEY_PERIODIC_MAINT_COST: 0.005,
+        KEY_PERIODIC_MAINT_FREQ: 5, KEY_MAJOR_INSP_COST: 0.001, KEY_MAJOR_INSP_FREQ: 5, KEY_MAJOR_REPAIR_COST: 0.1,
+        KEY_MAJOR_REPAIR_FREQ: 10, KEY_BEARING_EXP_JOINT_REPAIR_FREQ: 25}
+    manager.demolition_and_recycling_data = {
+        KEY_DEMOLITION_DISPOSAL_COST: 0.1, KEY_STEEL_REBAR_SCRAP_RATE: 0.5, KEY_STEEL_REBAR_RECYLABILITY: 0.9,
+        KEY_STRUCT_STEEL_SCRAP_RATE: 0.5, KEY_STRUCT_STEEL_RECYLABILITY: 0.9, KEY_PS_TENDONS_SCRAP_RATE: 0.5,
+        KEY_PS_TENDONS_RECYLABILITY: 0.9}
+    return manager
+
+
+# ✅ Test Rerouting Emissions from the VOC Models
+@pytest.mark.unit
+def test_refresh_rerouting_uses_voc_emissions(manager):
+    manager.carbon_emission_cost_data = {KEY_SCC: 86.0, KEY_SOURCE: "Custom"}
+    updated = manager.refresh()
+    assert updated[COST_CARBON_EMISSION_REROUTING_INIT] > 0
+    factor = manager.rerouting_emission_factor()
+    assert factor > 0 and factor != manager.CO2_EMISSION_PER_KM
+    assert manager.rerouting_voc_cost() > 0
+
+
+# ✅ Test Rerouting Emissions Fallback
+@pytest.mark.unit
+def test_rerouting_emission_factor_falls_back(manager, monkeypatch):
+    def failing(*args, **kwargs):
+        raise ValueError("no VOC model for this road")
+    monkeypatch.setattr(emissions, "rerouting_emissions", failing)
+    assert manager.rerouting_emission_factor() == manager.CO2_EMISSION_PER_KM
+    assert manager.rerouting_emission_factor([1.0, 2.0]).tolist() == [manager.CO2_EMISSION_PER_KM] * 2
+    manager.daily_average_traffic_data = {}
+    assert manager.rerouting_emission_factor() == manager.CO2_EMISSION_PER_KM
+
+
+# ✅ Test Rerouting Emission Factor Memoized on Traffic and Road
+@pytest.mark.unit
+def test_rerouting_emission_factor_memoized(project, monkeypatch):
+    calls = []
+    rerouting_emissions = emissions.rerouting_emissions
+    def counting(*args, **kwargs):
+        calls.append(kwargs.get("capacity"))
+        return rerouting_emissions(*args, **kwargs)
+    monkeypatch.setattr(emissions, "rerouting_emissions", counting)
+    project.refresh()
+    assert len(calls) == 1
+    project.maintainance_and_repair_data = {**project.maintainance_and_repair_data, KEY_MAJOR_REPAIR_FREQ: 5}
+    assert COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR in project.refresh()
+    assert len(calls) == 1
+    factor = project.rerouting_emission_factor()
+    project.traffic_data = {**project.traffic_data, KEY_ALTER_ROAD_CARRIAGEWAY: KEY_SINGLE_LANE_ROAD}
+    project.refresh()
+    assert len(calls) == 2 and project.rerouting_emission_factor() != factor
+    project.daily_average_traffic_data = {vehicle: 2 * count
+                                          for vehicle, count in project.daily_average_traffic_data.items()}
+    project.refresh()
+    assert len(calls) == 3
+    assert project.rerouting_emission_factor([1.0, 2.0]).tolist() == \
+        project.rerouting_emission_factor([1.0, 2.0]).tolist()
+    assert len(calls) == 4
+
+
+# ✅ Test Background Road User Cost Stages
+@pytest.mark.unit
+def test_road_user_cost_stages_apply_results(manager):
+    manager.background_heads |= {COST_VOT, COST_ACCIDENT}
+    updated = manager.refresh()
+    assert COST_VOT not in updated and COST_VOT in manager.graph.dirty
+    results = dict(manager.road_user_cost_stages())
+    assert list(results) == [COST_VOT, COST_ACCIDENT, COST_REROUTING_VOC]
+    manager.apply_road_user_results(results)
+    assert manager.results[COST_VOT] == results[COST_VOT] == manager.vot_per_year()
+    assert not {COST_VOT, COST_ACCIDENT} & manager.graph.dirty
+    # A changed input makes them dirty again and notifies the worker
+    affected = []
+    manager.add_input_listener(affected.append)
+    manager.traffic_data = {**manager.traffic_data, KEY_CRASH_RATE: 40.0}
+    assert COST_ACCIDENT in affected[0] and COST_ACCIDENT in manager.graph.dirty
+
+
+# ✅ Test Road User Costs Finished Before a Failing Stage
+@pytest.mark.unit
+def test_road_user_cost_stages_keep_finished_heads(manager, monkeypatch):
+    def failing():
+        raise ValueError("VOC failed")
+    monkeypatch.setattr(manager, "rerouting_voc_cost", failing)
+    results = {}
+    with pytest.raises(ValueError):
+        for head, value in manager.road_user_cost_stages():
+            results[head] = value
+    manager.apply_road_user_results(results)
+    assert set(results) == {COST_VOT, COST_ACCIDENT}
+    assert manager.results[COST_ACCIDENT] == results[COST_ACCIDENT]
+    assert COST_ACCIDENT not in manager.graph.dirty
+
+
+# ✅ Test Rerouting VOC over the Construction Period
+@pytest.mark.unit
+def test_rerouting_voc_cost_over_construction_period(manager):
+    cost = manager.rerouting_voc_cost()
+    manager.traffic_data = {**manager.traffic_data, KEY_ADDIT_REROUTING_DISTANCE: 12.0}
+    assert manager.rerouting_voc_cost() == pytest.approx(2 * cost)
+    manager.traffic_data = {**manager.traffic_data, KEY_TRAFFIC_GROWTH_RATE: 0.05}
+    assert manager.rerouting_voc_cost() > 2 * cost
+    manager.financial_data = {**manager.financial_data, KEY_CONSTR_TIME: 0}
+    assert manager.rerouting_voc_cost() == 0.0
+
+
+# ✅ Test Cost Head Methods Against the LCC Kernel
+@pytest.mark.unit
+def test_cost_methods_match_kernel(project):
+    project.refresh()
+    kernel = lcc_kernel.evaluate(project.kernel_inputs(), project.kernel_constants())
+    methods = {
+        COST_TOTAL_INIT_CONST: project.calculate_total_initial_cost,
+        COST_TOTAL_INIT_CARBON_EMISSION: project.carbon_emission_cost,
+        COST_TIME: project.calculate_time_cost,
+        COST_CARBON_EMISSION_REROUTING_INIT: project.init_carbon_emission_rerouting,
+        COST_TOTAL_ROUTINE_INSPECTION: project.routine_inspection_cost,
+        COST_PERIODIC_MAINTAINANCE: project.periodic_maintainance_cost,
+        COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION: project.periodic_maintainance_carbon_emission_cost,
+        COST_MAJOR_INSPECTION: project.major_inspection_cost,
+        COST_MAJOR_REPAIR: project.major_repair_cost,
+        COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION: project.major_repair_related_carbon_emission_cost,
+        COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR: project.carbon_emission_rerouting_during_major_repairs,
+        COST_BEARING_EXP_JOINT_REPLACEMENT: project.bearing_expansion_joint_replacement_cost,
+        COST_CARBON_EMISSION_RR_DURING_REPLACEMENT: project.carbon_emission_rerouting_during_replacement,
+        COST_DEMOLITION_DISPOSAL: project.demolition_and_disposal_cost,
+        COST_DEMOLITION_DISPOSAL_CARBON: project.demolition_disposal_carbon_emission_cost,
+        COST_DEMOLITION_DISPOSAL_CARBON_REROUTING: project.demolition_disposal_rerouting_carbon_emission_cost,
+        COST_RECYCLING: project.recycling_cost,
+    }
+    for head, method in methods.items():
+        assert method() == pytest.approx(kernel[KERNEL_HEAD_NAMES[head]], rel=1e-12), head
+    results = project.calculate_all()
+    for name, value in kernel.items():
+        assert results[KERNEL_HEAD_KEYS[name]] == pytest.approx(value, rel=1e-12), name
+    assert not set(results) & project.graph.dirty
+
+
+# ✅ Test Cash Flow Timeline Totals Against the Cost Heads
+@pytest.mark.unit
+def test_cash_flow_timeline_totals_match_heads(project):
+    # Traffic growth and end-of-life events inside the design life
+    project.traffic_data = {**project.traffic_data, KEY_TRAFFIC_GROWTH_RATE: 0.05}
+    project.financial_data = {**project.financial_data, KEY_DESIGN_LIFE: 60, KEY_ANALYSIS_PERIOD: 25}
+    project.refresh()
+    results = project.calculate_all()
+    timeline = project.cash_flow_timeline()
+    totals = timeline.totals()
+    assert set(timeline.heads) == set(KERNEL_HEAD_KEYS.values()) - {COST_VOT, COST_ACCIDENT, COST_TOTAL_LCC}
+    for head in timeline.heads:
+        assert totals[head] == pytest.approx(results[head], rel=1e-12), head
+    assert totals[COST_RECYCLING] > 0 and totals[COST_DEMOLITION_DISPOSAL_CARBON_REROUTING] > 0
+    assert timeline.total() == pytest.approx(results[COST_TOTAL_LCC] - results[COST_VOT] - results[COST_ACCIDENT],
+                                             rel=1e-12)
+
+
+# ✅ Test Cash Flow Timeline with Missing Inputs
+@pytest.mark.unit
+def test_cash_flow_timeline_missing_inputs(project):
+    # Recycling inputs left out count as nothing recycled, as in the recycling head
+    demolition = {key: value for key, value in project.demolition_and_recycling_data.items()
+                  if key not in (KEY_PS_TENDONS_SCRAP_RATE, KEY_PS_TENDONS_RECYLABILITY)}
+    project.demolition_and_recycling_data = demolition
+    project.refresh()
+    timeline = project.cash_flow_timeline()
+    assert timeline.totals()[COST_RECYCLING] == pytest.approx(project.calculate_all()[COST_RECYCLING], rel=1e-12)
+    project.demolition_and_recycling_data = {**demolition, KEY_DEMOLITION_DISPOSAL_COST: None}
+    with pytest.raises(ValueError, match=KEY_DEMOLITION_DISPOSAL_COST):
+        project.cash_flow_timeline()
+
+
+# ✅ Test Maintenance Optimizer Baseline with Traffic Growth
+@pytest.mark.unit
+def test_maintenance_optimizer_baseline_with_traffic_growth(project):
+    project.traffic_data = {**project.traffic_data, KEY_TRAFFIC_GROWTH_RATE: 0.05}
+    project.refresh()
+    results = project.calculate_all()
+    schedule = MaintenanceOptimizer(project, include_road_user=False).optimize()
+    assert schedule.baseline_lcc == pytest.approx(results[COST_TOTAL_LCC] - results[COST_VOT] - results[COST_ACCIDENT],
+                                                  rel=1e-12)
+    assert schedule.total_lcc <= schedule.baseline_lcc
+
+
+# ✅ Test Maintenance Optimizer Full Grid Against the Pruned Search
+@pytest.mark.unit
+def test_maintenance_optimizer_full_grid_matches_pruned(project):
+    project.refresh()
+    project.calculate_all()
+    optimizer = MaintenanceOptimizer(project)
+    full, pruned = optimizer.optimize(full_grid=True), optimizer.optimize(full_grid=False)
+    assert full.intervals == pruned.intervals
+    assert full.total_lcc == pytest.approx(pruned.total_lcc, rel=1e-12)
+    assert pruned.evaluated < full.evaluated == 49 ** 4
+    # The default deterioration keeps the optimum inside the candidate range
+    assert full.intervals[KEY_PERIODIC_MAINT_FREQ] < 49
+    assert optimizer.evaluate(full.intervals) == pytest.approx(full.maintenance_cost, rel=1e-12)
+    assert full.total_lcc <= full.baseline_lcc
+    with pytest.raises(ValueError):
+        MaintenanceOptimizer(project, deterioration_exponent=-1.0)
+
+
+# ✅ Test Maintenance Optimizer Baseline Against the Cost Heads
+@pytest.mark.unit
+def test_maintenance_optimizer_evaluates_current_heads(project):
+    project.refresh()
+    results = project.calculate_all()
+    optimizer = MaintenanceOptimizer(project, include_road_user=False)
+    baseline = {key: project.maintainance_and_repair_data[key] for key in INTERVAL_KEYS}
+    assert optimizer.evaluate(baseline) == pytest.approx(sum(results[head] for head in MAINTENANCE_HEADS), rel=1e-12)
+
+
+# ✅ Test Maintenance Optimizer Shared Repair and Replacement Closures
+@pytest.mark.unit
+def test_maintenance_optimizer_shared_closures(project):
+    project.refresh()
+    project.calculate_all()
+    optimizer = MaintenanceOptimizer(project)
+    fin = project.financial_data
+    q = (1 + fin[KEY_INFLATION_RATE]) / (1 + fin[KEY_DISCOUNT_RATE_IA])
+    # No replacement within the design life
+    repair_only = optimizer._repair_and_replacement(10, fin[KEY_DESIGN_LIFE])
+    # Replacements in years 15, 30 and 45; the one in year 30 shares the repair closure
+    pair = optimizer._repair_and_replacement(10, 15)
+    assert pair - repair_only == pytest.approx(optimizer.replacement_closure * (q ** 15 + q ** 45), rel=1e-12)
+    # Every replacement falls on a repair year
+    assert optimizer._repair_and_replacement(10, 20) == pytest.approx(repair_only, rel=1e-12)
+
+
+# ✅ Test Memoized Table Reads Return Copies
+@pytest.mark.unit
+def test_cached_reads_return_copies(project):
+    materials = project.get_all_materials_info()
+    materials[0][KEY_QUANTITY] = 0
+    materials.clear()
+    project.get_carbon_emission_data()[0][KEY_QUANTITY] = 0
+    project.get_all_superstructures_data()[0][KEY_RATE] = 0
+    project.get_cost_totals().clear()
+    assert len(project.get_all_materials_info()) == 3
+    assert project.get_all_materials_info()[0][KEY_QUANTITY] != 0
+    assert project.get_carbon_emission_data()[0][KEY_QUANTITY] == 100
+    assert project.get_all_superstructures_data()[0][KEY_RATE] == 80000
+    assert project.get_total_cost() == 2500000
+
+
+# ✅ Test Refresh Recomputes Only the Affected Heads
+@pytest.mark.unit
+def test_refresh_recomputes_affected_heads(project):
+    project.refresh()
+    assert not project.graph.dirty - project.background_heads
+    assert project.refresh() == {}
+    before = dict(project.results)
+    project.maintainance_and_repair_data = {**project.maintainance_and_repair_data, KEY_PERIODIC_MAINT_COST: 0.01}
+    updated = project.refresh()
+    assert set(updated) == {COST_PERIODIC_MAINTAINANCE, COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION}
+    assert updated[COST_PERIODIC_MAINTAINANCE] == pytest.approx(2 * before[COST_PERIODIC_MAINTAINANCE])
+    unchanged = set(before) - set(updated)
+    assert {head: project.results[head] for head in unchanged} == {head: before[head] for head in unchanged}
+    # Assigning an unchanged dictionary invalidates nothing
+    project.maintainance_and_repair_data = dict(project.maintainance_and_repair_data)
+    assert project.refresh() == {}
+
+
+# ✅ Test Table Writes Invalidate the Memoized Reads
+@pytest.mark.unit
+def test_table_write_invalidates_cache(project):
+    project.refresh()
+    assert len(project.get_all_materials_info()) == 3
+    project.input_data_row(KEY_SUPERSTRUCTURE, [[
+        {KEY_COMPONENT: "Deck", KEY_TYPE: "Concrete", KEY_GRADE: "M40", KEY_QUANTITY: "10", KEY_UNIT_M3: "cum",
+         KEY_RATE: "7000"}]])
+    assert len(project.get_all_materials_info()) == 4
+    assert len(project.get_all_superstructures_data()) == 2
+    assert project.get_total_cost(work_type=KEY_SUPERSTRUCTURE) == 870000
+    assert {COST_TOTAL_INIT_CONST, COST_TOTAL_SUPERSTRUCTURE, COST_TIME} <= project.graph.dirty
+    assert COST_TOTAL_INIT_CARBON_EMISSION not in project.graph.dirty
+    updated = project.refresh()
+    assert updated[COST_TOTAL_INIT_CONST] == 2570000
+    assert COST_TOTAL_INIT_CARBON_EMISSION not in updated
+
+
+# ✅ Test Monte Carlo Draws Reproducible by Seed
+@pytest.mark.unit
+def test_monte_carlo_seed_reproducible(project):
+    project.refresh()
+    mc = MonteCarloLCC(project, {"rate": Distribution("normal", (1.0, 0.1)),
+                                 "discount_rate": Distribution("triangular", (0.05, 0.067, 0.08))})
+    first, again = mc.run(2_000, batch_size=300, workers=1, seed=3), mc.run(2_000, batch_size=300, workers=1, seed=3)
+    assert first.n_samples == 2_000
+    for head, values in first.samples.items():
+        assert np.array_equal(values, again.samples[head]), head
+    other = mc.run(2_000, batch_size=300, workers=1, seed=4)
+    assert not np.array_equal(first.samples[COST_TOTAL_LCC], other.samples[COST_TOTAL_LCC])
+
+
+# ✅ Test Monte Carlo Serial and Process Pool Runs
+@pytest.mark.unit
+def test_monte_carlo_process_pool_matches_serial(project):
+    project.refresh()
+    mc = MonteCarloLCC(project, {"quantity": Distribution("uniform", (0.9, 1.1)),
+                                 "traffic": Distribution("lognormal", (0.0, 0.2))})
+    serial = mc.run(3_000, batch_size=500, workers=1, seed=11)
+    pooled = mc.run(3_000, batch_size=500, workers=2, seed=11)
+    assert set(serial.samples) == set(pooled.samples)
+    for head, values in serial.samples.items():
+        assert np.array_equal(values, pooled.samples[head]), head
+
+
+# ✅ Test Monte Carlo Mean Against the Deterministic LCC
+@pytest.mark.unit
+def test_monte_carlo_mean_matches_deterministic(project):
+    project.refresh()
+    deterministic = project.calculate_all()[COST_TOTAL_LCC]
+    fixed = MonteCarloLCC(project).run(100, batch_size=40, workers=1, seed=0)
+    assert fixed.samples[COST_TOTAL_LCC] == pytest.approx(np.full(100, deterministic), rel=1e-12)
+    # Independent multipliers with a mean of 1, and the cost heads linear in each of them
+    mc = MonteCarloLCC(project, {"rate": Distribution("normal", (1.0, 0.05)),
+                                 "quantity": Distribution("uniform", (0.9, 1.1)),
+                                 "scc": Distribution("normal", (86.0, 5.0))})
+    result = mc.run(20_000, batch_size=5_000, workers=1, seed=5)
+    assert result.samples[COST_TOTAL_LCC].mean() == pytest.approx(deterministic, rel=5e-3)
+    assert result.percentiles()[COST_TOTAL_LCC]["P5"] < deterministic < result.percentiles()[COST_TOTAL_LCC]["P95"]
+
+
+# ✅ Test SQL Cost Totals Against the Per-Row Sum
+@pytest.mark.unit
+def test_cost_totals_match_row_sum(project):
+    project.input_data_row(KEY_SUPERSTRUCTURE, [[
+        {KEY_COMPONENT: "Deck", KEY_TYPE: "Steel Rebar", KEY_GRADE: "Fe500", KEY_QUANTITY: "7.5", KEY_UNIT_M3: "t",
+         KEY_RATE: "61000"},
+        {KEY_COMPONENT: "Deck", KEY_TYPE: "Concrete", KEY_GRADE: "M40", KEY_QUANTITY: "12", KEY_UNIT_M3: "cum",
+         KEY_RATE: "7000"}]])
+    rows = project.conn.execute('''
+        SELECT s.type, c.type_material, c.grade, c.quantity, c.rate
+        FROM component c
+        LEFT JOIN struct_works_data s ON s.comp_id = c.comp_id
+    ''').fetchall()
+    expected = {}
+    for work_type, material, grade, quantity, rate in rows:
+        key = (work_type, material, grade)
+        expected[key] = expected.get(key, 0.0) + float(quantity) * float(rate)
+    assert project.get_cost_totals() == pytest.approx(expected)
+    for work_type in (None, KEY_FOUNDATION, KEY_SUBSTRUCTURE, KEY_SUPERSTRUCTURE, KEY_AUXILIARY):
+        for material in (None, "Concrete", "Steel Rebar", "Structural Steel", "Tendons"):
+            row_sum = sum(float(quantity) * float(rate) for row_work_type, row_material, _, quantity, rate in rows
+                          if (work_type is None or row_work_type == work_type)
+                          and (material is None or row_material == material))
+            total = project.get_total_cost(work_type=work_type, type_material=material)
+            assert total == pytest.approx(row_sum), (work_type, material)
+    assert project.get_total_cost(type_material="Steel Rebar") == pytest.approx(20 * 60000 + 7.5 * 61000)
@@ -0,0 +1,92 @@
+import json
+import os
+
+import pytest
+from osbridgelcca.desktop_app.widgets.utils.material_search import (AdvancedMaterialSearch, MaterialSearchIndex,
+                                                                    normalize_text)
+
+SOR_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "src", "osbridgelcca", "desktop_app", "widgets",
+                        "utils", "sor_db", "bihar.json")
+
+CATEGORIES = [
+    {"type": "Excavation", "data": [
+        {"name": "All type(manual) (0 to 1.5m)", "rate": 239},
+        {"name": "Hard Rock - Blasting", "rate": 610},
+    ]},
+    {"type": "Concrete Works", "data": [
+        {"name": "PCC M15 (1:2:4)", "rate": 5200},
+        {"name": "RCC M25 for Pile Foundation", "rate": 7100},
+        {"name": "RCC M25 for Deck Slab", "rate": 7400},
+        "not a material",
+    ]},
+    {"type": "Steel", "data": [
+        {"name": "Steel Rebar Fe500", "rate": 61000},
+        {"name": "Structural Steel E250 (Deck)", "rate": 80000},
+    ]},
+]
+
+
+def names(results):
+    return [material["name"] for material in results]
+
+
+# ✅ Test Search Input Normalization
+@pytest.mark.unit
+def test_normalize_text():
+    assert normalize_text("  PCC M15 (1:2:4) ") == "pcc m15 1 2 4"
+    assert normalize_text("All type(manual)-0/1.5m") == "all type manual 0 1.5m"
+    assert normalize_text(None) == ""
+
+
+# ✅ Test Substring and Multi-Token Material Search
+@pytest.mark.unit
+def test_search_substring_and_tokens():
+    searcher = AdvancedMaterialSearch(CATEGORIES)
+    assert names(searcher.performSearch([], "rcc")) == ["RCC M25 for Pile Foundation", "RCC M25 for Deck Slab"]
+    # Mid-word substrings match
+    assert names(searcher.performSearch([], "ebar")) == ["Steel Rebar Fe500"]
+    assert names(searcher.performSearch([], "lasti")) == ["Hard Rock - Blasting"]
+    # Every token must match, in any order
+    assert names(searcher.performSearch([], "deck m25")) == ["RCC M25 for Deck Slab"]
+    assert names(searcher.performSearch([], "DECK")) == ["RCC M25 for Deck Slab", "Structural Steel E250 (Deck)"]
+    assert searcher.performSearch([], "deck rebar") == []
+    assert searcher.performSearch([], " ( ) ") == []
+
+
+# ✅ Test Category Filtered Material Search
+@pytest.mark.unit
+def test_search_category_filter():
+    searcher = AdvancedMaterialSearch(CATEGORIES)
+    assert searcher.getAllCategories() == ["Excavation", "Concrete Works", "Steel"]
+    assert names(searcher.performSearch(["steel"], "deck")) == ["Structural Steel E250 (Deck)"]
+    assert names(searcher.performSearch(["Concrete"], "deck")) == ["RCC M25 for Deck Slab"]
+    assert names(searcher.performSearch(["excavation", "steel"], "e")) == [
+        "All type(manual) (0 to 1.5m)", "Steel Rebar Fe500", "Structural Steel E250 (Deck)"]
+    assert searcher.performSearch(["Bitumen"], "deck") == []
+
+
+# ✅ Test Material Detail Lookup by Name
+@pytest.mark.unit
+def test_get_detail_by_name():
+    searcher = AdvancedMaterialSearch([CATEGORIES])
+    assert searcher.getDetailByName("pcc m15 (1:2:4)")["rate"] == 5200
+    assert searcher.getDetailByName("Structural Steel E250 Deck")["rate"] == 80000
+    assert searcher.getDetailByName("Structural Steel") is None
+
+
+# ✅ Test Search Index Against a Scan of a Shipped SOR
+@pytest.mark.unit
+def test_search_index_matches_scan():
+    with open(SOR_FILE, encoding="utf-8") as file:
+        categories = json.load(file)["data"]
+    index = MaterialSearchIndex(categories)
+    materials = [(category.get("type", "").lower(), normalize_text(material.get("name", "")))
+                 for category in categories for material in category.get("data", [])]
+    assert index.size == len(materials)
+    for selected, query in [([], "m25"), ([], "concrete"), ([], "a"), ([], "re ste"), (["excavation"], "m"),
+                            (["foundation", "concrete"], "cement"), ([], "zzz")]:
+        tokens = normalize_text(query).split(" ")
+        expected = [i for i, (category_type, name) in enumerate(materials)
+                    if (not selected or any(sel in category_type for sel in selected))
+                    and all(token in name for token in tokens)]
+        assert index.search(selected, tokens).tolist() == expected, (selected, query)
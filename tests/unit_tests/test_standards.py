@@ -0,0 +1,118 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from osbridgelcca.desktop_app.widgets.utils import standards_store
+from osbridgelcca.desktop_app.widgets.utils.IRC_SP_30 import IRC_SP_30, TABLE_NAMES
+from osbridgelcca.desktop_app.widgets.utils.core.IRC_standards import IRCSP30_2019
+from osbridgelcca.desktop_app.widgets.utils.data import *
+from osbridgelcca.desktop_app.widgets.utils.standards_store import DEFAULT_EDITION, StandardsStore, default_store
+from osbridgelcca.desktop_app.widgets.utils.wpi_projection import fit_trend
+
+# Tables as the pandas implementation of IRC_SP_30 built them
+BASELINE_TABLES = os.path.join(os.path.dirname(__file__), "data", "irc_sp30_2019_tables.json")
+
+
+# ✅ Test Standards Store Tables Against the pandas Tables
+@pytest.mark.unit
+def test_standards_tables_match_baseline():
+    with open(BASELINE_TABLES, encoding="utf-8") as file:
+        baseline = json.load(file)
+    irc = IRC_SP_30()
+    assert set(baseline) == set(TABLE_NAMES)
+    for name in TABLE_NAMES:
+        frame = getattr(irc, name)
+        assert frame.index.name == baseline[name]["index_name"], name
+        assert frame.index.tolist() == baseline[name]["index"], name
+        assert list(frame.columns) == baseline[name]["columns"], name
+        assert frame.values.tolist() == baseline[name]["values"], name
+
+
+# ✅ Test IRCSP30_2019 Table C.1 Read from the Standards Store
+@pytest.mark.unit
+def test_standards_c1_tables_match_module(tmp_path, monkeypatch):
+    store = default_store()
+    for name in IRCSP30_2019.TABLE_C1_NAMES:
+        table = store.table(DEFAULT_EDITION, name)
+        module_table = getattr(IRCSP30_2019, name)
+        assert list(module_table) == list(table.rows), name
+        for row, entry in module_table.items():
+            for column in table.columns:
+                assert entry[column] == table.get(row, column), (name, row, column)
+    assert IRCSP30_2019.vehicle_costs["buses"] == {"ET": 1647150, "IT": 2948400}
+    assert IRCSP30_2019.petroleum_products_costs["grease"]["units"] == "Rs/kg"
+    assert IRCSP30_2019.new_tyres_costs["hcv"]["num_of_wheels"] == 10
+    assert isinstance(IRCSP30_2019.new_tyres_costs["hcv"]["num_of_wheels"], int)
+    # An edited store changes the tables
+    monkeypatch.setenv(standards_store.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    with open(standards_store.STANDARDS_SQL, encoding="utf-8") as file:
+        script = file.read()
+    edited = tmp_path / "standards.sql"
+    edited.write_text(script.replace("'diesel', 0, 'ET', 30.51", "'diesel', 0, 'ET', 40.0"), encoding="utf-8")
+    other = StandardsStore(str(edited))
+    tables = IRCSP30_2019.table_c1(DEFAULT_EDITION, other)
+    assert tables["petroleum_products_costs"]["diesel"] == {"ET": 40.0, "IT": 72.61, "units": "Rs/l"}
+    assert tables["vehicle_costs"] == IRCSP30_2019.vehicle_costs
+    other.close()
+
+
+# ✅ Test WPI Series Range Queries
+@pytest.mark.unit
+def test_wpi_series_range():
+    store = default_store()
+    table = store.table(DEFAULT_EDITION, TABLE_VOT)
+    all_years = store.wpi_years(DEFAULT_EDITION, TABLE_VOT)
+    assert all_years == sorted(table.rows)
+    first, last = all_years[1], all_years[-2]
+    years, values = store.wpi_series(DEFAULT_EDITION, TABLE_VOT, [KEY_HCV, KEY_LCV], first, last)
+    assert years.tolist() == [year for year in all_years if first <= year <= last]
+    assert np.array_equal(values, [table.lookup(year, [KEY_HCV, KEY_LCV]) for year in years.tolist()])
+    years, values = store.wpi_series(DEFAULT_EDITION, TABLE_VOT)
+    assert years.tolist() == all_years and values.shape == (len(all_years), len(table.columns))
+    years, values = store.wpi_series(DEFAULT_EDITION, TABLE_VOT, start=last + 100)
+    assert years.size == 0
+    with pytest.raises(ValueError, match="not found"):
+        store.wpi_series(DEFAULT_EDITION, TABLE_VOT, [KEY_HCV, "tractor"])
+    with pytest.raises(ValueError):
+        store.wpi_series(DEFAULT_EDITION, "wpi_unknown")
+
+
+# ✅ Test WPI Trend Extrapolation
+@pytest.mark.unit
+def test_wpi_trend_projection():
+    table = default_store().table(DEFAULT_EDITION, TABLE_VOT)
+    trend = fit_trend(table)
+    years = sorted(table.rows)
+    # Published years keep their index
+    assert np.array_equal(trend.project(years), table.values[[table.row_index[year] for year in years]])
+    last = years[-1]
+    future = np.arange(last + 1, last + 30)
+    expected = table.lookup(last, list(table.columns)) * np.exp(trend.slope * (future - last)[:, None])
+    assert trend.project(future) == pytest.approx(expected, rel=1e-12)
+    assert trend.project(future, KEY_HCV) == pytest.approx(expected[:, table.column_index[KEY_HCV]], rel=1e-12)
+    irc = IRC_SP_30()
+    ratio = irc.get_wpi(TABLE_VOT, KEY_HCV, last + 10, base_year=last)
+    assert ratio == pytest.approx(np.exp(trend.slope[table.column_index[KEY_HCV]] * 10))
+    assert irc.get_wpi(TABLE_VOT, [KEY_HCV], np.arange(last, last + 5)).shape == (5, 1)
+
+
+# ✅ Test Standards Store Compiled into the User Cache
+@pytest.mark.unit
+def test_standards_store_compiled_in_cache_dir(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setenv(standards_store.CACHE_DIR_ENV, str(cache))
+    store = StandardsStore()
+    assert os.path.dirname(store.path) == str(cache)
+    assert store.editions() == [DEFAULT_EDITION]
+    assert StandardsStore().path == store.path
+    # An edited script compiles to a new store
+    with open(standards_store.STANDARDS_SQL, encoding="utf-8") as file:
+        script = file.read()
+    edited = tmp_path / "standards.sql"
+    edited.write_text(script.replace("IRC SP-30:2019 Manual", "IRC SP-30:2019 Revised Manual"), encoding="utf-8")
+    other = StandardsStore(str(edited))
+    assert other.path != store.path and os.path.dirname(other.path) == str(cache)
+    assert other.edition_info(DEFAULT_EDITION)["title"].startswith("IRC SP-30:2019 Revised")
+    store.close()
+    other.close()
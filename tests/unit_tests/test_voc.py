@@ -0,0 +1,335 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from osbridgelcca.desktop_app.widgets.utils import standards_store
+from osbridgelcca.desktop_app.widgets.utils.core import main as voc_main
+from osbridgelcca.desktop_app.widgets.utils.core.main import calc_annual_voc, calc_voc, vehicle_input, wpi
+from osbridgelcca.desktop_app.widgets.utils.core.voc import core
+from osbridgelcca.desktop_app.widgets.utils.core.voc.congestion import core as congestion_core
+from osbridgelcca.desktop_app.widgets.utils.core.voc.lookup_grid import COST_KEYS, VOCGrid
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils import post_processor as pp
+from osbridgelcca.desktop_app.widgets.utils.core.voc.utils.carriage_way_standards import CarriagewayStandards
+from osbridgelcca.desktop_app.widgets.utils.core.voc.vectorized import LANE_TYPES, VOC_COLUMNS, compute_voc_arrays
+from osbridgelcca.desktop_app.widgets.utils.core.voc_cache import VOCCache, fingerprint
+
+# Nested model outputs and post_process summaries of the dictionary based VOC pipeline
+BASELINE_POST_PROCESS = os.path.join(os.path.dirname(__file__), "data", "voc_post_process_baseline.json")
+
+
+def assert_nested_close(actual, expected, path=""):
+    """Compare nested VOC dictionaries, numbers to a relative 1e-12."""
+    if isinstance(expected, dict):
+        assert set(actual) == set(expected), path
+        for key in expected:
+            assert_nested_close(actual[key], expected[key], f"{path}/{key}")
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, rel=1e-12), path
+    else:
+        assert actual == expected, path
+
+
+# ✅ Test VOC Cache Fingerprint
+@pytest.mark.unit
+def test_voc_fingerprint_canonical_inputs():
+    assert fingerprint(vehicle_input, wpi) == fingerprint({**vehicle_input, "rg_roughness_factor": 2000.0}, wpi)
+    assert fingerprint(vehicle_input, wpi) != fingerprint({**vehicle_input, "rg_roughness_factor": 2001}, wpi)
+    assert fingerprint(vehicle_input, wpi, vc=0.5) == fingerprint(vehicle_input, wpi, vc=np.float64(0.5))
+    # Long arrays differing only in the middle must not share a fingerprint
+    profile = np.zeros(2000)
+    changed = profile.copy()
+    changed[1000] = 1.0
+    assert fingerprint({**vehicle_input, "vehicle_info": {"small_cars": profile}}, wpi) != \
+        fingerprint({**vehicle_input, "vehicle_info": {"small_cars": changed}}, wpi)
+    assert fingerprint({**vehicle_input, "vehicle_info": {"small_cars": profile}}, wpi) == \
+        fingerprint({**vehicle_input, "vehicle_info": {"small_cars": profile.tolist()}}, wpi)
+
+
+# ✅ Test VOC Cache LRU Eviction and Counters
+@pytest.mark.unit
+def test_voc_cache_lru_eviction():
+    cache = VOCCache(maxsize=2)
+    cache.put("a", {"total": 1})
+    cache.put("b", {"total": 2})
+    assert cache.get("a") == {"total": 1}
+    cache.put("c", {"total": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"total": 1} and cache.get("c") == {"total": 3}
+    # Values are copied in and out
+    cache.get("a")["total"] = 10
+    assert cache.get("a") == {"total": 1}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (5, 1, 2)
+    assert stats["hit_rate"] == pytest.approx(5 / 6)
+    with pytest.raises(ValueError):
+        VOCCache(maxsize=-1)
+
+
+# ✅ Test VOC Cache Disk Tier
+@pytest.mark.unit
+def test_voc_cache_disk_tier(tmp_path):
+    key = fingerprint(vehicle_input, wpi)
+    first = VOCCache(maxsize=4, directory=str(tmp_path))
+    result = calc_voc(vehicle_input, wpi, cache=first)
+    assert first.stats()["misses"] == 1
+    assert calc_voc(vehicle_input, wpi, cache=first) == result
+    assert first.stats()["hits"] == 1
+    # A new session reads the result back from disk, then serves it from memory
+    second = VOCCache(maxsize=4, directory=str(tmp_path))
+    assert second.get(key) == result
+    assert second.get(key) == result
+    assert (second.disk_hits, second.hits, second.misses) == (1, 1, 0)
+    second.clear(disk=True)
+    assert second.get(key) is None and second.stats()["misses"] == 1
+    assert calc_voc(vehicle_input, wpi, cache=None) == result
+
+
+# ✅ Test VOC of Many Road Segments
+@pytest.mark.unit
+def test_voc_main_batch_matches_main():
+    segments = [{"rg_roughness_factor": 2000, "lane_type": "2L"},
+                {"rg_roughness_factor": 3500, "rs_rise_factor": 20, "lane_type": "4L"},
+                {"lane_type": "EW", "carriageway_width": 14.0},
+                {"rg_roughness_factor": 2500, "fl_fall_factor": 10, "lane_type": "2L"}]
+    batch = list(core.main_batch(vehicle_input, segments, wpi))
+    assert [index for index, _ in batch] == [0, 1, 2, 3]
+    for (index, summary), segment in zip(batch, segments):
+        assert summary == core.main({**vehicle_input, **segment}, wpi)
+    assert list(core.main_batch(vehicle_input, [], wpi)) == []
+
+
+# ✅ Test Road Segments Default to the Input Road Conditions
+@pytest.mark.unit
+def test_voc_main_batch_segments_independent():
+    # Segment 0 overrides fields the later segments leave out
+    segments = [{"rg_roughness_factor": 5000, "lane_type": "EW", "carriageway_width": 14.0},
+                {"lane_type": "4L"},
+                {"rg_roughness_factor": 3000},
+                {"lane_type": "EW", "carriageway_width": 12.0}]
+    batch = list(core.main_batch(vehicle_input, segments, wpi))
+    for (index, summary), segment in zip(batch, segments):
+        assert summary == core.main({**vehicle_input, **segment}, wpi), index
+    # An expressway default keeps its width in segments that do not change the lane type
+    expressway = {**vehicle_input, "lane_type": "EW", "carriageway_width": 14.0}
+    batch = list(core.main_batch(expressway, [{"rg_roughness_factor": 3000}, {"rg_roughness_factor": 4000}], wpi))
+    assert batch[1][1] == core.main({**expressway, "rg_roughness_factor": 4000}, wpi)
+    # Changing to an expressway needs the segment's own width
+    with pytest.raises(ValueError, match="Segment 1"):
+        list(core.main_batch(vehicle_input, [{}, {"lane_type": "EW"}], wpi))
+
+
+# ✅ Test Invalid VOC Input
+@pytest.mark.unit
+def test_voc_invalid_input_raises():
+    with pytest.raises(ValueError):
+        core.main({**vehicle_input, "lane_type": "3L"}, wpi)
+    batch = core.main_batch(vehicle_input, [{"lane_type": "2L"}, {"lane_type": "3L"}], wpi)
+    assert next(batch)[0] == 0
+    with pytest.raises(ValueError, match="Segment 1"):
+        next(batch)
+    with pytest.raises(ValueError, match="Segment 0"):
+        next(core.main_batch(vehicle_input, [{"rg_roughness_factor": "rough"}], wpi))
+
+
+# ✅ Test Vectorized VOC Coefficients Against the Vehicle Models
+@pytest.mark.unit
+def test_vectorized_voc_matches_vehicle_models():
+    roughness, rise_and_fall = [1500.0, 2000.0, 4000.0, 8000.0], [0.0, 5.0, 20.0, 60.0]
+    rg, rf, lanes = (np.array(axis).ravel() for axis in np.meshgrid(roughness, rise_and_fall, LANE_TYPES,
+                                                                      indexing="ij"))
+    pwr = {"hcv": 7.22, "mcv": 8}
+    columns = compute_voc_arrays({"rg_roughness_factor": rg, "fl_fall_factor": rf / 2, "rs_rise_factor": rf / 2,
+                                  "lane_type": lanes, "carriageway_width": 12.0, "power_weight_ratio_pwr": pwr})
+    cases = 0
+    for vehicle, model in core.MODEL_MAP.items():
+        for k, lane in enumerate(lanes):
+            # MCVs are not modelled on single and intermediate lanes
+            if vehicle == "mcv" and lane in ("SL", "IL"):
+                continue
+            width = 12.0 if lane == "EW" else CarriagewayStandards.get_width(lane)[0]
+            record = model.compute_voc({"vehicle_type": vehicle, "carriageway_width": width, "lane_type": lane,
+                                        "rg_roughness_factor": rg[k], "fl_fall_factor": rf[k] / 2,
+                                        "rs_rise_factor": rf[k] / 2, "rf_rise_and_fall_factor": rf[k],
+                                        "power_weight_ratio_pwr": pwr.get(vehicle)})
+            for name in VOC_COLUMNS:
+                assert columns[vehicle][name][k] == pytest.approx(record[name], rel=1e-12, abs=1e-12), \
+                    (vehicle, lane, rg[k], rf[k], name)
+            cases += 1
+    assert cases == 752
+    with pytest.raises(ValueError, match="Unknown vehicle type"):
+        compute_voc_arrays({"rg_roughness_factor": 2000, "fl_fall_factor": 0, "rs_rise_factor": 0,
+                            "lane_type": "2L"}, vehicle_types=["tractor"])
+
+
+# ✅ Test Hourly Congestion Against the Daily v/c Ratio
+@pytest.mark.unit
+def test_annual_adjusted_costs_flat_profile_matches_scalar():
+    checked = core.validated_copy(vehicle_input)
+    base = core.main(checked, wpi)
+    flat = np.ones(24)
+    annual = congestion_core.annual_adjusted_costs(base, checked, years=3, growth_rate=0.05, hourly_share=flat)
+    for year in range(3):
+        grown = {**checked, "vehicle_info": {vt: count * 1.05 ** year for vt, count in checked["vehicle_info"].items()}}
+        vc = float(congestion_core.volume_capacity_ratio(grown["vehicle_info"], grown["lane_type"]).mean())
+        scalar = congestion_core.calculate_total_adjusted_costs(base, vc, grown)
+        for key in ("distance_total", "time_total", "total"):
+            for basis in ("IT", "ET"):
+                assert annual[key][basis][year] == pytest.approx(scalar[key][basis] * congestion_core.DAYS_IN_YEAR)
+    # The default profile has peak hours, which only add congestion
+    peaked = calc_annual_voc(checked, wpi, years=1, cache=None)
+    assert peaked["total"]["ET"][0] >= annual["total"]["ET"][0]
+    assert calc_annual_voc(checked, wpi, years=1) == peaked
+
+
+# ✅ Test Annual VOC Served from the Shared Lookup Grid
+@pytest.mark.unit
+def test_calc_annual_voc_from_grid(tmp_path, monkeypatch):
+    monkeypatch.setenv(standards_store.CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(voc_main, "_voc_grids", {})
+    pwr = vehicle_input["power_weight_ratio_pwr"]
+    grid = voc_main.voc_grid(wpi, pwr)
+    assert voc_main.voc_grid(wpi, dict(pwr)) is grid and len(list(tmp_path.glob("voc_grid-*.npz"))) == 1
+    projection = {vt: np.array([1.0, 1.5, 2.0]) * count for vt, count in vehicle_input["vehicle_info"].items()}
+    runs = []
+    model = core.main
+    def counting(*args, **kwargs):
+        runs.append(args)
+        return model(*args, **kwargs)
+    monkeypatch.setattr(core, "main", counting)
+    for conditions in [{}, {"lane_type": "4L", "rg_roughness_factor": 3500, "rs_rise_factor": 10, "fl_fall_factor": 10}]:
+        inputs = {**vehicle_input, "vehicle_info": projection, **conditions}
+        expected = calc_annual_voc(inputs, wpi, years=3, cache=None)
+        actual = calc_annual_voc(inputs, wpi, years=3, cache=None, grid=grid)
+        for key in ("distance_total", "time_total", "total"):
+            for basis in ("IT", "ET"):
+                assert actual[key][basis] == pytest.approx(expected[key][basis], rel=1e-12), (conditions, key)
+    assert len(runs) == 2
+    # Roads the grid does not cover run the VOC models
+    calc_annual_voc({**vehicle_input, "power_weight_ratio_pwr": {"hcv": 8, "mcv": 8}}, wpi, cache=None, grid=grid)
+    calc_annual_voc({**vehicle_input, "rs_rise_factor": 10}, wpi, cache=None, grid=grid)
+    assert len(runs) == 4
+    with pytest.raises(Warning, match="MCV"):
+        calc_annual_voc({**vehicle_input, "lane_type": "SL"}, wpi, cache=None, grid=grid)
+
+
+# ✅ Test VOC Lookup Grid Nodes Against the VOC Models
+@pytest.mark.unit
+def test_voc_grid_nodes_match_main():
+    pwr = {"hcv": 7.22, "mcv": 8}
+    grid = VOCGrid.build([wpi], [1500.0, 2000.0, 4000.0], [0.0, 10.0, 60.0], pwr=pwr)
+    assert grid.values.shape == (len(COST_KEYS), len(grid.vehicles), len(grid.lanes), 1, 3, 3)
+    for l, lane in enumerate(grid.lanes):
+        # MCVs are not modelled on single and intermediate lanes
+        counts = {**vehicle_input["vehicle_info"], "mcv": 0} if lane in ("SL", "IL") else vehicle_input["vehicle_info"]
+        for i, rg in enumerate(grid.roughness):
+            for j, rf in enumerate(grid.rise_fall):
+                summary = core.main({**vehicle_input, "vehicle_info": counts, "lane_type": lane, "rg_roughness_factor": rg,
+                                     "rs_rise_factor": rf / 2, "fl_fall_factor": rf / 2, "power_weight_ratio_pwr": pwr}, wpi)
+                for v, vehicle in enumerate(grid.vehicles):
+                    if not counts[vehicle]:
+                        continue
+                    for k, key in enumerate(COST_KEYS):
+                        kind, basis = key.split("_")
+                        assert grid.values[k, v, l, 0, i, j] == pytest.approx(
+                            summary[f"{kind}Cost"][vehicle][basis], rel=1e-12), (lane, rg, rf, vehicle, key)
+                    assert grid.lookup(vehicle, lane, wpi["year"], rg, rf, basis="ET") == pytest.approx(
+                        summary["distanceCost"][vehicle]["ET"] + summary["timeCost"][vehicle]["ET"], rel=1e-12)
+
+
+# ✅ Test VOC Lookup Grid Interpolation
+@pytest.mark.unit
+def test_voc_grid_bilinear_interpolation():
+    roughness, rise_fall = np.array([1000.0, 2000.0, 4000.0]), np.array([0.0, 10.0])
+    values = np.zeros((len(COST_KEYS), 1, 1, 1, 3, 2))
+    # distance_IT = 3 + 0.01 RG + 2 RF + 0.001 RG RF, time_IT = 1
+    values[0, 0, 0, 0] = 3 + 0.01 * roughness[:, None] + 2 * rise_fall + 0.001 * roughness[:, None] * rise_fall
+    values[2, 0, 0, 0] = 1.0
+    grid = VOCGrid(values, ["small_cars"], ["2L"], [2024], roughness, rise_fall)
+    rg, rf = np.array([1000.0, 1500.0, 2500.0, 4000.0]), np.array([0.0, 2.5, 7.5, 10.0])
+    expected = 3 + 0.01 * rg + 2 * rf + 0.001 * rg * rf
+    assert grid.lookup("small_cars", "2L", 2024, rg, rf, component="distance") == pytest.approx(expected)
+    assert grid.lookup("small_cars", "2L", 2024, rg, rf) == pytest.approx(expected + 1)
+    assert isinstance(grid.lookup("small_cars", "2L", 2024, 1500.0, 2.5), float)
+    with pytest.raises(ValueError, match="roughness"):
+        grid.lookup("small_cars", "2L", 2024, 4500.0, 0.0)
+    with pytest.raises(ValueError, match="WPI year"):
+        grid.lookup("small_cars", "2L", 2025, 1500.0, 0.0)
+
+
+# ✅ Test VOC Lookup Grid Rebuilt When Its Axes Change
+@pytest.mark.unit
+def test_voc_grid_load_or_build(tmp_path, monkeypatch):
+    path = str(tmp_path / "voc_grid.npz")
+    builds = []
+    original = VOCGrid.build
+
+    def counting_build(*args, **kwargs):
+        builds.append(args)
+        return original(*args, **kwargs)
+    monkeypatch.setattr(VOCGrid, "build", counting_build)
+    options = {"lanes": ["2L"], "vehicles": ["small_cars", "hcv"], "pwr": {"hcv": 7.22}}
+    grid = VOCGrid.load_or_build(path, [wpi], [1500.0, 2000.0], [0.0, 10.0], **options)
+    again = VOCGrid.load_or_build(path, [wpi], [1500.0, 2000.0], [0.0, 10.0], **options)
+    assert len(builds) == 1 and np.array_equal(again.values, grid.values)
+    VOCGrid.load_or_build(path, [wpi], [1500.0, 2000.0, 3000.0], [0.0, 10.0], **options)
+    VOCGrid.load_or_build(path, [wpi], [1500.0, 2000.0, 3000.0], [0.0, 10.0], **{**options, "pwr": {"hcv": 8.0}})
+    VOCGrid.load_or_build(path, [wpi], [1500.0, 2000.0, 3000.0], [0.0, 10.0], **{**options, "pwr": {"hcv": 8.0},
+                                                                                  "rise_share": 0.25})
+    assert len(builds) == 4
+    assert VOCGrid.load(path).meta == {"expressway_width": None, "pwr": {"hcv": 8.0}, "rise_share": 0.25}
+
+
+# ✅ Test Compiled WPI Against the Nested Post-Processing
+@pytest.mark.unit
+def test_compiled_wpi_matches_baseline():
+    with open(BASELINE_POST_PROCESS, encoding="utf-8") as file:
+        baseline = json.load(file)
+    for case in baseline["cases"]:
+        vehicles = list(case["outputs"])
+        conditions = {key: case["input"][key] for key in core.SEGMENT_KEYS}
+        columns = compute_voc_arrays({**conditions, "power_weight_ratio_pwr": case["input"]["power_weight_ratio_pwr"]},
+                                     vehicle_types=vehicles)
+        for wpi_year, summary in zip(baseline["wpis"], case["summaries"]):
+            # The nested dictionaries still go through the original walk
+            assert_nested_close(pp.post_process(case["outputs"], wpi_year), summary)
+            totals = pp.post_process_arrays(columns, pp.compile_wpi(wpi_year))
+            for vehicle in vehicles:
+                for cost_type in ("distanceCost", "timeCost"):
+                    for basis in ("IT", "ET"):
+                        assert totals[vehicle][cost_type][basis] == pytest.approx(
+                            summary[cost_type][vehicle][basis], rel=1e-12)
+
+
+# ✅ Test WPI Resolver Compiles Each Year Once
+@pytest.mark.unit
+def test_wpi_resolver_compiles_once_per_year():
+    class Source:
+        calls = []
+
+        def getWPI(self, year):
+            self.calls.append(year)
+            return {**wpi, "year": year}
+    resolver = pp.WPIResolver(Source())
+    stack = resolver.matrices([2024, 2025, 2024])
+    assert stack.shape == (3, len(pp.WPI_CATEGORIES), len(pp.vehicle_type_list))
+    assert Source.calls == [2024, 2025]
+    assert np.array_equal(stack[0], pp.compile_wpi(wpi))
+    broken = {"year": 2024, "WPI": {**wpi["WPI"], "fuelCost": {}}}
+    with pytest.raises(ValueError, match="Petrol"):
+        pp.compile_wpi(broken)
+
+
+# ✅ Test VOC Records Against the Nested Model Output
+@pytest.mark.unit
+def test_voc_records_match_baseline():
+    with open(BASELINE_POST_PROCESS, encoding="utf-8") as file:
+        baseline = json.load(file)
+    for case in baseline["cases"]:
+        records = core.run_vehicle_models(core.validated_copy(case["input"]))
+        assert set(records) == set(case["outputs"])
+        for vehicle, record in records.items():
+            assert_nested_close(record.to_dict(), case["outputs"][vehicle], vehicle)
+        for wpi_year, summary in zip(baseline["wpis"], case["summaries"]):
+            assert_nested_close(pp.post_process(records, wpi_year), summary)
+            assert_nested_close(core.main(case["input"], wpi_year), summary)